@@ -11,17 +11,57 @@ class A2ML(object):
     def import_data(self):
         self.runner.execute('import_data')
 
+    def import_frame(self, data, data_set_name=None, columns=None):
+        return self.runner.execute(
+            'import_frame', data, data_set_name, columns)
+
     def train(self):
         self.runner.execute('train')
 
-    def evaluate(self):
-        self.runner.execute('evaluate')
+    def train_grid(self, spec_file, output=None):
+        return self.runner.execute('train_grid', spec_file, output)
+
+    def evaluate(self, watch=False):
+        if watch:
+            # only providers supporting watch mode
+            self.runner.execute('evaluate_watch')
+        else:
+            self.runner.execute('evaluate')
+
+    def deploy(self, model_id, locally=False, wait=True):
+        return self.runner.execute('deploy', model_id, locally, wait)
+
+    def deploy_status(self, wait=False, prune=False):
+        return self.runner.execute('deploy_status', wait, prune)
+
+    def predict(self, filename, model_id, threshold=None, locally=False,
+        race=False, hedge_delay=None):
+        if race:
+            return self.runner.race('predict',
+                filename, model_id, threshold, locally,
+                hedge_delay=hedge_delay)
+        return self.runner.execute(
+            'predict', filename, model_id, threshold, locally)
+
+    def predict_watch(self, directory, model_id, threshold=None,
+        locally=False, interval=None):
+        return self.runner.execute('predict_watch',
+            directory, model_id, threshold, locally, interval)
+
+    def predict_frame(self, data, model_id, threshold=None, locally=False):
+        return self.runner.execute(
+            'predict_frame', data, model_id, threshold, locally)
+
+    def loadtest(self, model_id, rps=None, concurrency=4, duration=60,
+        batch_size=10, stand_in=False):
+        return self.runner.execute('loadtest', model_id, rps,
+            concurrency, duration, batch_size, stand_in)
 
-    def deploy(self, model_id, locally=False):
-        self.runner.execute('deploy', model_id, locally)
+    def lease(self, hours=None, release=False):
+        return self.runner.execute('lease', hours, release)
 
-    def predict(self, filename, model_id, threshold=None, locally=False):
-        self.runner.execute('predict', filename, model_id, threshold, locally)
+    def export(self, session_ids=None, output=None):
+        return self.runner.execute('export', session_ids, output)
 
     def review(self):
         self.runner.execute('review')
@@ -1,7 +1,11 @@
 from a2ml.api.auger.train import AugerTrain
+from a2ml.api.auger.train_grid import AugerTrainGrid
 from a2ml.api.auger.deploy import AugerDeploy
 from a2ml.api.auger.predict import AugerPredict
 from a2ml.api.auger.evaluate import AugerEvaluate
+from a2ml.api.auger.lease import AugerLease
+from a2ml.api.auger.export import AugerExport
+from a2ml.api.auger.loadtest import AugerLoadTest
 from a2ml.api.auger.import_data import AugerImport
 
 
@@ -15,17 +19,51 @@ class AugerA2ML(object):
     def import_data(self):
         AugerImport(self.ctx).import_data()
 
+    def import_frame(self, data, data_set_name=None, columns=None):
+        return AugerImport(self.ctx).import_frame(
+            data, data_set_name, columns)
+
     def train(self):
         AugerTrain(self.ctx).train()
 
+    def train_grid(self, spec_file, output=None):
+        return AugerTrainGrid(self.ctx).train_grid(spec_file, output)
+
     def evaluate(self):
         AugerEvaluate(self.ctx).evaluate()
 
-    def deploy(self, model_id, locally=False):
-        AugerDeploy(self.ctx).deploy(model_id, locally)
+    def evaluate_watch(self):
+        AugerEvaluate(self.ctx).evaluate(watch=True)
+
+    def deploy(self, model_id, locally=False, wait=True):
+        return AugerDeploy(self.ctx).deploy(model_id, locally, wait)
+
+    def deploy_status(self, wait=False, prune=False):
+        return AugerDeploy(self.ctx).deploy_status(wait, prune)
 
     def predict(self, filename, model_id, threshold=None, locally=False):
-        AugerPredict(self.ctx).predict(filename, model_id, threshold, locally)
+        return AugerPredict(self.ctx).predict(
+            filename, model_id, threshold, locally)
+
+    def predict_watch(self, directory, model_id, threshold=None,
+        locally=False, interval=None):
+        return AugerPredict(self.ctx).watch(
+            directory, model_id, threshold, locally, interval)
+
+    def predict_frame(self, data, model_id, threshold=None, locally=False):
+        return AugerPredict(self.ctx).predict_frame(
+            data, model_id, threshold, locally)
+
+    def loadtest(self, model_id, rps=None, concurrency=4, duration=60,
+        batch_size=10, stand_in=False):
+        return AugerLoadTest(self.ctx).loadtest(model_id, rps,
+            concurrency, duration, batch_size, stand_in)
+
+    def lease(self, hours=None, release=False):
+        return AugerLease(self.ctx).lease(hours, release)
+
+    def export(self, session_ids=None, output=None):
+        return AugerExport(self.ctx).export(session_ids, output)
 
     def review(self):
         pass
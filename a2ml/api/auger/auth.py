@@ -2,6 +2,7 @@ import sys
 
 from a2ml.api.auger.cloud.auth import AugerAuthApi
 from a2ml.api.auger.credentials import Credentials
+from a2ml.api.auger.session_cache import AugerSessionCache
 from a2ml.api.auger.cloud.utils.exception import AugerException
 
 class AugerAuth(object):
@@ -26,6 +27,7 @@ class AugerAuth(object):
             self.credentials.api_url = url
             self.credentials.organisation = organisation
             self.credentials.save()
+            AugerSessionCache.clear(self.credentials)
 
             self.ctx.log(
                 'You are now logged in on %s as %s.' % (url, username))
@@ -44,6 +46,7 @@ class AugerAuth(object):
             self.credentials.api_url = None
             self.credentials.organisation = None
             self.credentials.save()
+            AugerSessionCache.clear(self.credentials)
             self.ctx.log('You are loged out of Auger.')
 
     def whoami(self):
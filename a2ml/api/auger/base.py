@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from a2ml.api.auger.cloud.rest_api import RestApi
 from a2ml.api.auger.credentials import Credentials
+from a2ml.api.auger.session_cache import AugerSessionCache
 from a2ml.api.auger.cloud.project import AugerProjectApi
+from a2ml.api.auger.cloud.data_set import AugerDataSetApi
 from a2ml.api.auger.cloud.org import AugerOrganizationApi
 
 
@@ -13,12 +17,63 @@ class AugerBase(object):
         self.credentials = Credentials(ctx).load()
         self.ctx.rest_api = RestApi(
             self.credentials.api_url, self.credentials.token)
+        self.session_cache = AugerSessionCache(ctx, self.credentials)
+        self.project_starting = None
+
+    def start_project(self, wait=True, auto_size=True):
+        """Start Project cluster.
 
-    def start_project(self):
+        With wait=False cluster is provisioned in background,
+        use wait_for_project() before steps which need running cluster.
+        With auto_size=False cluster/auto_size is not applied, when DataSet
+        in auger.yaml is not the one cluster will work with."""
         self._ensure_org_and_project()
-        if not self.project_api.is_running():
+
+        # project status is checked again if cached one is outdated
+        session = self.session_cache.get() or {}
+        if session.get('project_status') == 'running':
+            return
+
+        if self.project_api.is_running():
+            self.session_cache.update(project_status='running')
+        else:
             self.ctx.log('Starting Project to process request...')
-            self.project_api.start()
+            if wait:
+                self._start_project(auto_size)
+            else:
+                executor = ThreadPoolExecutor(max_workers=1)
+                self.project_starting = executor.submit(
+                    self._start_project, auto_size)
+                executor.shutdown(wait=False)
+
+    def wait_for_project(self):
+        if self.project_starting is not None:
+            # raises exception if Project failed to start
+            self.project_starting.result()
+            self.project_starting = None
+
+    def _start_project(self, auto_size=True):
+        self.project_api.start(
+            self._get_data_set_stats() if auto_size else None)
+        self.session_cache.update(project_status='running')
+
+    def _get_data_set_stats(self):
+        # DataSet statistics are used to size cluster
+        config = self.ctx.get_config('auger')
+        data_set_name = config.get('dataset')
+        if not config.get('cluster/auto_size', False):
+            return None
+        if data_set_name is None:
+            self.ctx.log('Cluster auto size needs DataSet, using defaults')
+            return None
+
+        data_set_properties = AugerDataSetApi(
+            self.ctx, self.project_api, data_set_name).properties()
+        if data_set_properties is None:
+            self.ctx.log('Can\'t find DataSet %s to auto size cluster, '
+                'using defaults' % data_set_name)
+            return None
+        return data_set_properties.get('statistics')
 
     def _ensure_org_and_project(self):
         """Ensure there are org and project to work with"""
@@ -28,17 +83,26 @@ class AugerBase(object):
             raise Exception(
                 'Please specify your organization...')
 
+        project_name = self.ctx.config['auger'].get('project', None)
+        if project_name is None:
+            raise Exception(
+                'Please specify your project in auger.yaml/project...')
+
+        session = self.session_cache.get()
+        if session is not None:
+            self.org_api = AugerOrganizationApi(
+                self.ctx, org_name, session['org_id'])
+            self.org_api.cluster_mode = session['cluster_mode']
+            self.project_api = AugerProjectApi(
+                self.ctx, self.org_api, project_name, session['project_id'])
+            return
+
         self.org_api = AugerOrganizationApi(self.ctx, org_name)
         org_properties = self.org_api.properties()
         if org_properties is None:
             raise Exception('Can\'t find organization %s' % org_name)
         self.org_api.cluster_mode = org_properties.get('cluster_mode')
 
-        project_name = self.ctx.config['auger'].get('project', None)
-        if project_name is None:
-            raise Exception(
-                'Please specify your project in auger.yaml/project...')
-
         self.project_api = AugerProjectApi(
             self.ctx, self.org_api, project_name)
         project_properties = self.project_api.properties()
@@ -48,12 +112,19 @@ class AugerBase(object):
                 ' Creating...' % project_name)
             self.project_api.create()
 
+        self.session_cache.update(
+            org_id=self.org_api.object_id,
+            cluster_mode=self.org_api.cluster_mode,
+            project_id=self.project_api.object_id)
+
     @classmethod
     def _error_handler(cls, decorated):
         def wrapper(self, *args, **kwargs):
             try:
                 return decorated(self, *args, **kwargs)
             except Exception as exc:
+                # cached session could be the reason of failure
+                self.session_cache.invalidate()
                 # TODO refactor into reusable exception handler
                 # with comprehensible user output
                 if self.ctx.debug:
@@ -1,6 +1,17 @@
+import math
+
 from a2ml.api.auger.cloud.base import AugerBaseApi
 from a2ml.api.auger.cloud.utils.exception import AugerException
 
+# rough trial cost used to size cluster:
+# data cells processed by one worker per minute of trial
+CELLS_PER_TRIAL_MINUTE = 5 * 1000 * 1000
+MIN_TRIAL_MINUTES = 0.1
+# data larger than this needs high memory workers
+HIGH_MEMORY_CELLS = 50 * 1000 * 1000
+MIN_AUTO_WORKERS = 2
+MAX_AUTO_WORKERS = 10
+
 
 class AugerClusterApi(AugerBaseApi):
     """Auger Cluster API."""
@@ -15,16 +26,20 @@ class AugerClusterApi(AugerBaseApi):
             return False
         return self.properties().get('status') == 'running'
 
-    def create(self):
+    def create(self, data_set_stats=None):
         params = {
             'project_id': self.parent_api.object_id,
             'organization_id': self.parent_api.parent_api.object_id}
-        params.update(self.get_cluster_settings(self.ctx))
+        params.update(self.get_cluster_settings(self.ctx, data_set_stats))
         return self._call_create(params,
             ['waiting', 'provisioning', 'bootstrapping'])
 
     @staticmethod
-    def get_cluster_settings(ctx):
+    def get_cluster_settings(ctx, data_set_stats=None):
+        """Cluster settings from auger.yaml.
+
+        With cluster/auto_size and DataSet statistics
+        number and type of workers are selected by data size."""
         config = ctx.get_config('auger')
 
         default_stack = "stable"
@@ -69,4 +84,64 @@ class AugerClusterApi(AugerBaseApi):
             if workers_per_node_count is not None:
                 settings["workers_per_node_count"] = workers_per_node_count
 
+        if config.get('cluster/auto_size', False) and data_set_stats:
+            settings.update(AugerClusterApi._auto_size(ctx, data_set_stats,
+                is_multi_tenant=cluster_type is not None))
+
+        return settings
+
+    @staticmethod
+    def _auto_size(ctx, data_set_stats, is_multi_tenant):
+        config = ctx.get_config('auger')
+        rows = data_set_stats.get('count')
+        if rows is None:
+            ctx.log('Cluster auto size: DataSet rows count is unknown, '
+                'using cluster settings')
+            return {}
+        columns = data_set_stats.get('columns_count') or \
+            len(data_set_stats.get('stat_data') or [])
+
+        workers, worker_type, reasons = AugerClusterApi.auto_size(
+            rows, columns,
+            config.get('experiment/max_n_trials', 1000),
+            config.get('experiment/max_total_time', 60),
+            config.get('cluster/auto_size_max_workers', MAX_AUTO_WORKERS))
+        ctx.log('Cluster auto size: %s %s workers (%s)' % \
+            (workers, worker_type, '; '.join(reasons)))
+
+        if is_multi_tenant:
+            return {
+                "worker_type_id": 1 if worker_type == 'standard' else 2,
+                "workers_count": workers}
+
+        settings = {"worker_nodes_count": workers}
+        if worker_type == 'high_memory':
+            settings["instance_type"] = config.get(
+                'cluster/high_memory_instance_type', 'r5.large')
         return settings
+
+    @staticmethod
+    def auto_size(rows, columns, max_n_trials, max_total_time, max_workers):
+        """Returns number of workers, worker type and reasons of choice."""
+        cells = rows * columns
+        reasons = ['%s rows x %s columns' % (rows, columns)]
+
+        if cells > HIGH_MEMORY_CELLS:
+            worker_type = 'high_memory'
+            reasons.append('data is larger than %s cells' % HIGH_MEMORY_CELLS)
+        else:
+            worker_type = 'standard'
+
+        trial_minutes = max(
+            MIN_TRIAL_MINUTES, float(cells) / CELLS_PER_TRIAL_MINUTE)
+        needed = int(math.ceil(
+            max_n_trials * trial_minutes / max(max_total_time, 1)))
+        workers = min(max(needed, MIN_AUTO_WORKERS), max_workers)
+        reasons.append(
+            '%s trials of ~%.1f min in %s min need %s workers' % \
+            (max_n_trials, trial_minutes, max_total_time, needed))
+        if workers != needed:
+            reasons.append('limited to %s..%s workers' % \
+                (MIN_AUTO_WORKERS, max_workers))
+
+        return workers, worker_type, reasons
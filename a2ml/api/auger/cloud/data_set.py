@@ -1,15 +1,37 @@
 import os
 import time
 import requests
+import tempfile
 import shortuuid
 import urllib.parse
 import xml.etree.ElementTree as ET
+from requests_toolbelt import MultipartEncoder
 
 from a2ml.api.auger.cloud.cluster import AugerClusterApi
+from a2ml.api.auger.cloud.utils.csv_stream import CsvStream
 from a2ml.api.auger.cloud.utils.exception import AugerException
 from a2ml.api.auger.cloud.project_file import AugerProjectFileApi
 
 SUPPORTED_FORMATS = ['.csv', '.arff']
+SPOOL_SIZE = 64 * 1024 * 1024
+
+
+class SizedReader(object):
+    """Read file which length is known in advance.
+
+    MultipartEncoder gets length of file objects with fileno(), which
+    makes SpooledTemporaryFile roll over to disk. Encoder uses len
+    of the unread part instead, so spooled file stays in memory."""
+
+    def __init__(self, f, size):
+        super(SizedReader, self).__init__()
+        self.f = f
+        self.len = size
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.len -= len(data)
+        return data
 
 
 class AugerDataSetApi(AugerProjectFileApi):
@@ -20,12 +42,17 @@ class AugerDataSetApi(AugerProjectFileApi):
         super(AugerDataSetApi, self).__init__(
             ctx, project_api, data_set_name, data_set_id)
 
-    def create(self, data_source_file, data_set_name=None):
+    def create(self, data_source_file, data_set_name=None,
+        wait_for_project=None):
+        # wait_for_project is called before steps
+        # which need running Project cluster
+        wait_for_project = wait_for_project or (lambda: None)
         data_source_file, local_data_source = \
             AugerDataSetApi.verify(data_source_file)
 
         if local_data_source:
-            file_url = self._upload_to_cloud(data_source_file)
+            file_url = self._upload_to_cloud(
+                data_source_file, wait_for_project=wait_for_project)
             file_name = os.path.basename(data_source_file)
             if data_set_name:
                 self.object_name = data_set_name
@@ -37,6 +64,7 @@ class AugerDataSetApi(AugerProjectFileApi):
             file_name = os.path.basename(url_path)
             self.object_name = file_name
 
+        wait_for_project()
         try:
             return super().create(file_url, file_name)
         except Exception as exc:
@@ -45,6 +73,21 @@ class AugerDataSetApi(AugerProjectFileApi):
                     'DataSet already exists for %s' % file_url)
             raise exc
 
+    def create_from_stream(self, stream, data_set_name=None,
+        wait_for_project=None):
+        wait_for_project = wait_for_project or (lambda: None)
+        if data_set_name:
+            self.object_name = data_set_name
+        else:
+            self.object_name = self._get_uniq_object_name(
+                'DataSet', stream.extension)
+        file_name = '%s%s' % (
+            os.path.splitext(self.object_name)[0], stream.extension)
+
+        file_url = self._upload_to_cloud(stream, file_name, wait_for_project)
+        wait_for_project()
+        return super().create(file_url, file_name)
+
     def _get_readable_name(self):
         # patch readable name
         return 'DataSet'
@@ -69,12 +112,19 @@ class AugerDataSetApi(AugerProjectFileApi):
 
         return data_source_file, True
 
-    def _upload_to_cloud(self, file_to_upload):
+    def _upload_to_cloud(self, file_to_upload, file_name=None,
+        wait_for_project=None):
+        # file to upload could be local file name or CsvStream,
+        # stream should be uploaded with the file name
         cluster_mode = self.parent_api.parent_api.get_cluster_mode()
         if cluster_mode == 'single_tenant':
+            # file uploader service runs on the cluster
+            if wait_for_project:
+                wait_for_project()
             return self._upload_to_single_tenant(file_to_upload)
         else:
-            return self._upload_to_multi_tenant(file_to_upload)
+            return self._upload_to_multi_tenant(
+                file_to_upload, file_name or os.path.basename(file_to_upload))
 
     def _upload_to_single_tenant(self, file_to_upload):
         # get file_uploader_service from the cluster
@@ -96,8 +146,12 @@ class AugerDataSetApi(AugerProjectFileApi):
         return file_url
 
     def _upload_file(self, file_name, url):
-        with open(file_name, 'rb') as f:
-            r = requests.post(url, data=f)
+        if isinstance(file_name, CsvStream):
+            # generator is sent with chunked transfer encoding
+            r = requests.post(url, data=iter(file_name))
+        else:
+            with open(file_name, 'rb') as f:
+                r = requests.post(url, data=f)
 
         if r.status_code == 200:
             rp = urllib.parse.parse_qs(r.text)
@@ -106,10 +160,9 @@ class AugerDataSetApi(AugerProjectFileApi):
             raise AugerException(
                 'HTTP error [%s] while uploading file to Auger Cloud...' % r.status_code)
 
-    def _upload_to_multi_tenant(self, file_to_upload):
+    def _upload_to_multi_tenant(self, file_to_upload, file_name):
         file_path = 'workspace/projects/%s/files/%s-%s' % \
-            (self.parent_api.object_name, shortuuid.uuid(),
-             os.path.basename(file_to_upload))
+            (self.parent_api.object_name, shortuuid.uuid(), file_name)
 
         res = self.rest_api.call('create_project_file_url', {
             'project_id': self.parent_api.object_id,
@@ -119,9 +172,16 @@ class AugerDataSetApi(AugerProjectFileApi):
                 'Error while uploading file to Auger Cloud...')
 
         url = res['url']
-        with open(file_to_upload, 'rb') as f:
-            files = {'file': (file_path, f)}
-            res = requests.post(url, data=res['fields'], files=files)
+        if isinstance(file_to_upload, CsvStream):
+            # S3 POST needs content length, so compressed stream
+            # is buffered in memory and spilled to disk if it's large
+            with tempfile.SpooledTemporaryFile(SPOOL_SIZE) as f:
+                file_to_upload.write_to(f)
+                res = self._post_multipart(url, res['fields'], file_path,
+                    SizedReader(f, file_to_upload.size))
+        else:
+            with open(file_to_upload, 'rb') as f:
+                res = self._post_multipart(url, res['fields'], file_path, f)
 
         if res.status_code == 201 or res.status_code == 200:
             bucket = urllib.parse.urlparse(url).netloc.split('.')[0]
@@ -131,6 +191,15 @@ class AugerDataSetApi(AugerProjectFileApi):
                 'HTTP error [%s] while uploading file'
                     ' to Auger Cloud...' % res.status_code)
 
+    @staticmethod
+    def _post_multipart(url, fields, file_path, f):
+        # encoder reads file while sending instead of loading it in memory
+        fields = dict(fields)
+        fields['file'] = (file_path, f)
+        encoder = MultipartEncoder(fields=fields)
+        return requests.post(url, data=encoder,
+            headers={'Content-Type': encoder.content_type})
+
     def _get_data_set_name(self, file_name):
         fname, fext = os.path.splitext(file_name)
         return self._get_uniq_object_name(fname, fext)
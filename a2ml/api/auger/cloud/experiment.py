@@ -1,9 +1,20 @@
+import os
+
+from auger.hub_api_client import HubApiClient
+from a2ml.api.auger.credentials import Credentials
 from a2ml.api.auger.cloud.base import AugerBaseApi
 from a2ml.api.auger.cloud.data_set import AugerDataSetApi
 from a2ml.api.auger.cloud.utils.exception import AugerException
+from a2ml.api.auger.cloud.utils.file_cache import FileCache
 from a2ml.api.auger.cloud.experiment_session import AugerExperimentSessionApi
+from a2ml.api.auger.cloud.warm_start_request import AugerWarmStartRequestApi
 
 MODEL_TYPES = ['classification', 'regression', 'timeseries']
+# auger.yaml/experiment options used in session settings
+EXPERIMENT_OPTIONS = ['label_encoded', 'cross_validation_folds',
+    'max_total_time', 'max_eval_time', 'max_n_trials', 'use_ensemble',
+    'metric', 'time_series']
+
 
 class AugerExperimentApi(AugerBaseApi):
     """Auger Experiment Api."""
@@ -15,14 +26,26 @@ class AugerExperimentApi(AugerBaseApi):
         assert project_api is not None, 'Project must be set for Experiment'
         self._set_api_request_path('AugerExperimentApi')
 
-    def run(self):
+    def run(self, overrides=None):
         experiment_session_api = \
             AugerExperimentSessionApi(self.ctx, self)
         experimeny_session_properties = \
-            experiment_session_api.create()
+            experiment_session_api.create(overrides)
+        if self.ctx.get_config('auger').get(
+            'experiment/warm_start/enabled', False):
+            self._warm_start(experiment_session_api)
         experiment_session_api.run()
         return experimeny_session_properties.get('id')
 
+    def _warm_start(self, experiment_session_api):
+        # Auger Cloud seeds search with best trials of previous sessions
+        # and similar trials, session is trained from scratch if request
+        # is rejected
+        try:
+            AugerWarmStartRequestApi(self.ctx, experiment_session_api).create()
+        except (AugerException, HubApiClient.BaseError) as e:
+            self.ctx.log('Can\'t warm start Experiment Session: %s' % str(e))
+
     def create(self, data_set_name):
         assert data_set_name is not None, \
             'DataSet Name is required to create Experiment'
@@ -40,17 +63,42 @@ class AugerExperimentApi(AugerBaseApi):
             'project_id': self.parent_api.object_id,
             'data_path': data_set_properties.get('url')})
 
-    def get_experiment_settings(self):
+    def get_experiment_settings(self, overrides=None):
+        """Session settings from config.yaml and auger.yaml/experiment.
+
+        Overrides could replace target, model_type, exclude
+        and any of auger.yaml/experiment options."""
+        overrides = overrides or {}
         config = self.ctx.get_config('config')
         auger_config = self.ctx.get_config('auger')
 
-        model_type = config.get('model_type', '')
+        def get_option(name, default=None):
+            if name in overrides:
+                return overrides[name]
+            return auger_config.get('experiment/%s' % name, default)
+
+        model_type = overrides.get('model_type', config.get('model_type', ''))
         if not model_type in MODEL_TYPES:
             raise AugerException('Model type should be %s' % \
                 '|'.join(MODEL_TYPES))
-        target = config.get('target', '')
-        exclude = config.get('exclude', [])
+        target = overrides.get('target', config.get('target', ''))
+        exclude = overrides.get('exclude', config.get('exclude', []))
+
+        # options derived from DataSet statistics are cached
+        # by DataSet and all settings they depend on
+        settings_key = FileCache.hash([model_type, target, exclude] +
+            [get_option(name) for name in EXPERIMENT_OPTIONS])
+        data_set_id = self._get_project_file_id()
+        cache_key = 'settings-%s-%s' % (data_set_id, settings_key)
+        options = self.cache.get(cache_key)
+        if options is None:
+            options = self.cache.set(cache_key, self._get_options(
+                data_set_id, model_type, target, exclude, get_option))
 
+        return {'evaluation_options': options}, model_type
+
+    def _get_options(self, data_set_id, model_type, target, exclude,
+        get_option):
         options = {
             'targetFeature': None,
             'featureColumns': [],
@@ -58,30 +106,25 @@ class AugerExperimentApi(AugerBaseApi):
             'timeSeriesFeatures': [],
             'binaryClassification': False,
             'labelEncodingFeatures':
-                auger_config.get('experiment/label_encoded', []),
+                get_option('label_encoded', []),
             'crossValidationFolds':
-                auger_config.get('experiment/cross_validation_folds', 5),
+                get_option('cross_validation_folds', 5),
             'max_total_time_mins':
-                auger_config.get('experiment/max_total_time', 60),
+                get_option('max_total_time', 60),
             'max_eval_time_mins':
-                auger_config.get('experiment/max_eval_time', 1),
+                get_option('max_eval_time', 1),
             'max_n_trials':
-                auger_config.get('experiment/max_n_trials', 1000),
+                get_option('max_n_trials', 1000),
             'use_ensemble':
-                auger_config.get('experiment/use_ensemble', True),
+                get_option('use_ensemble', True),
             'classification':
                 True if model_type == 'classification' else False,
             'scoring':
-                auger_config.get('experiment/metric',
+                get_option('metric',
                     'f1_macro' if model_type == 'classification' else 'r2')
         }
 
-        data_set_id = self.properties()['project_file_id']
-        data_set_api = AugerDataSetApi(
-            self.ctx, self.parent_api, None, data_set_id)
-        data_set_properties = data_set_api.properties()
-        stats = data_set_properties['statistics']
-
+        stats = self._get_data_set_statistics(data_set_id)
         self._fill_data_options(options, stats, target, exclude)
 
         if options['targetFeature'] is None:
@@ -90,7 +133,7 @@ class AugerExperimentApi(AugerBaseApi):
         if model_type is not 'timeseries':
             options['timeSeriesFeatures'] = []
         else:
-            time_series = auger_config.get('experiment/time_series', None)
+            time_series = get_option('time_series', None)
             if time_series:
                 options['timeSeriesFeatures'] = [time_series]
             if len(options['timeSeriesFeatures']) != 1:
@@ -98,7 +141,34 @@ class AugerExperimentApi(AugerBaseApi):
                     ' to build time series model'
                     ' (experiment/time_series option).')
 
-        return {'evaluation_options': options}, model_type
+        return options
+
+    @property
+    def cache(self):
+        # ids are unique per Auger url only
+        return FileCache(os.path.join(Credentials(self.ctx).creds_path,
+            'cache', FileCache.hash(self.rest_api.api_url)[:16]))
+
+    def _get_project_file_id(self):
+        # experiment DataSet never changes
+        cache_key = 'experiment-%s' % self.oid
+        data_set_id = self.cache.get(cache_key)
+        if data_set_id is None:
+            data_set_id = self.cache.set(
+                cache_key, self.properties()['project_file_id'])
+        return data_set_id
+
+    def _get_data_set_statistics(self, data_set_id):
+        cache_key = 'statistics-%s' % data_set_id
+        stats = self.cache.get(cache_key)
+        if stats is None:
+            data_set_api = AugerDataSetApi(
+                self.ctx, self.parent_api, None, data_set_id)
+            stats = data_set_api.properties()['statistics']
+            # statistics are final once DataSet is processed
+            if stats.get('stat_data'):
+                self.cache.set(cache_key, stats)
+        return stats
 
     def _fill_data_options(self, options, stats, target, exclude):
         for item in stats.get('stat_data'):
@@ -1,5 +1,9 @@
 from a2ml.api.auger.cloud.base import AugerBaseApi
 from a2ml.api.auger.cloud.trial import AugerTrialApi
+from a2ml.api.auger.cloud.utils.leaderboard import Leaderboard, TOP_K
+
+# rest api reads list in pages up to this number of items
+TRIALS_LIMIT = 1000 * 1000
 
 
 class AugerExperimentSessionApi(AugerBaseApi):
@@ -34,25 +38,31 @@ class AugerExperimentSessionApi(AugerBaseApi):
                 raise e
         return False
 
-    def create(self):
+    def create(self, overrides=None):
         evaluation_options, model_type = \
-            self.parent_api.get_experiment_settings()
+            self.parent_api.get_experiment_settings(overrides)
         return self._call_create({
             'experiment_id': self.parent_api.object_id,
             'model_settings': evaluation_options,
             'model_type': model_type})
 
-    def get_leaderboard(self):
+    def get_leaderboard(self, top_n=None, cache_file=None):
+        """Best trials of the session, best first.
+
+        With cache_file only trials newer than cached ones are fetched."""
+        leaderboard = Leaderboard.load(cache_file) if cache_file else None
+        if leaderboard is None or leaderboard.size < (top_n or 0):
+            leaderboard = Leaderboard(max(top_n or 0, TOP_K))
+
+        self.update_leaderboard(leaderboard)
+        if cache_file:
+            leaderboard.save(cache_file)
+
+        return leaderboard.top(top_n)
+
+    def update_leaderboard(self, leaderboard):
+        """Add trials newer than already seen ones to leaderboard."""
         trial_api = AugerTrialApi(self.ctx, self)
-        leaderboard, score_name = [], None
-        for item in iter(trial_api.list()):
-            score_name = item.get('score_name')
-            leaderboard.append({
-                'model id': item.get('id'),
-                item.get('score_name'):\
-                    '{0:.4f}'.format(item.get('score_value')),
-                'algorithm': item.get('hyperparameter').\
-                    get('algorithm_name').split('.')[-1]})
-        # if score_name:
-        #     leaderboard.sort(key=lambda t: t[score_name], reverse=False)
-        return leaderboard[::-1]
+        leaderboard.add(trial_api.list(
+            {'offset': leaderboard.count, 'limit': TRIALS_LIMIT}))
+        return leaderboard
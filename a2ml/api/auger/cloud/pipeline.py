@@ -1,8 +1,13 @@
+import time
+
 from a2ml.api.auger.cloud.base import AugerBaseApi
 from a2ml.api.auger.cloud.prediction import AugerPredictionApi
 from a2ml.api.auger.cloud.utils.exception import AugerException
 
 
+PIPELINE_PROGRESS = ['creating_files', 'packaging', 'deploying']
+
+
 class AugerPipelineApi(AugerBaseApi):
     """Auger Pipeline API."""
 
@@ -10,11 +15,17 @@ class AugerPipelineApi(AugerBaseApi):
         super(AugerPipelineApi, self).__init__(
             ctx, experiment_api, None, pipeline_id)
 
-    def create(self, trial_id):
+    def create(self, trial_id, wait=True):
         return self._call_create({'trial_id': trial_id},
-            ['creating_files', 'packaging', 'deploying'])
+            PIPELINE_PROGRESS if wait else None)
+
+    def is_pending(self):
+        return self.status() in PIPELINE_PROGRESS
 
-    def predict(self, records, features, threshold=None):
+    def wait_ready(self):
+        return self.wait_for_status(PIPELINE_PROGRESS)
+
+    def check_ready(self):
         if self.object_id is None:
             raise AugerException('Please provide Auger Pipeline id')
 
@@ -22,8 +33,30 @@ class AugerPipelineApi(AugerBaseApi):
             raise AugerException(
                 "Pipeline %s is not ready or has issues..." % self.object_id)
 
+    def predict(self, records, features, threshold=None, check_status=True):
+        if check_status:
+            self.check_ready()
+        elif self.object_id is None:
+            raise AugerException('Please provide Auger Pipeline id')
+
         prediction_api = AugerPredictionApi(self.ctx, self)
         prediction_properties = \
             prediction_api.create(records, features, threshold)
 
         return prediction_properties.get('result')
+
+    def warmup(self, df, max_latency, max_requests):
+        """Send synthetic predictions until one is faster than max_latency.
+
+        Returns True if pipeline is warm."""
+        records = df.values.tolist()
+        features = df.columns.tolist()
+        for request in range(max_requests):
+            started = time.time()
+            self.predict(records, features, check_status=(request == 0))
+            latency = time.time() - started
+            self.ctx.log('Warmup prediction %s took %.2fs' % \
+                (request + 1, latency))
+            if latency <= max_latency:
+                return True
+        return False
@@ -1,8 +1,8 @@
 import os
 import urllib.parse
-import urllib.request
 
 from a2ml.api.auger.cloud.base import AugerBaseApi
+from a2ml.api.auger.cloud.utils.downloader import Downloader
 from a2ml.api.auger.cloud.utils.exception import AugerException
 
 
@@ -26,9 +26,10 @@ class AugerPipelineFileApi(AugerBaseApi):
         basename = os.path.basename(
             urllib.parse.urlparse(url).path).replace('export_','model-')
         file_name = os.path.join(path_to_download, basename)
-        urllib.request.urlretrieve(url, file_name)
+        workers = self.ctx.get_config('auger').get(
+            'local_models/download_workers', 4)
 
-        return file_name
+        return Downloader(self.ctx, workers).download(url, file_name)
 
     def _get_status_name(self):
         return 's3_model_path_status'
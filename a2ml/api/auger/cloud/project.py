@@ -19,7 +19,7 @@ class AugerProjectApi(AugerBaseApi):
         return self._call_create({
             'name': self.object_name, 'organization_id': self.parent_api.oid})
 
-    def start(self):
+    def start(self, data_set_stats=None):
         self._ensure_object_id()
         project_properties = self.properties()
 
@@ -35,13 +35,12 @@ class AugerProjectApi(AugerBaseApi):
 
         if self.parent_api.get_cluster_mode() == 'single_tenant':
             if not cluster_api.is_running():
-                cluster_api.create()
+                cluster_api.create(data_set_stats)
         else:
-            cluster_settings = cluster_api.get_cluster_settings(self.ctx)
-            self.rest_api.call('update_project', {
-                'id': self.object_id,
-                'cluster_autoterminate_minutes':
-                    cluster_settings.get('autoterminate_minutes')})
+            cluster_settings = cluster_api.get_cluster_settings(
+                self.ctx, data_set_stats)
+            self.set_autoterminate(
+                cluster_settings.get('autoterminate_minutes'))
             self.rest_api.call('deploy_project', {
                 'id': self.object_id,
                 'worker_type_id': cluster_settings.get('worker_type_id'),
@@ -50,6 +49,10 @@ class AugerProjectApi(AugerBaseApi):
 
         return self.wait_for_status(['undeployed', 'deployed', 'deploying'])
 
+    def set_autoterminate(self, minutes):
+        self.rest_api.call('update_project', {
+            'id': self.oid, 'cluster_autoterminate_minutes': minutes})
+
     def stop(self):
         if self.status() != 'undeployed':
             self.rest_api.call(
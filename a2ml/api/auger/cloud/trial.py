@@ -1,4 +1,5 @@
 from a2ml.api.auger.cloud.base import AugerBaseApi
+from a2ml.api.auger.cloud.utils.exception import AugerException
 
 
 class AugerTrialApi(AugerBaseApi):
@@ -9,3 +10,12 @@ class AugerTrialApi(AugerBaseApi):
         trial_name=None, trial_id=None):
         super(AugerTrialApi, self).__init__(
             ctx, experiment_session_api, trial_name, trial_id)
+
+    def list_page(self, offset, limit):
+        """One page of session trials and total number of trials."""
+        response = self.rest_api.call_ex('get_trials', {
+            '%s_id' % self.parent_api.api_request_path: self.parent_api.oid,
+            'offset': offset, 'limit': limit})
+        if not 'data' in response or not 'meta' in response:
+            raise AugerException('Read list of trials failed.')
+        return response['data'], response['meta']['pagination']['total']
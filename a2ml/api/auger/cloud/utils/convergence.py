@@ -0,0 +1,49 @@
+import time
+
+
+class ConvergenceMonitor(object):
+    """Detect plateau of the best score of experiment session.
+
+    Search is converged when the best score has not improved by more
+    than epsilon for patience_trials trials and patience_minutes minutes.
+    Windows which are not set are not checked. Scores should be higher
+    for better models."""
+
+    def __init__(self, epsilon, patience_trials=None, patience_minutes=None):
+        super(ConvergenceMonitor, self).__init__()
+        self.epsilon = epsilon
+        self.patience_trials = patience_trials
+        self.patience_minutes = patience_minutes
+        self.best_score = None
+        self.improved_at_trial = 0
+        self.improved_at_time = None
+
+    def update(self, best_score, trials_count, now=None):
+        """Returns True if search is converged."""
+        now = time.time() if now is None else now
+        if best_score is None:
+            return False
+
+        if self.best_score is None or \
+            best_score - self.best_score > self.epsilon:
+            self.best_score = best_score
+            self.improved_at_trial = trials_count
+            self.improved_at_time = now
+            return False
+
+        if not self.patience_trials and not self.patience_minutes:
+            return False
+        if self.patience_trials and \
+            trials_count - self.improved_at_trial < self.patience_trials:
+            return False
+        if self.patience_minutes and \
+            now - self.improved_at_time < self.patience_minutes * 60:
+            return False
+        return True
+
+    def describe(self, trials_count, now=None):
+        now = time.time() if now is None else now
+        return 'best score has not improved by more than %s ' \
+            'in %s trials and %.0f minutes' % (self.epsilon,
+            trials_count - self.improved_at_trial,
+            (now - self.improved_at_time) / 60)
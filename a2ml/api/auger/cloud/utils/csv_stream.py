@@ -0,0 +1,108 @@
+import io
+import csv
+import zlib
+import pandas
+import itertools
+
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+CHUNK_ROWS = 10000
+# zlib window bits to write gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class CsvStream(object):
+    """Serialize in memory data to CSV on the fly.
+
+    Data could be pandas DataFrame, Arrow Table or iterable of rows
+    (dicts or lists). Stream yields CSV encoded (and gzip compressed)
+    chunks of CHUNK_ROWS rows, so data is never serialized at once."""
+
+    def __init__(self, data, columns=None,
+        compress=True, chunk_rows=CHUNK_ROWS):
+        super(CsvStream, self).__init__()
+        self.data = data
+        self.columns = columns
+        self.compress = compress
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self.size = 0
+
+    @property
+    def extension(self):
+        return '.csv.gz' if self.compress else '.csv'
+
+    def __iter__(self):
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, GZIP_WBITS)
+
+        for text in self._iter_csv():
+            chunk = text.encode('utf-8')
+            if self.compress:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                self.size += len(chunk)
+                yield chunk
+
+        if self.compress:
+            chunk = compressor.flush()
+            self.size += len(chunk)
+            yield chunk
+
+    def write_to(self, f):
+        for chunk in self:
+            f.write(chunk)
+        f.seek(0)
+        return f
+
+    def _iter_csv(self):
+        if hasattr(self.data, 'to_batches'):
+            # Arrow Table is converted to pandas batch by batch
+            batches = (batch.to_pandas() for batch in
+                self.data.to_batches(max_chunksize=self.chunk_rows))
+            return self._iter_frames(batches)
+        if isinstance(self.data, pandas.DataFrame):
+            return self._iter_frames(
+                self.data[i:i + self.chunk_rows]
+                for i in range(0, len(self.data), self.chunk_rows))
+        return self._iter_rows(iter(self.data))
+
+    def _iter_frames(self, frames):
+        header = True
+        for df in frames:
+            if self.columns is not None:
+                df = df[self.columns]
+            self.rows += len(df)
+            yield df.to_csv(header=header, index=False)
+            header = False
+
+    def _iter_rows(self, rows):
+        first = next(rows, None)
+        if first is None:
+            raise AugerException('There is no data to import...')
+
+        columns = self.columns
+        if columns is None:
+            if not isinstance(first, dict):
+                raise AugerException(
+                    'Please specify columns for rows without names...')
+            columns = list(first.keys())
+
+        rows = itertools.chain([first], rows)
+        header = True
+        while True:
+            chunk = list(itertools.islice(rows, self.chunk_rows))
+            if len(chunk) == 0 and not header:
+                break
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            if header:
+                writer.writerow(columns)
+                header = False
+            for row in chunk:
+                if isinstance(row, dict):
+                    row = [row.get(column) for column in columns]
+                writer.writerow(row)
+            self.rows += len(chunk)
+            yield buffer.getvalue()
@@ -1,5 +1,11 @@
+import os
 import pandas
 
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+ARROW_FORMATS = ['.arrow', '.feather']
+PARQUET_FORMATS = ['.parquet']
+
 
 class DataFrame(object):
     """Warpper around Pandas DataFrame."""
@@ -9,10 +15,15 @@ class DataFrame(object):
 
     @staticmethod
     def load(filename, target, features=None, nrows=None):
-        try:
-            df = DataFrame._read_csv(filename, ',', features, nrows)
-        except Exception as e:
-            df = DataFrame._read_csv(filename, '|', features, nrows)
+        if DataFrame.is_columnar(filename):
+            df = DataFrame.load_arrow(filename, features)
+            if nrows is not None:
+                df = df.head(nrows)
+        else:
+            try:
+                df = DataFrame._read_csv(filename, ',', features, nrows)
+            except Exception as e:
+                df = DataFrame._read_csv(filename, '|', features, nrows)
 
         features = df.columns.get_values().tolist()
         if target in features:
@@ -20,10 +31,83 @@ class DataFrame(object):
 
         return df
 
+    @staticmethod
+    def from_data(data, target=None):
+        # in memory data could be pandas DataFrame or Arrow Table
+        if hasattr(data, 'to_pandas'):
+            df = data.to_pandas()
+        elif isinstance(data, pandas.DataFrame):
+            df = data
+        else:
+            raise AugerException(
+                'Data should be pandas DataFrame or Arrow Table...')
+
+        if target in df.columns.tolist():
+            df = df.drop(columns=[target])
+
+        return df
+
     @staticmethod
     def save(filename, data):
-        df = pandas.DataFrame.from_dict(data)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        if isinstance(data, pandas.DataFrame):
+            df = data
+        else:
+            df = pandas.DataFrame.from_dict(data)
+
+        if DataFrame.is_columnar(filename):
+            DataFrame.save_arrow(filename, df)
+        else:
+            df.to_csv(filename, index=False, encoding='utf-8')
+
+    @staticmethod
+    def is_columnar(filename):
+        extension = os.path.splitext(filename)[1]
+        return extension in ARROW_FORMATS + PARQUET_FORMATS
+
+    @staticmethod
+    def load_arrow(filename, features=None):
+        pyarrow = DataFrame._import_pyarrow()
+        if os.path.splitext(filename)[1] in PARQUET_FORMATS:
+            import pyarrow.parquet
+            table = pyarrow.parquet.read_table(
+                filename, columns=features, memory_map=True)
+        else:
+            # memory mapped file is read without copying
+            with pyarrow.memory_map(filename, 'r') as source:
+                table = pyarrow.ipc.open_file(source).read_all()
+            if features is not None:
+                table = table.select(features)
+        return table.to_pandas()
+
+    @staticmethod
+    def save_arrow(filename, df):
+        pyarrow = DataFrame._import_pyarrow()
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        if os.path.splitext(filename)[1] in PARQUET_FORMATS:
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(table, filename)
+        else:
+            with pyarrow.OSFile(filename, 'wb') as sink:
+                with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+    @staticmethod
+    def has_pyarrow():
+        try:
+            DataFrame._import_pyarrow()
+        except AugerException:
+            return False
+        return True
+
+    @staticmethod
+    def _import_pyarrow():
+        try:
+            import pyarrow
+            import pyarrow.ipc
+        except ImportError:
+            raise AugerException('Please install pyarrow to use'
+                ' Arrow/Parquet data: pip install "a2ml[arrow]"')
+        return pyarrow
 
     @staticmethod
     def _read_csv(filename, sep, features=None, nrows=None):
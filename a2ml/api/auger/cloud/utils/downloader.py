@@ -0,0 +1,145 @@
+import os
+import re
+import hashlib
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from a2ml.api.auger.cloud.utils.exception import AugerException
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+CHUNK_SIZE = 16 * 1024 * 1024
+READ_SIZE = 1024 * 1024
+DOWNLOAD_WORKERS = 4
+
+
+class Downloader(object):
+    """Download file with parallel HTTP range requests.
+
+    Partially downloaded file is resumed on the next call and download
+    is skipped if remote file ETag and size match the local file.
+    Remote file without ETag and size can't be matched, so it is
+    always downloaded from scratch."""
+
+    def __init__(self, ctx, workers=DOWNLOAD_WORKERS, chunk_size=CHUNK_SIZE):
+        super(Downloader, self).__init__()
+        self.ctx = ctx
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.lock = threading.Lock()
+
+    def download(self, url, file_name):
+        size, etag, ranges = self._probe(url)
+        meta_file = '%s.download.json' % file_name
+        part_file = '%s.part' % file_name
+        meta = self._load_meta(meta_file)
+
+        is_known = etag is not None or size is not None
+        if is_known and \
+            meta.get('etag') == etag and meta.get('size') == size:
+            if meta.get('completed') and os.path.isfile(file_name):
+                self.ctx.log('%s is up to date' % os.path.basename(file_name))
+                return file_name
+            if not os.path.isfile(part_file):
+                meta = {}
+        else:
+            meta = {}
+
+        if not meta:
+            meta = {'etag': etag, 'size': size, 'chunks': []}
+            # preallocate file, chunks are written in place
+            with open(part_file, 'wb') as f:
+                f.truncate(size or 0)
+            self._save_meta(meta_file, meta)
+        else:
+            self.ctx.log('Resuming download of %s' % \
+                os.path.basename(file_name))
+
+        if ranges and size:
+            self._download_chunks(url, part_file, meta_file, meta)
+        else:
+            self._download_stream(url, part_file)
+
+        self._verify(part_file, size, etag)
+        os.replace(part_file, file_name)
+        meta['completed'] = True
+        self._save_meta(meta_file, meta)
+
+        return file_name
+
+    def _probe(self, url):
+        # signed urls allow GET only, so probe with one byte range request
+        res = requests.get(url, headers={'Range': 'bytes=0-0'}, stream=True)
+        res.close()
+        if res.status_code not in [200, 206]:
+            raise AugerException(
+                'HTTP error [%s] while downloading %s' % \
+                (res.status_code, url))
+
+        etag = res.headers.get('ETag', '').strip('"') or None
+        if res.status_code == 206:
+            content_range = res.headers.get('Content-Range', '')
+            size = int(content_range.split('/')[-1])
+            return size, etag, True
+
+        size = res.headers.get('Content-Length')
+        return int(size) if size else None, etag, False
+
+    def _download_chunks(self, url, part_file, meta_file, meta):
+        done = set(meta['chunks'])
+        chunks = [offset for offset in range(0, meta['size'], self.chunk_size)
+            if offset not in done]
+
+        def download_chunk(offset):
+            end = min(offset + self.chunk_size, meta['size']) - 1
+            res = requests.get(url, stream=True,
+                headers={'Range': 'bytes=%s-%s' % (offset, end)})
+            if res.status_code != 206:
+                raise AugerException(
+                    'HTTP error [%s] while downloading range %s-%s' % \
+                    (res.status_code, offset, end))
+            with open(part_file, 'r+b') as f:
+                f.seek(offset)
+                for data in res.iter_content(READ_SIZE):
+                    f.write(data)
+            with self.lock:
+                meta['chunks'].append(offset)
+                self._save_meta(meta_file, meta)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for future in [executor.submit(download_chunk, offset)
+                for offset in chunks]:
+                future.result()
+
+    def _download_stream(self, url, part_file):
+        res = requests.get(url, stream=True)
+        if res.status_code != 200:
+            raise AugerException(
+                'HTTP error [%s] while downloading %s' % \
+                (res.status_code, url))
+        with open(part_file, 'wb') as f:
+            for data in res.iter_content(READ_SIZE):
+                f.write(data)
+
+    def _verify(self, part_file, size, etag):
+        if size is not None and os.path.getsize(part_file) != size:
+            raise AugerException('Downloaded file size doesn\'t match...')
+
+        # single part S3 ETag is md5 of the file
+        if etag and re.match(r'^[0-9a-f]{32}$', etag):
+            md5 = hashlib.md5()
+            with open(part_file, 'rb') as f:
+                for data in iter(lambda: f.read(READ_SIZE), b''):
+                    md5.update(data)
+            if md5.hexdigest() != etag:
+                os.remove(part_file)
+                raise AugerException(
+                    'Downloaded file checksum doesn\'t match...')
+
+    @staticmethod
+    def _load_meta(meta_file):
+        return load_json(meta_file, {})
+
+    @staticmethod
+    def _save_meta(meta_file, meta):
+        save_json(meta_file, meta)
@@ -0,0 +1,72 @@
+import os
+import json
+import time
+import hashlib
+
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+MAX_FILES = 1000
+MAX_AGE = 30 * 24 * 3600
+
+
+class FileCache(object):
+    """JSON values stored in separate files of the cache folder.
+
+    Values older than max_age seconds are treated as missing. Cache is
+    pruned on each new value to max_files most recently used values."""
+
+    def __init__(self, path, max_files=MAX_FILES, max_age=MAX_AGE):
+        super(FileCache, self).__init__()
+        self.path = path
+        self.max_files = max_files
+        self.max_age = max_age
+
+    @staticmethod
+    def hash(value):
+        return hashlib.sha1(json.dumps(
+            value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        filename = self._get_file(key)
+        try:
+            if time.time() - os.path.getmtime(filename) > self.max_age:
+                return None
+        except OSError:
+            return None
+        value = load_json(filename)
+        if value is not None:
+            # mtime tracks last use for pruning
+            try:
+                os.utime(filename)
+            except OSError:
+                pass
+        return value
+
+    def set(self, key, value):
+        save_json(self._get_file(key), value)
+        self._prune()
+        return value
+
+    def _prune(self):
+        files = []
+        for name in os.listdir(self.path):
+            if not name.endswith('.json'):
+                continue
+            filename = os.path.join(self.path, name)
+            try:
+                files.append((os.path.getmtime(filename), filename))
+            except OSError:
+                pass
+
+        files.sort(reverse=True)
+        now = time.time()
+        for index, (mtime, filename) in enumerate(files):
+            if index >= self.max_files or now - mtime > self.max_age:
+                try:
+                    os.remove(filename)
+                except OSError:
+                    # could be removed by other process
+                    pass
+
+    def _get_file(self, key):
+        return os.path.join(self.path, '%s.json' % key)
@@ -0,0 +1,35 @@
+import os
+import json
+import threading
+
+
+def load_json(filename, default=None):
+    """Content of json file or default if file is missing or broken."""
+    if not os.path.isfile(filename):
+        return default
+    try:
+        with open(filename, 'r') as f:
+            return json.loads(f.read())
+    except ValueError:
+        return default
+
+
+def save_json(filename, value, **kwargs):
+    """Replace json file atomically.
+
+    Content goes to temporary file unique for the process and thread,
+    so concurrent writers don't collide and readers never see
+    partially written file."""
+    path = os.path.dirname(filename)
+    if path and not os.path.exists(path):
+        os.makedirs(path, exist_ok=True)
+    temp_file = '%s.%s.%s.tmp' % (
+        filename, os.getpid(), threading.get_ident())
+    try:
+        with open(temp_file, 'w') as f:
+            f.write(json.dumps(value, **kwargs))
+        os.replace(temp_file, filename)
+    finally:
+        if os.path.isfile(temp_file):
+            os.remove(temp_file)
+    return value
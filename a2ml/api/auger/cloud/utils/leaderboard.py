@@ -0,0 +1,91 @@
+import heapq
+
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+TOP_K = 100
+# metrics which are not negated and are better when lower
+LOWER_IS_BETTER = ['mean_squared_error', 'mean_absolute_error',
+    'median_absolute_error', 'mean_squared_log_error', 'log_loss',
+    'rmse', 'rmsle', 'mase']
+# trials which could still get score
+PENDING_TRIAL_STATUSES = ['waiting', 'started', 'running']
+
+
+class Leaderboard(object):
+    """Top k trials of experiment session by score.
+
+    Leaderboard counts trials it has seen, so it could be saved
+    and updated later with newer trials only."""
+
+    def __init__(self, size=TOP_K):
+        super(Leaderboard, self).__init__()
+        self.size = size
+        self.count = 0
+        self.score_name = None
+        # min heap of [sort key, trial id, score, algorithm]
+        self.heap = []
+
+    @staticmethod
+    def is_lower_better(score_name):
+        return score_name in LOWER_IS_BETTER
+
+    def add(self, trials):
+        """Add trials in the order of trials list.
+
+        Trials count is not moved past pending trial without score,
+        so it is checked again on next update. Finished trials without
+        score (failed ones) are counted and skipped."""
+        ids = set(entry[1] for entry in self.heap)
+        has_gap = False
+        for trial in trials:
+            score = trial.get('score_value')
+            if score is None:
+                if trial.get('status') in PENDING_TRIAL_STATUSES:
+                    has_gap = True
+                elif not has_gap:
+                    self.count += 1
+                continue
+            if not has_gap:
+                self.count += 1
+            if trial.get('id') in ids:
+                continue
+
+            self.score_name = trial.get('score_name')
+            key = -score if self.is_lower_better(self.score_name) else score
+            entry = [key, trial.get('id'), score, trial.get('hyperparameter').\
+                get('algorithm_name').split('.')[-1]]
+            if len(self.heap) < self.size:
+                heapq.heappush(self.heap, entry)
+            elif key > self.heap[0][0]:
+                heapq.heapreplace(self.heap, entry)
+            else:
+                continue
+            ids.add(entry[1])
+
+    def best_key(self):
+        """Best score, negated for metrics which are better when lower."""
+        return max(entry[0] for entry in self.heap) if self.heap else None
+
+    def top(self, n=None):
+        entries = heapq.nlargest(n or self.size, self.heap)
+        return [{
+            'model id': trial_id,
+            self.score_name: '{0:.4f}'.format(score),
+            'algorithm': algorithm
+        } for key, trial_id, score, algorithm in entries]
+
+    @staticmethod
+    def load(filename):
+        content = load_json(filename)
+        if content is None:
+            return None
+        leaderboard = Leaderboard(content['size'])
+        leaderboard.count = content['count']
+        leaderboard.score_name = content['score_name']
+        leaderboard.heap = content['heap']
+        heapq.heapify(leaderboard.heap)
+        return leaderboard
+
+    def save(self, filename):
+        save_json(filename, {'size': self.size, 'count': self.count,
+            'score_name': self.score_name, 'heap': self.heap})
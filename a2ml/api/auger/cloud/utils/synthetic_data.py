@@ -0,0 +1,60 @@
+import random
+import datetime
+import pandas
+
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+
+class SyntheticData(object):
+    """Generate random rows matching DataSet statistics (stat_data)."""
+
+    def __init__(self, stat_data, exclude=None, seed=None):
+        super(SyntheticData, self).__init__()
+        exclude = exclude or []
+        self.columns = [item for item in stat_data
+            if item['column_name'] not in exclude]
+        self.random = random.Random(seed)
+
+    @staticmethod
+    def from_data_set(data_set_properties, target=None, exclude=None):
+        statistics = data_set_properties.get('statistics')
+        if statistics is None:
+            raise AugerException('DataSet %s has no statistics yet, '
+                'please wait until it is processed...' % \
+                data_set_properties.get('name'))
+        stat_data = statistics.get('stat_data', [])
+        exclude = exclude or []
+        if isinstance(exclude, str):
+            exclude = [e.strip() for e in exclude.split(',')]
+        return SyntheticData(stat_data, [target] + list(exclude))
+
+    def generate(self, rows):
+        return pandas.DataFrame(dict(
+            (item['column_name'], [self._value(item) for _ in range(rows)])
+            for item in self.columns),
+            columns=[item['column_name'] for item in self.columns])
+
+    def _value(self, item):
+        datatype = item.get('datatype')
+        if datatype in ['integer', 'float', 'double', 'numeric']:
+            low = item.get('min')
+            low = 0 if low is None else low
+            high = item.get('max')
+            high = low + 1 if high is None else high
+            if datatype == 'integer':
+                return self.random.randint(int(low), int(high))
+            return self.random.uniform(float(low), float(high))
+
+        if datatype == 'date':
+            days = self.random.randint(0, 365)
+            return (datetime.date.today() -
+                datetime.timedelta(days=days)).isoformat()
+
+        if datatype == 'boolean':
+            return self.random.choice([True, False])
+
+        values = item.get('value_counts')
+        if isinstance(values, dict) and len(values) > 0:
+            return self.random.choice(list(values.keys()))
+        unique_values = item.get('unique_values') or 10
+        return 'value_%s' % self.random.randrange(int(unique_values))
@@ -0,0 +1,69 @@
+import json
+
+from a2ml.api.auger.cloud.utils.dataframe import DataFrame
+
+ROW_GROUP_SIZE = 10000
+
+
+class TrialsWriter(object):
+    """Write experiment session trials to Parquet file.
+
+    Trials are buffered up to row_group_size rows and written as one
+    row group, so memory does not grow with number of trials. Algorithm
+    parameters are flattened to dotted names and stored in hyperparameters
+    map column with json encoded values, so trials of all algorithms
+    share the same schema."""
+
+    def __init__(self, filename, row_group_size=ROW_GROUP_SIZE):
+        super(TrialsWriter, self).__init__()
+        self.pyarrow = DataFrame._import_pyarrow()
+        import pyarrow.parquet
+        self.schema = self.pyarrow.schema([
+            ('experiment_session_id', self.pyarrow.string()),
+            ('trial_id', self.pyarrow.string()),
+            ('algorithm', self.pyarrow.string()),
+            ('score_name', self.pyarrow.string()),
+            ('score_value', self.pyarrow.float64()),
+            ('hyperparameters', self.pyarrow.map_(
+                self.pyarrow.string(), self.pyarrow.string()))])
+        self.row_group_size = row_group_size
+        self.writer = pyarrow.parquet.ParquetWriter(filename, self.schema)
+        self.rows = []
+        self.count = 0
+
+    def write(self, experiment_session_id, trials):
+        for trial in trials:
+            hyperparameter = trial.get('hyperparameter') or {}
+            params = self.flatten(hyperparameter.get('algorithm_params') or {})
+            self.rows.append({
+                'experiment_session_id': str(experiment_session_id),
+                'trial_id': str(trial.get('id')),
+                'algorithm': hyperparameter.get('algorithm_name'),
+                'score_name': trial.get('score_name'),
+                'score_value': trial.get('score_value'),
+                'hyperparameters': [(name, json.dumps(value, default=str))
+                    for name, value in sorted(params.items())]})
+            if len(self.rows) >= self.row_group_size:
+                self._write_row_group()
+
+    def close(self):
+        if self.rows:
+            self._write_row_group()
+        self.writer.close()
+
+    def _write_row_group(self):
+        self.writer.write_table(self.pyarrow.Table.from_pylist(
+            self.rows, schema=self.schema))
+        self.count += len(self.rows)
+        self.rows = []
+
+    @staticmethod
+    def flatten(value, prefix=''):
+        items = {}
+        for key, item in value.items():
+            name = '%s.%s' % (prefix, key) if prefix else key
+            if isinstance(item, dict) and item:
+                items.update(TrialsWriter.flatten(item, name))
+            else:
+                items[name] = item
+        return items
@@ -0,0 +1,17 @@
+from a2ml.api.auger.cloud.base import AugerBaseApi
+
+
+class AugerWarmStartRequestApi(AugerBaseApi):
+    """Auger Warm Start Request API."""
+
+    def __init__(self, ctx, experiment_session_api, request_id=None):
+        super(AugerWarmStartRequestApi, self).__init__(
+            ctx, experiment_session_api, None, request_id)
+        assert experiment_session_api is not None, \
+            'Experiment Session must be set for Warm Start Request'
+
+    def create(self):
+        # request is processed like prediction request
+        return self._call_create({
+            'experiment_session_id': self.parent_api.oid},
+            ['requested', 'running'])
@@ -1,3 +1,7 @@
+# number of latest deployed pipelines kept in auger.yaml
+MAX_PIPELINES = 10
+
+
 class AugerConfig(object):
     """Modify configuration options in auger.yaml."""
 
@@ -34,3 +38,18 @@ class AugerConfig(object):
     def set_experiment(self, yaml, experiment_name, experiment_session_id):
         yaml['experiment']['name'] = experiment_name
         yaml['experiment']['experiment_session_id'] = experiment_session_id
+
+    @_with_auger_yaml
+    def add_pipeline(self, yaml, pipeline_id):
+        pipelines = [p for p in yaml.get('pipelines') or []
+            if p != pipeline_id] + [pipeline_id]
+        max_pipelines = self.ctx.config['auger'].get(
+            'deploy/max_pipelines', MAX_PIPELINES)
+        yaml['pipelines'] = pipelines[-max_pipelines:]
+        self.ctx.config['auger'].pipelines = list(yaml['pipelines'])
+
+    @_with_auger_yaml
+    def remove_pipelines(self, yaml, pipeline_ids):
+        yaml['pipelines'] = [p for p in yaml.get('pipelines') or []
+            if p not in pipeline_ids]
+        self.ctx.config['auger'].pipelines = list(yaml['pipelines'])
@@ -1,9 +1,15 @@
-import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from a2ml.api.auger.base import AugerBase
+from a2ml.api.auger.config import AugerConfig
+from a2ml.api.auger.model_store import AugerModelStore
+from a2ml.api.auger.local_predictor import AugerLocalPredictor
 from a2ml.api.auger.cloud.cluster import AugerClusterApi
-from a2ml.api.auger.cloud.pipeline import AugerPipelineApi
+from a2ml.api.auger.cloud.data_set import AugerDataSetApi
+from a2ml.api.auger.cloud.pipeline import \
+    AugerPipelineApi, PIPELINE_PROGRESS
+from a2ml.api.auger.cloud.utils.synthetic_data import SyntheticData
 from a2ml.api.auger.cloud.utils.exception import AugerException
 from a2ml.api.auger.cloud.pipeline_file import AugerPipelineFileApi
 
@@ -15,61 +21,190 @@ class AugerDeploy(AugerBase):
         super(AugerDeploy, self).__init__(ctx)
 
     @AugerBase._error_handler
-    def deploy(self, model_id, locally=False):
+    def deploy(self, model_id, locally=False, wait=True):
         # verify avalability of auger credentials
         self.credentials.verify()
 
         if locally:
             self.depoly_model_locally(model_id)
         else:
-            self.deploy_model_on_cloud(model_id)
+            return self.deploy_model_on_cloud(model_id, wait)
 
-    def deploy_model_on_cloud(self, model_id):
+    @AugerBase._error_handler
+    def deploy_status(self, wait=False, prune=False):
+        # verify avalability of auger credentials
+        self.credentials.verify()
+
+        pipeline_ids = self.ctx.config['auger'].get('pipelines', [])
+        if len(pipeline_ids) == 0:
+            raise AugerException('Can\'t find deployed models'
+                ' (auger.yaml/pipelines option).')
+
+        pipelines = [AugerPipelineApi(self.ctx, None, pipeline_id)
+            for pipeline_id in pipeline_ids]
+        if wait:
+            self.wait_for_pipelines(pipelines)
+
+        statuses = {}
+        for pipeline_api in pipelines:
+            try:
+                statuses[pipeline_api.object_id] = pipeline_api.status()
+            except Exception as e:
+                if not prune:
+                    raise
+                statuses[pipeline_api.object_id] = str(e)
+            self.ctx.log('Model %s is %s' % \
+                (pipeline_api.object_id, statuses[pipeline_api.object_id]))
+
+        if prune:
+            failed = [pipeline_id for pipeline_id, status in statuses.items()
+                if status != 'ready' and status not in PIPELINE_PROGRESS]
+            if failed:
+                AugerConfig(self.ctx).remove_pipelines(failed)
+                self.ctx.log('Removed %s failed models from'
+                    ' auger.yaml/pipelines' % len(failed))
+        return statuses
+
+    def deploy_model_on_cloud(self, model_id, wait=True):
         self.ctx.log('Deploying model %s' % model_id)
 
         self.start_project()
-        pipeline_properties = AugerPipelineApi(
-            self.ctx, None).create(model_id)
+        pipeline_api = AugerPipelineApi(self.ctx, None)
+        pipeline_api.create(model_id, wait)
+        AugerConfig(self.ctx).add_pipeline(pipeline_api.object_id)
 
-        self.ctx.log('Deployed Model on Auger Cloud. Model id is %s' % \
-            pipeline_properties.get('id'))
+        if wait and self.ctx.get_config('auger').get('deploy/warmup', False):
+            self._warmup_pipeline(pipeline_api)
+
+        if wait:
+            self.ctx.log('Deployed Model on Auger Cloud. Model id is %s' % \
+                pipeline_api.object_id)
+        else:
+            self.ctx.log('Deploying Model on Auger Cloud. Model id is %s.'
+                ' Use a2ml deploy --status to check it.' % \
+                pipeline_api.object_id)
+
+        return pipeline_api
+
+    def _warmup_pipeline(self, pipeline_api):
+        auger_config = self.ctx.get_config('auger')
+        df = self._get_warmup_data(auger_config.get('deploy/warmup_rows', 10))
+
+        self.ctx.log('Warming up model %s' % pipeline_api.object_id)
+        max_latency = auger_config.get('deploy/warmup_latency', 10)
+        if not pipeline_api.warmup(df, max_latency,
+            auger_config.get('deploy/warmup_requests', 10)):
+            raise AugerException(
+                'Model %s prediction is still slower than %ss'
+                ' after warmup...' % (pipeline_api.object_id, max_latency))
+
+    def _get_warmup_data(self, rows):
+        # random rows with model features, built from DataSet statistics
+        auger_config = self.ctx.get_config('auger')
+        config = self.ctx.get_config('config')
+
+        data_set_name = auger_config.get('dataset')
+        if data_set_name is None:
+            raise AugerException(
+                'Plese specify DataSet name in auger.yaml/dataset'
+                ' to warm up deployed model')
+        self._ensure_org_and_project()
+        data_set_properties = AugerDataSetApi(
+            self.ctx, self.project_api, data_set_name).properties()
+        return SyntheticData.from_data_set(data_set_properties,
+            config.get('target'), config.get('exclude', [])).generate(rows)
+
+    def wait_for_pipelines(self, pipelines):
+        def wait_ready(pipeline_api):
+            try:
+                pipeline_api.wait_ready()
+            except AugerException as e:
+                self.ctx.log('Model %s: %s' % (pipeline_api.object_id, str(e)))
+
+        pending = [p for p in pipelines if p.is_pending()]
+        if len(pending) == 0:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for future in [executor.submit(wait_ready, pipeline_api)
+                for pipeline_api in pending]:
+                future.result()
 
     def depoly_model_locally(self, model_id):
-        is_loaded, model_path, model_name = self.verify_local_model(model_id)
+        is_loaded, model_path, model_name = \
+            self.verify_local_model(self.ctx, model_id)
 
-        if not is_loaded:
-            self.ctx.log('Downloading model %s' % model_id)
+        # pull docker image while model is packaged and downloaded
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            docker_pull = executor.submit(self._docker_pull_image)
 
-            self.start_project()
-            pipeline_file_api = AugerPipelineFileApi(self.ctx, None)
-            pipeline_file_properties = pipeline_file_api.create(model_id)
-            downloaded_model_file = pipeline_file_api.download(
-                pipeline_file_properties['signed_s3_model_path'],
-                model_path, model_id)
+            if not is_loaded:
+                self.ctx.log('Downloading model %s' % model_id)
 
-            self.ctx.log('Downloaded model to %s' % downloaded_model_file)
-        else:
-            self.ctx.log('Downloaded model is %s' % model_name)
+                self.start_project()
+                pipeline_file_api = AugerPipelineFileApi(self.ctx, None)
+                pipeline_file_properties = pipeline_file_api.create(model_id)
+                downloaded_model_file = pipeline_file_api.download(
+                    pipeline_file_properties['signed_s3_model_path'],
+                    model_path, model_id)
 
-        self.ctx.log('Pulling docker image required to predict')
-        self._docker_pull_image()
+                self.ctx.log('Downloaded model to %s' % downloaded_model_file)
+            else:
+                self.ctx.log('Downloaded model is %s' % model_name)
+
+            docker_pull.result()
+
+        if self.ctx.get_config('auger').get('local_predictor/warmup', False):
+            self._warmup_local_model(model_id)
+
+    def _warmup_local_model(self, model_id):
+        if not AugerLocalPredictor.is_enabled(self.ctx):
+            self.ctx.log('Warmup requires local_predictor/warm option')
+            return
+
+        model_path = AugerModelStore(self.ctx).extract(model_id)
+        predictor = AugerLocalPredictor(self.ctx, model_id, model_path)
+        predictor.start()
+
+        # server loads model on the first prediction
+        if self.ctx.get_config('auger').get(
+            'local_predictor/warmup_predict', True):
+            try:
+                predictor.predict_frame(self._get_warmup_data(1))
+            except Exception as e:
+                self.ctx.log('Warmup prediction failed: %s' % str(e))
+                return
+
+        self.ctx.log('Local model server for %s is ready' % model_id)
 
     @staticmethod
-    def verify_local_model(model_id):
-        model_path = os.path.abspath(
-            os.path.join(os.getcwd(), 'models'))
-        model_name = '%s/model-%s.zip' % (model_path, model_id)
-        return os.path.isfile(model_name), model_path, model_name
+    def verify_local_model(ctx, model_id):
+        model_store = AugerModelStore(ctx)
+        return model_store.is_loaded(model_id), \
+            model_store.path, model_store.get_model_file(model_id)
 
     def _docker_pull_image(self):
         cluster_settings = AugerClusterApi.get_cluster_settings(self.ctx)
         docker_tag = cluster_settings.get('kubernetes_stack')
+        docker_image = 'deeplearninc/auger-ml-worker:%s' % docker_tag
 
+        pull_policy = self.ctx.get_config('auger').get(
+            'local_predictor/pull_policy', 'if_not_present')
+        if pull_policy != 'always' and self._docker_image_exists(docker_image):
+            self.ctx.log('Docker image %s is available locally' % docker_image)
+            return docker_tag
+
+        self.ctx.log('Pulling docker image required to predict')
         try:
             subprocess.check_call(
-                'docker pull deeplearninc/auger-ml-worker:%s' % \
-                 docker_tag, shell=True)
+                'docker pull %s' % docker_image, shell=True)
         except subprocess.CalledProcessError as e:
             raise AugerException('Can\'t pull Docker container...')
 
         return docker_tag
+
+    @staticmethod
+    def _docker_image_exists(docker_image):
+        return subprocess.call(
+            'docker image inspect %s' % docker_image,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            shell=True) == 0
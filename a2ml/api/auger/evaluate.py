@@ -1,8 +1,19 @@
+import os
+import time
+
 from a2ml.api.auger.base import AugerBase
 from a2ml.api.auger.cloud.utils.exception import AugerException
 from a2ml.api.auger.cloud.experiment import AugerExperimentSessionApi
+from a2ml.api.auger.cloud.utils.leaderboard import Leaderboard, TOP_K
+from a2ml.api.auger.cloud.utils.convergence import ConvergenceMonitor
 from a2ml.api.utils.formatter import print_table
 
+LEADERBOARD_SIZE = 10
+ACTIVE_STATUSES = ['waiting', 'preprocess', 'started']
+MIN_INTERVAL = 5
+MAX_INTERVAL = 60
+EPSILON = 0.001
+
 
 class AugerEvaluate(AugerBase):
     """Evaluate you Model on Auger."""
@@ -11,7 +22,7 @@ class AugerEvaluate(AugerBase):
         super(AugerEvaluate, self).__init__(ctx)
 
     @AugerBase._error_handler
-    def evaluate(self):
+    def evaluate(self, watch=False):
         # verify avalability of auger credentials
         self.credentials.verify()
 
@@ -23,9 +34,71 @@ class AugerEvaluate(AugerBase):
 
         experiment_session_api = AugerExperimentSessionApi(
             self.ctx, None, None, experiment_session_id)
-        print_table(self.ctx.log, experiment_session_api.get_leaderboard())
+        top_n = self.ctx.config['auger'].get(
+            'experiment/leaderboard_size', LEADERBOARD_SIZE)
+        cache_file = self._get_leaderboard_cache(experiment_session_id)
+
+        if watch:
+            return self._watch(experiment_session_api, top_n, cache_file)
+
+        print_table(self.ctx.log,
+            experiment_session_api.get_leaderboard(top_n, cache_file))
+        self._log_status(experiment_session_api.status())
+
+    def _watch(self, experiment_session_api, top_n, cache_file):
+        config = self.ctx.config['auger']
+        min_interval = config.get('evaluate/min_interval', MIN_INTERVAL)
+        max_interval = config.get('evaluate/max_interval', MAX_INTERVAL)
+
+        leaderboard = Leaderboard.load(cache_file)
+        if leaderboard is None or leaderboard.size < top_n:
+            leaderboard = Leaderboard(max(top_n, TOP_K))
+
+        monitor = self._get_convergence_monitor()
+        interval, last_count, last_status = min_interval, None, None
+        try:
+            while True:
+                status = experiment_session_api.status()
+                experiment_session_api.update_leaderboard(leaderboard)
 
-        status = experiment_session_api.properties().get('status')
+                if monitor and status in ACTIVE_STATUSES and monitor.update(
+                    leaderboard.best_key(), leaderboard.count):
+                    self.ctx.log('Stopping search: %s' % \
+                        monitor.describe(leaderboard.count))
+                    experiment_session_api.interrupt()
+                    monitor = None
+
+                if leaderboard.count != last_count:
+                    # poll faster while trials arrive
+                    interval = min_interval
+                    leaderboard.save(cache_file)
+                    self.ctx.log('')
+                    self.ctx.log('%s trials evaluated' % leaderboard.count)
+                    print_table(self.ctx.log, leaderboard.top(top_n))
+                    last_count = leaderboard.count
+                else:
+                    interval = min(interval * 2, max_interval)
+
+                if status != last_status:
+                    self._log_status(status)
+                    last_status = status
+                if status not in ACTIVE_STATUSES:
+                    break
+
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+    def _get_convergence_monitor(self):
+        config = self.ctx.config['auger']
+        if not config.get('experiment/early_stopping/enabled', False):
+            return None
+        return ConvergenceMonitor(
+            config.get('experiment/early_stopping/epsilon', EPSILON),
+            config.get('experiment/early_stopping/patience_trials', None),
+            config.get('experiment/early_stopping/patience_minutes', None))
+
+    def _log_status(self, status):
         messages = {
             'preprocess': 'Search is preprocessing data for traing...',
             'started': 'Search is in progress...',
@@ -36,3 +109,7 @@ class AugerEvaluate(AugerBase):
             self.ctx.log(message)
         else:
             self.ctx.log('Search status is %s' % status)
+
+    def _get_leaderboard_cache(self, experiment_session_id):
+        return os.path.join(self.credentials.creds_path,
+            'leaderboards', '%s.json' % experiment_session_id)
@@ -0,0 +1,79 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from a2ml.api.auger.base import AugerBase
+from a2ml.api.auger.cloud.trial import AugerTrialApi
+from a2ml.api.auger.cloud.experiment_session import AugerExperimentSessionApi
+from a2ml.api.auger.cloud.utils.exception import AugerException
+from a2ml.api.auger.cloud.utils.trials_writer import \
+    TrialsWriter, ROW_GROUP_SIZE
+
+PAGE_SIZE = 100
+WORKERS = 4
+
+
+class AugerExport(AugerBase):
+    """Export trials of experiment sessions to Parquet file.
+
+    Pages of trials are read in parallel by export/workers threads
+    and written in order as they arrive."""
+
+    def __init__(self, ctx):
+        super(AugerExport, self).__init__(ctx)
+
+    @AugerBase._error_handler
+    def export(self, session_ids=None, output=None):
+        # verify avalability of auger credentials
+        self.credentials.verify()
+
+        config = self.ctx.config['auger']
+        if not session_ids:
+            experiment_session_id = config.get(
+                'experiment/experiment_session_id')
+            if experiment_session_id is None:
+                raise AugerException('Can\'t find previously run experiments'
+                    ' (auger.yaml/experiment/experiment_session_id option).')
+            session_ids = [experiment_session_id]
+        output = output or 'trials.parquet'
+        page_size = config.get('export/page_size', PAGE_SIZE)
+        workers = config.get('export/workers', WORKERS)
+
+        writer = TrialsWriter(output,
+            config.get('export/row_group_size', ROW_GROUP_SIZE))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for session_id in session_ids:
+                    trial_api = AugerTrialApi(self.ctx,
+                        AugerExperimentSessionApi(
+                            self.ctx, None, None, session_id))
+                    count = 0
+                    for trials in self._read_pages(
+                        executor, trial_api, page_size, workers):
+                        writer.write(session_id, trials)
+                        count += len(trials)
+                    self.ctx.log('Exported %s trials of Experiment Session'
+                        ' %s' % (count, session_id))
+        finally:
+            writer.close()
+
+        self.ctx.log('Trials stored in %s' % output)
+        return output
+
+    @staticmethod
+    def _read_pages(executor, trial_api, page_size, workers):
+        trials, total = trial_api.list_page(0, page_size)
+        if len(trials) == 0:
+            return
+        yield trials
+
+        # api could return smaller pages than requested
+        page_size = len(trials)
+        # limit pages read ahead to keep memory bounded
+        pending = deque()
+        for offset in range(page_size, total, page_size):
+            pending.append(
+                executor.submit(trial_api.list_page, offset, page_size))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()[0]
+        while pending:
+            yield pending.popleft().result()[0]
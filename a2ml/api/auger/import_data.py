@@ -1,6 +1,7 @@
 from a2ml.api.auger.base import AugerBase
 from a2ml.api.auger.config import AugerConfig
 from a2ml.api.auger.cloud.data_set import AugerDataSetApi
+from a2ml.api.auger.cloud.utils.csv_stream import CsvStream
 
 class AugerImport(AugerBase):
     """Import data into Auger."""
@@ -18,10 +19,13 @@ class AugerImport(AugerBase):
 
         self.ctx.log('Importing file %s' % file_to_upload)
 
-        self.start_project()
+        # file is uploaded while cluster is starting,
+        # DataSet in auger.yaml is the previous one, so it can't size cluster
+        self.start_project(wait=False, auto_size=False)
 
         data_set_api = AugerDataSetApi(self.ctx, self.project_api)
-        data_set_api.create(file_to_upload)
+        data_set_api.create(file_to_upload,
+            wait_for_project=self.wait_for_project)
         AugerConfig(self.ctx).set_data_set(data_set_api.object_name)
 
         self.ctx.log(
@@ -30,6 +34,29 @@ class AugerImport(AugerBase):
         self.ctx.log(
             'DataSet name stored in auger.yaml/dataset')
 
+    @AugerBase._error_handler
+    def import_frame(self, data, data_set_name=None, columns=None):
+        # verify avalability of auger credentials
+        self.credentials.verify()
+
+        self.ctx.log('Importing data from memory')
+
+        self.start_project(wait=False, auto_size=False)
+
+        stream = CsvStream(data, columns)
+        data_set_api = AugerDataSetApi(self.ctx, self.project_api)
+        data_set_api.create_from_stream(stream, data_set_name,
+            wait_for_project=self.wait_for_project)
+        AugerConfig(self.ctx).set_data_set(data_set_api.object_name)
+
+        self.ctx.log(
+            'Created DataSet %s on Auger Cloud from %s rows '
+            '(%s bytes uploaded).' % \
+             (data_set_api.object_name, stream.rows, stream.size))
+        self.ctx.log(
+            'DataSet name stored in auger.yaml/dataset')
+        return data_set_api.object_name
+
     def _get_source_file(self):
         file_to_upload = self.ctx.config['config'].get('source', None)
 
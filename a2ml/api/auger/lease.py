@@ -0,0 +1,131 @@
+import os
+import time
+
+from a2ml.api.auger.base import AugerBase
+from a2ml.api.auger.cloud.cluster import AugerClusterApi
+from a2ml.api.utils.file_lock import FileLock
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+LEASES_FILE = 'leases.json'
+REFRESH_INTERVAL = 10
+
+
+class AugerLease(AugerBase):
+    """Keep Project cluster running for the time of the lease.
+
+    Lease is stored next to credentials. First lease command runs
+    scheduler which restarts stopped Project and keeps autotermination
+    beyond the lease end. Next lease commands for the same Project just
+    extend the lease. When lease ends or is released autotermination
+    is restored to cluster/autoterminate_minutes."""
+
+    def __init__(self, ctx):
+        super(AugerLease, self).__init__(ctx)
+        self.leases_file = os.path.join(
+            self.credentials.creds_path, LEASES_FILE)
+        self.lock_file = '%s.lock' % self.leases_file
+        self.key = self.session_cache.key
+
+    @AugerBase._error_handler
+    def lease(self, hours=None, release=False):
+        # verify avalability of auger credentials
+        self.credentials.verify()
+
+        if release:
+            # running scheduler stops on its next refresh, autotermination
+            # is restored right away in case it is not running any more
+            self._update_lease(None)
+            self._restore_autoterminate()
+            self.ctx.log('Project lease is released')
+            return
+
+        until = time.time() + (hours or 1) * 3600
+        lease = self._update_lease(until)
+        self.ctx.log('Project is leased until %s' % self._format_time(
+            lease['until']))
+        if lease['pid'] != os.getpid():
+            self.ctx.log(
+                'Lease is maintained by running process %s' % lease['pid'])
+            return
+
+        self._run_scheduler()
+
+    def _run_scheduler(self):
+        interval = self.ctx.get_config('auger').get(
+            'lease/refresh_interval', REFRESH_INTERVAL)
+        try:
+            while True:
+                lease = self._get_lease()
+                if lease is None or lease['pid'] != os.getpid() or \
+                    lease['until'] <= time.time():
+                    break
+                self._refresh(lease['until'])
+                time.sleep(min(interval * 60,
+                    max(lease['until'] - time.time(), 0)))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._release()
+
+    def _refresh(self, until):
+        self._ensure_org_and_project()
+        if not self.project_api.is_running():
+            self.ctx.log('Project is not running, starting...')
+            self._start_project()
+        # keep project running a bit longer than the lease
+        minutes = int((until - time.time()) / 60) + \
+            self._get_autoterminate_minutes()
+        self.project_api.set_autoterminate(minutes)
+
+    def _release(self):
+        lease = self._get_lease()
+        if lease is not None and lease['pid'] == os.getpid():
+            self._update_lease(None)
+        self._restore_autoterminate()
+        self.ctx.log('Project lease ended, autotermination is restored')
+
+    def _restore_autoterminate(self):
+        self._ensure_org_and_project()
+        self.project_api.set_autoterminate(self._get_autoterminate_minutes())
+
+    def _get_autoterminate_minutes(self):
+        return AugerClusterApi.get_cluster_settings(
+            self.ctx).get('autoterminate_minutes')
+
+    def _get_lease(self):
+        return self._load().get(self.key)
+
+    def _update_lease(self, until):
+        with FileLock(self.lock_file):
+            leases = self._load()
+            lease = leases.get(self.key)
+            if until is None:
+                leases.pop(self.key, None)
+            else:
+                if lease is None or not self._is_alive(lease['pid']):
+                    lease = {'until': until, 'pid': os.getpid()}
+                else:
+                    lease['until'] = max(lease['until'], until)
+                leases[self.key] = lease
+            self._save(leases)
+        return lease
+
+    def _load(self):
+        return load_json(self.leases_file, {})
+
+    def _save(self, leases):
+        save_json(self.leases_file, leases)
+
+    @staticmethod
+    def _is_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    @staticmethod
+    def _format_time(timestamp):
+        return time.strftime('%Y-%m-%d %H:%M', time.localtime(timestamp))
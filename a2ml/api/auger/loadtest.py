@@ -0,0 +1,148 @@
+import time
+import random
+import threading
+
+from a2ml.api.auger.base import AugerBase
+from a2ml.api.auger.cloud.data_set import AugerDataSetApi
+from a2ml.api.auger.cloud.pipeline import AugerPipelineApi
+from a2ml.api.auger.cloud.utils.exception import AugerException
+from a2ml.api.auger.cloud.utils.synthetic_data import SyntheticData
+from a2ml.api.utils.formatter import print_table
+from a2ml.api.utils.stats import LatencyStats
+
+# schema and behaviour of the stand-in model
+STAND_IN_SCHEMA = [
+    {'column_name': 'number', 'datatype': 'float', 'min': 0, 'max': 100},
+    {'column_name': 'count', 'datatype': 'integer', 'min': 0, 'max': 10},
+    {'column_name': 'category', 'datatype': 'categorical',
+     'unique_values': 5}]
+STAND_IN_LATENCY = 0.05
+STAND_IN_ERROR_RATE = 0.01
+# distinct error messages logged after load test
+MAX_ERRORS_LOGGED = 5
+
+
+class AugerLoadTest(AugerBase):
+    """Measure throughput and latency of deployed model."""
+
+    def __init__(self, ctx):
+        super(AugerLoadTest, self).__init__(ctx)
+
+    @AugerBase._error_handler
+    def loadtest(self, model_id, rps=None, concurrency=4, duration=60,
+        batch_size=10, stand_in=False):
+        if stand_in:
+            self.ctx.log('Running load test against local stand-in model')
+            synthetic_data = SyntheticData(STAND_IN_SCHEMA)
+            predict = self._stand_in_predict
+        else:
+            # verify avalability of auger credentials
+            self.credentials.verify()
+            if model_id is None:
+                raise AugerException('Please provide model id to load test')
+
+            synthetic_data = self._get_synthetic_data()
+            pipeline_api = AugerPipelineApi(self.ctx, None, model_id)
+            if pipeline_api.properties().get('status') != 'ready':
+                raise AugerException(
+                    'Model %s is not ready or has issues...' % model_id)
+
+            def predict(df):
+                pipeline_api.predict(df.values.tolist(),
+                    df.columns.tolist(), check_status=False)
+
+        self.ctx.log('Load testing with %s for %s seconds' % (
+            '%s requests/s' % rps if rps else
+            '%s parallel requests' % concurrency, duration))
+
+        report = self.run(predict, synthetic_data,
+            rps, concurrency, duration, batch_size)
+        print_table(self.ctx.log, [report])
+        return report
+
+    def run(self, predict, synthetic_data,
+        rps, concurrency, duration, batch_size):
+        latencies = LatencyStats()
+        lock = threading.Lock()
+        counters = {'requests': 0, 'errors': 0, 'rows': 0}
+        errors = {}
+        started = time.time()
+        stop_at = started + duration
+        schedule = {'next': started}
+
+        def wait_for_slot():
+            # with rps set, requests are started on a fixed schedule
+            with lock:
+                slot = schedule['next']
+                schedule['next'] += 1.0 / rps
+            if slot >= stop_at:
+                return None
+            time.sleep(max(0, slot - time.time()))
+            return slot
+
+        def worker():
+            while time.time() < stop_at:
+                with lock:
+                    df = synthetic_data.generate(batch_size)
+                if rps:
+                    # latency is measured from the scheduled send time,
+                    # so waiting for a busy worker counts as well
+                    request_started = wait_for_slot()
+                    if request_started is None:
+                        return
+                else:
+                    request_started = time.time()
+                try:
+                    predict(df)
+                    latencies.record(time.time() - request_started)
+                    error = 0
+                except Exception as e:
+                    error = 1
+                    with lock:
+                        errors[str(e)] = errors.get(str(e), 0) + 1
+                with lock:
+                    counters['requests'] += 1
+                    counters['errors'] += error
+                    counters['rows'] += batch_size * (1 - error)
+
+        threads = [threading.Thread(target=worker)
+            for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.time() - started
+
+        for message, count in sorted(errors.items(),
+            key=lambda error: -error[1])[:MAX_ERRORS_LOGGED]:
+            self.ctx.log('%s failed requests: %s' % (count, message))
+
+        report = {
+            'requests': counters['requests'],
+            'error rate': '%.3f' % (float(counters['errors']) / \
+                counters['requests'] if counters['requests'] else 0),
+            'rows/s': '%.1f' % (counters['rows'] / elapsed)}
+        report.update(latencies.report())
+        return report
+
+    def _get_synthetic_data(self):
+        data_set_name = self.ctx.get_config('auger').get('dataset')
+        if data_set_name is None:
+            raise AugerException(
+                'Plese specify DataSet name in auger.yaml/dataset')
+        config = self.ctx.get_config('config')
+
+        self._ensure_org_and_project()
+        data_set_properties = AugerDataSetApi(
+            self.ctx, self.project_api, data_set_name).properties()
+        if data_set_properties is None:
+            raise AugerException(
+                'Can\'t find DataSet %s on Auger Cloud' % data_set_name)
+        return SyntheticData.from_data_set(data_set_properties,
+            config.get('target'), config.get('exclude', []))
+
+    @staticmethod
+    def _stand_in_predict(df):
+        time.sleep(random.expovariate(1.0 / STAND_IN_LATENCY))
+        if random.random() < STAND_IN_ERROR_RATE:
+            raise Exception('Stand-in model error')
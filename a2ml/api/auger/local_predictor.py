@@ -0,0 +1,182 @@
+import os
+import time
+import uuid
+import pandas
+import requests
+import subprocess
+
+from a2ml.api.auger.model_store import AugerModelStore
+from a2ml.api.auger.cloud.cluster import AugerClusterApi
+from a2ml.api.auger.cloud.utils.dataframe import DataFrame
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+SERVER_PORT = 8080
+START_TIMEOUT = 300
+START_POLL_INTERVAL = 1
+# time for container started by other process to publish its port
+CONFLICT_TIMEOUT = 10
+
+
+class AugerLocalPredictor(object):
+    """Warm local model server running in auger-ml-worker container.
+
+    Container is started once per model and stays alive until it has been
+    idle for local_predictor/idle_timeout minutes (auger.yaml)."""
+
+    def __init__(self, ctx, model_id, model_path):
+        super(AugerLocalPredictor, self).__init__()
+        self.ctx = ctx
+        self.model_id = model_id
+        self.model_path = model_path
+        # model path is unique per model id and checksum
+        self.container_name = 'a2ml-model-%s' % os.path.basename(model_path)
+        self.exchange_path = self.get_exchange_path(ctx)
+        self.url = None
+
+    @staticmethod
+    def is_enabled(ctx):
+        return ctx.get_config('auger').get('local_predictor/warm', True)
+
+    @staticmethod
+    def use_arrow(ctx):
+        data_format = ctx.get_config('auger').get(
+            'local_predictor/data_format', 'json')
+        return data_format == 'arrow'
+
+    @staticmethod
+    def get_exchange_path(ctx):
+        return os.path.join(AugerModelStore(ctx).path, 'exchange')
+
+    def start(self):
+        port = self._get_port()
+        if port is None:
+            docker_tag = AugerClusterApi.get_cluster_settings(
+                self.ctx).get('kubernetes_stack')
+            self.ctx.log(
+                'Starting local model server in deeplearninc/'
+                'auger-ml-worker:%s' % docker_tag)
+            self._docker_run_server(docker_tag)
+            port = self._get_port()
+            if port is None:
+                raise AugerException('Can\'t start local model server...')
+
+        self.url = 'http://127.0.0.1:%s' % port
+        self._wait_for_server()
+        return self.url
+
+    def stop(self):
+        if self._get_port() is not None:
+            subprocess.call(
+                'docker stop %s' % self.container_name,
+                stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT,
+                shell=True)
+
+    def predict_frame(self, df, threshold=None):
+        if not self.use_arrow(self.ctx):
+            return pandas.DataFrame.from_dict(self.predict(
+                df.values.tolist(), df.columns.tolist(), threshold))
+
+        # pass data through Arrow files in folder mounted to container
+        if not os.path.exists(self.exchange_path):
+            os.makedirs(self.exchange_path)
+        path_to_predict = os.path.join(
+            self.exchange_path, '%s.arrow' % uuid.uuid4().hex)
+        predicted = None
+        try:
+            DataFrame.save_arrow(path_to_predict, df)
+            predicted = os.path.join(self.exchange_path, self._request({
+                'path_to_predict': os.path.basename(path_to_predict),
+                'threshold': threshold}))
+            return DataFrame.load_arrow(predicted)
+        finally:
+            for name in [path_to_predict, predicted]:
+                if name and os.path.isfile(name):
+                    os.remove(name)
+
+    def predict(self, records, features, threshold=None):
+        return self._request({
+            'records': records, 'features': features, 'threshold': threshold})
+
+    def _request(self, request):
+        if self.url is None:
+            self.start()
+
+        try:
+            res = requests.post('%s/predict' % self.url, json=request)
+        except requests.exceptions.ConnectionError:
+            # server could have been stopped on idle timeout
+            self.start()
+            res = requests.post('%s/predict' % self.url, json=request)
+
+        content = res.json()
+        if res.status_code != 200:
+            raise AugerException(
+                'Local model server error: %s' % content.get('error'))
+
+        return content.get('result')
+
+    def _docker_run_server(self, docker_tag):
+        if not os.path.exists(self.exchange_path):
+            os.makedirs(self.exchange_path)
+        server_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__), 'template'))
+        idle_timeout = self.ctx.get_config('auger').get(
+            'local_predictor/idle_timeout', 30)
+
+        command = (r"docker run -d --rm --name {name} --label {label} "
+            "-p 127.0.0.1::{port} "
+            "-v {model_path}:/var/src/auger-ml-worker/exported_model "
+            "-v {server_path}:/var/src/auger-ml-worker/a2ml_server "
+            "-v {exchange_path}:/var/src/auger-ml-worker/exchange "
+            "deeplearninc/auger-ml-worker:{docker_tag} "
+            "python ./a2ml_server/predict_server.py "
+            "--port={port} --idle_timeout={idle_timeout}").format(
+                name=self.container_name, port=SERVER_PORT,
+                label=AugerModelStore.get_docker_label(self.model_path),
+                model_path=self.model_path, server_path=server_path,
+                exchange_path=self.exchange_path, docker_tag=docker_tag,
+                idle_timeout=int(idle_timeout * 60))
+
+        try:
+            subprocess.check_call(
+                command, stdout=subprocess.DEVNULL, shell=True)
+        except subprocess.CalledProcessError as e:
+            # container name is taken if other process
+            # started the same model at the same time
+            if not self._wait_for_port(CONFLICT_TIMEOUT):
+                raise AugerException('Error running Docker container...')
+
+    def _get_port(self):
+        try:
+            output = subprocess.check_output(
+                'docker port %s %s' % (self.container_name, SERVER_PORT),
+                stderr=subprocess.DEVNULL, shell=True)
+        except subprocess.CalledProcessError as e:
+            return None
+
+        # output looks like 127.0.0.1:32768
+        lines = output.decode('utf-8').strip().splitlines()
+        return lines[0].split(':')[-1] if lines else None
+
+    def _wait_for_port(self, timeout):
+        started = time.time()
+        while True:
+            if self._get_port() is not None:
+                return True
+            if time.time() - started >= timeout:
+                return False
+            time.sleep(START_POLL_INTERVAL)
+
+    def _wait_for_server(self):
+        started = time.time()
+        while time.time() - started < START_TIMEOUT:
+            try:
+                if requests.get('%s/health' % self.url).status_code == 200:
+                    return
+            except requests.exceptions.ConnectionError:
+                pass
+            time.sleep(START_POLL_INTERVAL)
+
+        raise AugerException(
+            'Local model server %s didn\'t start in %s seconds...' % \
+            (self.container_name, START_TIMEOUT))
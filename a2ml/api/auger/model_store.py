@@ -0,0 +1,173 @@
+import os
+import glob
+import time
+import shutil
+import hashlib
+import tempfile
+import subprocess
+from zipfile import ZipFile
+
+from a2ml.api.utils.file_lock import FileLock
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+# docker label of containers running extracted model
+MODEL_LABEL = 'a2ml-model'
+
+
+class AugerModelStore(object):
+    """Local store of downloaded and extracted models.
+
+    Models are extracted once per model id and zip checksum and reused by
+    subsequent runs and processes. Store is kept under local_models/max_size
+    megabytes (auger.yaml) by removing least recently used models, which
+    are not used by running containers."""
+
+    def __init__(self, ctx):
+        super(AugerModelStore, self).__init__()
+        self.ctx = ctx
+        config = ctx.get_config('auger')
+        self.path = os.path.abspath(config.get(
+            'local_models/path', os.path.join(os.getcwd(), 'models')))
+        self.max_size = config.get('local_models/max_size', 4096) * 1024 * 1024
+        self.index_file = os.path.join(self.path, 'index.json')
+        self.lock_file = os.path.join(self.path, '.lock')
+
+    def get_model_file(self, model_id):
+        return os.path.join(self.path, 'model-%s.zip' % model_id)
+
+    @staticmethod
+    def get_docker_label(model_path):
+        return '%s=%s' % (MODEL_LABEL, os.path.basename(model_path))
+
+    def is_loaded(self, model_id):
+        if os.path.isfile(self.get_model_file(model_id)):
+            return True
+        model = self._load_index().get(str(model_id))
+        return model is not None and os.path.isdir(model.get('path', ''))
+
+    def extract(self, model_id):
+        model_file = self.get_model_file(model_id)
+
+        with FileLock(self.lock_file):
+            index = self._load_index()
+            model = index.get(str(model_id), {})
+
+            if os.path.isfile(model_file):
+                checksum = self._get_checksum(model_file, model)
+            else:
+                checksum = model.get('checksum')
+            if checksum is None:
+                raise AugerException(
+                    'Model %s isn\'t loaded locally...' % model_id)
+
+            model_path = os.path.join(
+                self.path, 'extracted', '%s-%s' % (model_id, checksum[:12]))
+            if model.get('path') != model_path or \
+                not os.path.isdir(model_path):
+                self._extract_zip(model_file, model_path)
+                if model.get('path') and model.get('path') != model_path:
+                    shutil.rmtree(model['path'], ignore_errors=True)
+                model.update({
+                    'checksum': checksum,
+                    'path': model_path,
+                    'size': self._get_dir_size(model_path)})
+
+            model['last_used'] = time.time()
+            index[str(model_id)] = model
+            self._evict(index, keep=str(model_id))
+            self._save_index(index)
+
+        return model_path
+
+    def _get_checksum(self, model_file, model):
+        # zip checksum is recomputed only if zip file was changed
+        stat = os.stat(model_file)
+        if model.get('checksum') and \
+            model.get('zip_size') == stat.st_size and \
+            model.get('zip_mtime') == stat.st_mtime:
+            return model['checksum']
+
+        sha256 = hashlib.sha256()
+        with open(model_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
+                sha256.update(chunk)
+
+        model.update({'zip_size': stat.st_size, 'zip_mtime': stat.st_mtime})
+        return sha256.hexdigest()
+
+    def _extract_zip(self, model_file, model_path):
+        # extract into temp folder and move it in place,
+        # so other processes never see partially extracted model
+        extracted_path = os.path.dirname(model_path)
+        if not os.path.exists(extracted_path):
+            os.makedirs(extracted_path)
+        temp_path = tempfile.mkdtemp(dir=extracted_path)
+        try:
+            with ZipFile(model_file, 'r') as zip_file:
+                zip_file.extractall(temp_path)
+            shutil.rmtree(model_path, ignore_errors=True)
+            os.rename(temp_path, model_path)
+        except:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+
+    def _evict(self, index, keep):
+        models = dict((model_id, {
+            'path': model.get('path'),
+            'size': model.get('size', 0) + model.get('zip_size', 0),
+            'last_used': model['last_used']})
+            for model_id, model in index.items())
+        # downloaded models which were never extracted
+        for model_file in glob.glob(self.get_model_file('*')):
+            model_id = os.path.basename(model_file)[len('model-'):-len('.zip')]
+            if model_id not in models:
+                models[model_id] = {'path': None,
+                    'size': os.path.getsize(model_file),
+                    'last_used': os.path.getmtime(model_file)}
+
+        total_size = sum(model['size'] for model in models.values())
+        lru = sorted(models, key=lambda model_id: \
+            models[model_id]['last_used'])
+        for model_id in lru:
+            if total_size <= self.max_size:
+                break
+            model = models[model_id]
+            if model_id == keep or self._is_in_use(model['path']):
+                continue
+            self.ctx.log('Removing least recently used model %s' % model_id)
+            total_size -= model['size']
+            if model['path']:
+                shutil.rmtree(model['path'], ignore_errors=True)
+            model_file = self.get_model_file(model_id)
+            if os.path.isfile(model_file):
+                os.remove(model_file)
+            index.pop(model_id, None)
+
+    def _is_in_use(self, model_path):
+        if not model_path:
+            return False
+        try:
+            output = subprocess.check_output(
+                'docker ps -q --filter label=%s' % \
+                self.get_docker_label(model_path),
+                stderr=subprocess.DEVNULL, shell=True)
+        except (subprocess.CalledProcessError, OSError):
+            # there are no running containers without docker
+            return False
+        return len(output.strip()) > 0
+
+    def _load_index(self):
+        return load_json(self.index_file, {})
+
+    def _save_index(self, index):
+        save_json(self.index_file, index)
+
+    @staticmethod
+    def _get_dir_size(path):
+        size = 0
+        for root, dirs, files in os.walk(path):
+            for name in files:
+                size += os.path.getsize(os.path.join(root, name))
+        return size
@@ -0,0 +1,184 @@
+import time
+import math
+import pandas
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+from a2ml.api.auger.cloud.pipeline import AugerPipelineApi
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+# weight of the last request in average pipeline latency
+LATENCY_DECAY = 0.3
+
+
+class PoolMember(object):
+    """Pipeline in the pool with its load and latency stats."""
+
+    def __init__(self, pipeline_api):
+        super(PoolMember, self).__init__()
+        self.pipeline_api = pipeline_api
+        self.outstanding = 0
+        self.latency = None
+        self.requests = 0
+        self.rows = 0
+
+    @property
+    def pipeline_id(self):
+        return self.pipeline_api.object_id
+
+    def update_latency(self, latency):
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = LATENCY_DECAY * latency + \
+                (1 - LATENCY_DECAY) * self.latency
+
+
+class AugerPipelinePool(object):
+    """Spread prediction batches over several deployed pipelines.
+
+    Each batch goes to the pipeline with least outstanding requests,
+    ties are broken by average latency. Pipelines which are not ready
+    are ejected from the pool and failed batch is sent to the next one.
+    Failures of ready pipelines (like bad data) are raised. With
+    predict/hedge_delay batch without result after that many seconds
+    is sent to one more pipeline and the first result is used."""
+
+    def __init__(self, ctx, pipeline_ids):
+        super(AugerPipelinePool, self).__init__()
+        self.ctx = ctx
+        self.members = [PoolMember(AugerPipelineApi(ctx, None, pipeline_id))
+            for pipeline_id in pipeline_ids]
+        self.lock = threading.Lock()
+        self.is_checked = False
+        config = ctx.get_config('auger')
+        self.batch_size = config.get('predict/batch_size', None)
+        self.workers = config.get('predict/workers', None)
+        self.hedge_delay = config.get('predict/hedge_delay', None)
+        self.hedged = 0
+
+    def check_health(self):
+        for member in list(self.members):
+            status = self._get_status(member)
+            if status != 'ready':
+                self._eject(member, 'status is %s' % status)
+        self.is_checked = True
+
+        if len(self.members) == 0:
+            raise AugerException('There are no ready pipelines to predict...')
+
+    def predict(self, df, threshold=None, log_stats=True):
+        if not self.is_checked:
+            self.check_health()
+
+        batches = self._split(df)
+        workers = self.workers or len(self.members)
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if self.hedge_delay:
+                # hedged requests run on their own threads,
+                # slower duplicates are not waited for
+                hedger = ThreadPoolExecutor(max_workers=workers * 2)
+                try:
+                    results = list(executor.map(
+                        lambda batch: self._predict_hedged(
+                            hedger, batch, threshold), batches))
+                finally:
+                    hedger.shutdown(wait=False)
+            else:
+                results = list(executor.map(
+                    lambda batch: self._predict_batch(batch, threshold),
+                    batches))
+
+        if log_stats:
+            self._log_stats(len(df), time.time() - started)
+        return pandas.concat(results, ignore_index=True)
+
+    def _split(self, df):
+        batch_size = self.batch_size
+        if not batch_size:
+            # one batch per pipeline
+            batch_size = max(1, int(math.ceil(
+                float(len(df)) / len(self.members))))
+        return [df[i:i + batch_size] for i in range(0, len(df), batch_size)]
+
+    def _predict_hedged(self, executor, batch, threshold):
+        futures = [executor.submit(self._predict_batch, batch, threshold)]
+        done, _ = wait(futures, timeout=self.hedge_delay)
+        if not done and len(self.members) > 1:
+            with self.lock:
+                self.hedged += 1
+            futures.append(
+                executor.submit(self._predict_batch, batch, threshold))
+
+        error = None
+        for future in as_completed(futures):
+            try:
+                return future.result()
+            except Exception as e:
+                error = e
+        raise error
+
+    def _predict_batch(self, batch, threshold):
+        while True:
+            member = self._acquire()
+            started = time.time()
+            try:
+                result = member.pipeline_api.predict(
+                    batch.values.tolist(), batch.columns.tolist(),
+                    threshold, check_status=False)
+            except Exception as e:
+                self._release(member)
+                status = self._get_status(member)
+                if status == 'ready':
+                    # pipeline is fine, so request itself is wrong
+                    raise
+                self._eject(member, '%s (status is %s)' % (str(e), status))
+                continue
+
+            self._release(member, time.time() - started, len(batch))
+            return pandas.DataFrame.from_dict(result)
+
+    @staticmethod
+    def _get_status(member):
+        try:
+            return member.pipeline_api.properties().get('status')
+        except Exception as e:
+            return str(e)
+
+    def _acquire(self):
+        with self.lock:
+            if len(self.members) == 0:
+                raise AugerException(
+                    'All pipelines failed to predict...')
+            member = min(self.members, key=lambda m:
+                (m.outstanding, m.latency or 0))
+            member.outstanding += 1
+            return member
+
+    def _release(self, member, latency=None, rows=0):
+        with self.lock:
+            member.outstanding -= 1
+            if latency is not None:
+                member.update_latency(latency)
+                member.requests += 1
+                member.rows += rows
+
+    def _eject(self, member, reason):
+        with self.lock:
+            if member in self.members:
+                self.members.remove(member)
+                self.ctx.log('Removing pipeline %s from prediction: %s' % \
+                    (member.pipeline_id, reason))
+
+    def _log_stats(self, rows, duration):
+        for member in self.members:
+            if member.requests:
+                self.ctx.log(
+                    'Pipeline %s: %s requests, %s rows, %.2fs latency' % \
+                    (member.pipeline_id, member.requests, member.rows,
+                     member.latency))
+        if self.hedged:
+            self.ctx.log('Hedged requests: %s' % self.hedged)
+        self.ctx.log('Predicted %s rows in %.2fs (%.1f rows/s)' % \
+            (rows, duration, rows / duration if duration else 0))
@@ -1,15 +1,27 @@
 import os
-import shutil
+import glob
+import time
+import uuid
+import pandas
 import subprocess
-from zipfile import ZipFile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from a2ml.api.auger.base import AugerBase
 from a2ml.api.auger.deploy import AugerDeploy
+from a2ml.api.auger.model_store import AugerModelStore
+from a2ml.api.auger.predict_watch import PredictWatcher
+from a2ml.api.auger.pipeline_pool import AugerPipelinePool
+from a2ml.api.auger.local_predictor import AugerLocalPredictor
 from a2ml.api.auger.cloud.cluster import AugerClusterApi
 from a2ml.api.auger.cloud.pipeline import AugerPipelineApi
-from a2ml.api.auger.cloud.utils.dataframe import DataFrame
+from a2ml.api.auger.cloud.utils.dataframe import \
+    DataFrame, ARROW_FORMATS, PARQUET_FORMATS
 from a2ml.api.auger.cloud.utils.exception import AugerException
 
+PREDICT_FORMATS = ['.csv'] + ARROW_FORMATS + PARQUET_FORMATS
+FILE_WORKERS = 4
+WATCH_INTERVAL = 10
+
 class AugerPredict(AugerBase):
     """Predict using deployed Auger Pipeline."""
 
@@ -21,6 +33,11 @@ class AugerPredict(AugerBase):
         # verify avalability of auger credentials
         self.credentials.verify()
 
+        files = self._get_files(filename)
+        if len(files) > 1:
+            return self._predict_files(files, model_id, threshold, locally)
+        filename = files[0]
+
         self.ctx.log('Predicting on data in %s' % filename)
         filename = os.path.abspath(filename)
 
@@ -30,67 +47,275 @@ class AugerPredict(AugerBase):
             predicted = self._predict_on_cloud(filename, model_id, threshold)
 
         self.ctx.log('Predictions stored in %s' % predicted)
+        return predicted
+
+    @AugerBase._error_handler
+    def predict_frame(self, data, model_id, threshold=None, locally=False):
+        # verify avalability of auger credentials
+        self.credentials.verify()
+
+        target = self.ctx.config['config'].get('target', None)
+        df = DataFrame.from_data(data, target)
+        self.ctx.log('Predicting on %s rows' % len(df))
+
+        predict_frame = self._get_frame_predictor(model_id, locally)
+        return predict_frame(df, threshold)
+
+    @AugerBase._error_handler
+    def watch(self, directory, model_id, threshold=None, locally=False,
+        interval=None):
+        # verify avalability of auger credentials
+        self.credentials.verify()
+
+        if not os.path.isdir(directory):
+            raise AugerException('Can\'t find directory %s' % directory)
+        if interval is None:
+            interval = self.ctx.config['auger'].get(
+                'predict/watch_interval', WATCH_INTERVAL)
+
+        # model is kept warm while watching
+        predict_frame = self._get_frame_predictor(model_id, locally)
+        PredictWatcher(self.ctx, directory, interval, self._is_data_file).run(
+            lambda files: self._run_predict_files(
+                files, predict_frame, threshold))
+
+    def _predict_files(self, files, model_id, threshold, locally):
+        # files share the same pipeline or local model server
+        predict_frame = self._get_frame_predictor(model_id, locally)
+        results, errors = self._run_predict_files(
+            files, predict_frame, threshold)
+        return [results[f] for f in files if f in results]
+
+    def _run_predict_files(self, files, predict_frame, threshold):
+        target = self.ctx.config['config'].get('target', None)
+        workers = self.ctx.config['auger'].get(
+            'predict/file_workers', FILE_WORKERS)
+
+        def predict_file(filename):
+            df = DataFrame.load(filename, target)
+            predicted = self._get_predicted_name(filename)
+            DataFrame.save(predicted, predict_frame(df, threshold))
+            return predicted, len(df)
+
+        self.ctx.log('Predicting on data in %s files' % len(files))
+        results, errors, rows = {}, {}, 0
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = dict(
+                (executor.submit(predict_file, f), f) for f in files)
+            for future in as_completed(futures):
+                try:
+                    predicted, file_rows = future.result()
+                except Exception as e:
+                    errors[futures[future]] = str(e)
+                    self.ctx.log('Failed to predict %s: %s' % \
+                        (futures[future], str(e)))
+                    continue
+                results[futures[future]] = predicted
+                rows += file_rows
+                self.ctx.log('Predictions stored in %s' % predicted)
+
+        duration = time.time() - started
+        self.ctx.log(
+            'Predicted %s rows in %s files in %.2fs (%.1f rows/s)' % \
+            (rows, len(results), duration, rows / duration if duration else 0))
+        if errors:
+            self.ctx.log('Failed to predict %s files' % len(errors))
+
+        return results, errors
+
+    def _get_frame_predictor(self, model_id, locally):
+        """Returns function predicting on DataFrame with given model."""
+        if locally:
+            model_path = self._get_local_model_path(model_id)
+            if AugerLocalPredictor.is_enabled(self.ctx):
+                predictor = AugerLocalPredictor(
+                    self.ctx, model_id, model_path)
+                predictor.start()
+                return predictor.predict_frame
+
+            return lambda df, threshold: \
+                self._docker_run_predict_frame(df, threshold, model_path)
+
+        pipeline_ids = self._get_pipeline_ids(model_id)
+        if len(pipeline_ids) > 1:
+            pool = AugerPipelinePool(self.ctx, pipeline_ids)
+            pool.check_health()
+            return lambda df, threshold: \
+                pool.predict(df, threshold, log_stats=False)
+
+        pipeline_api = AugerPipelineApi(self.ctx, None, pipeline_ids[0])
+        pipeline_api.check_ready()
+        return lambda df, threshold: \
+            pandas.DataFrame.from_dict(pipeline_api.predict(
+                df.values.tolist(), df.columns.tolist(),
+                threshold, check_status=False))
+
+    @staticmethod
+    def _get_files(filename):
+        # filename could be a list, a directory or glob pattern
+        if isinstance(filename, (list, tuple)):
+            return [f for name in filename
+                for f in AugerPredict._get_files(name)]
+
+        if os.path.isdir(filename):
+            pattern = os.path.join(filename, '*')
+        elif glob.has_magic(filename):
+            pattern = filename
+        else:
+            return [os.path.abspath(filename)]
+
+        files = [os.path.abspath(f) for f in sorted(glob.glob(pattern))
+            if os.path.isfile(f) and AugerPredict._is_data_file(f)]
+        if len(files) == 0:
+            raise AugerException('There are no files to predict in %s' % \
+                filename)
+        return files
+
+    @staticmethod
+    def _is_data_file(filename):
+        # skip unsupported files and prediction results
+        name, extension = os.path.splitext(os.path.basename(filename))
+        return extension in PREDICT_FORMATS and \
+            not name.endswith('_predicted')
 
     def _predict_on_cloud(self, filename, model_id, threshold=None):
         target = self.ctx.config['config'].get('target', None)
         df = DataFrame.load(filename, target)
 
-        pipeline_api = AugerPipelineApi(self.ctx, None, model_id)
-        predictions = pipeline_api.predict(
-            df.values.tolist(), df.columns.get_values().tolist(), threshold)
+        predict_frame = self._get_frame_predictor(model_id, False)
+        predictions = predict_frame(df, threshold)
 
-        predicted = os.path.splitext(filename)[0] + "_predicted.csv"
+        predicted = self._get_predicted_name(filename)
         DataFrame.save(predicted, predictions)
 
         return predicted
 
+    @staticmethod
+    def _get_pipeline_ids(model_id):
+        # model id could be comma separated list of pipelines,
+        # pipelines should be of the same model to merge predictions
+        pipeline_ids = [m.strip() for m in (model_id or '').split(',')
+            if m.strip()]
+        if len(pipeline_ids) == 0:
+            raise AugerException('Please specify model id to predict'
+                ' (comma separated list of ids to use several pipelines).')
+        return pipeline_ids
+
     def _predict_locally(self, filename, model_id, threshold):
+        model_path = self._get_local_model_path(model_id)
+
+        if AugerLocalPredictor.is_enabled(self.ctx):
+            return self._predict_on_local_server(
+                filename, model_id, threshold, model_path)
+
+        return self._docker_run_predict(filename, threshold, model_path)
+
+    def _predict_on_local_server(
+        self, filename, model_id, threshold, model_path):
+        target = self.ctx.config['config'].get('target', None)
+        df = DataFrame.load(filename, target)
+
+        predictor = AugerLocalPredictor(self.ctx, model_id, model_path)
+        predictions = predictor.predict_frame(df, threshold)
+
+        predicted = self._get_predicted_name(filename)
+        DataFrame.save(predicted, predictions)
+
+        return predicted
+
+    def _get_local_model_path(self, model_id):
         is_model_loaded, model_path, model_name = \
-            AugerDeploy.verify_local_model(model_id)
+            AugerDeploy.verify_local_model(self.ctx, model_id)
 
         if not is_model_loaded:
             raise AugerException('Model isn\'t loaded locally. '
                 'Please use a2ml depoly command to download model.')
 
-        model_path, model_existed = self._exstract_model(model_name)
+        return AugerModelStore(self.ctx).extract(model_id)
 
-        try:
-            predicted = \
-                self._docker_run_predict(filename, threshold, model_path)
-        finally:
-            # clean up unzipped model
-            # if it wasn't unzipped before
-            if not model_existed:
-                shutil.rmtree(model_path, ignore_errors=True)
+    @staticmethod
+    def _get_predicted_name(filename):
+        # predictions are stored in the same format as data
+        name, extension = os.path.splitext(filename)
+        if not DataFrame.is_columnar(filename):
+            extension = '.csv'
+        return name + '_predicted' + extension
+
+    def _docker_run_predict(self, filename, threshold, model_path):
+        if AugerLocalPredictor.use_arrow(self.ctx) or \
+            DataFrame.is_columnar(filename):
+            return self._docker_run_predict_arrow(
+                filename, threshold, model_path)
+
+        result_file = os.path.basename(filename)
+        data_path = os.path.dirname(filename)
+        self._docker_run(model_path, data_path,
+            "./exported_model/client.py "
+            "--path_to_predict=./model_data/%s" % result_file, threshold)
+
+        return os.path.join(data_path,
+            os.path.splitext(result_file)[0] + "_predicted.csv")
+
+    def _docker_run_predict_arrow(self, filename, threshold, model_path):
+        target = self.ctx.config['config'].get('target', None)
+        df = DataFrame.load(filename, target)
+
+        predicted = self._get_predicted_name(filename)
+        DataFrame.save(predicted,
+            self._docker_run_predict_frame(df, threshold, model_path))
 
         return predicted
 
-    def _exstract_model(self, model_name):
-        model_path = os.path.splitext(model_name)[0]
-        model_existed = os.path.exists(model_path)
+    def _docker_run_predict_frame(self, df, threshold, model_path):
+        # pass data to container as Arrow file and run prediction
+        # with a2ml predict server script, without pyarrow installed
+        # pass it as CSV file to model client script
+        use_arrow = DataFrame.has_pyarrow()
+        extension = '.arrow' if use_arrow else '.csv'
+        script = './a2ml_server/predict_server.py' if use_arrow else \
+            './exported_model/client.py'
 
-        if not model_existed:
-            with ZipFile(model_name, 'r') as zip_file:
-                zip_file.extractall(model_path)
+        data_path = AugerLocalPredictor.get_exchange_path(self.ctx)
+        if not os.path.exists(data_path):
+            os.makedirs(data_path)
+        data_file = uuid.uuid4().hex + extension
+        path_to_predict = os.path.join(data_path, data_file)
+        result_file = os.path.splitext(path_to_predict)[0] + \
+            '_predicted' + extension
 
-        return model_path, model_existed
+        try:
+            DataFrame.save(path_to_predict, df)
+            self._docker_run(model_path, data_path,
+                "%s --path_to_predict=./model_data/%s" % (script, data_file),
+                threshold)
+            if use_arrow:
+                return DataFrame.load_arrow(result_file)
+            return pandas.read_csv(result_file, encoding='utf-8')
+        finally:
+            for name in [path_to_predict, result_file]:
+                if os.path.isfile(name):
+                    os.remove(name)
 
-    def _docker_run_predict(self, filename, threshold, model_path):
+    def _docker_run(self, model_path, data_path, script, threshold):
         cluster_settings = AugerClusterApi.get_cluster_settings(self.ctx)
         docker_tag = cluster_settings.get('kubernetes_stack')
-        result_file = os.path.basename(filename)
-        data_path = os.path.dirname(filename)
+        server_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__), 'template'))
 
-        call_args = "--path_to_predict=./model_data/%s %s" % \
-            (result_file, "--threshold=%s" % str(threshold) if threshold else '')
+        call_args = "%s %s" % \
+            (script, "--threshold=%s" % str(threshold) if threshold else '')
 
-        command = (r"docker run "
+        command = (r"docker run --label {label} "
             "-v {model_path}:/var/src/auger-ml-worker/exported_model "
             "-v {data_path}:/var/src/auger-ml-worker/model_data "
+            "-v {server_path}:/var/src/auger-ml-worker/a2ml_server "
             "deeplearninc/auger-ml-worker:{docker_tag} "
-            "python ./exported_model/client.py {call_args}").format(
+            "python {call_args}").format(
+                label=AugerModelStore.get_docker_label(model_path),
                 model_path=model_path, data_path=data_path,
-                docker_tag=docker_tag, call_args=call_args)
+                server_path=server_path, docker_tag=docker_tag,
+                call_args=call_args)
 
         try:
             self.ctx.log(
@@ -100,6 +325,3 @@ class AugerPredict(AugerBase):
                 command, stderr=subprocess.STDOUT, shell=True)
         except subprocess.CalledProcessError as e:
             raise AugerException('Error running Docker container...')
-
-        return os.path.join(data_path,
-            os.path.splitext(result_file)[0] + "_predicted.csv")
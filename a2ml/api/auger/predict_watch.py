@@ -0,0 +1,145 @@
+import os
+import time
+import hashlib
+
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+LEDGER_FILE = '.a2ml_predicted.json'
+READ_SIZE = 1024 * 1024
+# failed file is not predicted again until it is changed
+MAX_ATTEMPTS = 5
+
+
+class PredictLedger(object):
+    """Persistent record of predicted files with their size, mtime and hash.
+
+    Ledger is stored in the watched directory, so predictions are not
+    repeated after restart. Files which failed to predict are kept with
+    the error and are predicted again after a delay, which doubles with
+    each attempt. After MAX_ATTEMPTS they wait until the file changes."""
+
+    def __init__(self, directory):
+        super(PredictLedger, self).__init__()
+        self.path = os.path.join(directory, LEDGER_FILE)
+        self.files = load_json(self.path, {})
+
+    def is_unchanged(self, name, stat):
+        entry = self._get_predicted(name)
+        return entry is not None and \
+            [entry['size'], entry['mtime']] == list(stat)
+
+    def has_hash(self, name, sha256):
+        entry = self._get_predicted(name)
+        return entry is not None and entry['sha256'] == sha256
+
+    def is_failing(self, name, stat, interval):
+        entry = self.files.get(name)
+        if entry is None or not entry.get('error') or \
+            [entry['size'], entry['mtime']] != list(stat):
+            return False
+        attempts = entry.get('attempts', 1)
+        return attempts >= MAX_ATTEMPTS or \
+            time.time() < entry.get('failed_at', 0) + interval * 2 ** attempts
+
+    def _get_predicted(self, name):
+        entry = self.files.get(name)
+        if entry is None or entry.get('error'):
+            return None
+        return entry
+
+    def record(self, name, stat, sha256, predicted=None, error=None):
+        entry = {'size': stat[0], 'mtime': stat[1],
+            'sha256': sha256, 'predicted': predicted, 'error': error}
+        if error:
+            previous = self.files.get(name) or {}
+            attempts = 1
+            if previous.get('error') and previous.get('sha256') == sha256:
+                attempts = previous.get('attempts', 1) + 1
+            entry.update({'attempts': attempts, 'failed_at': time.time()})
+        self.files[name] = entry
+        return entry
+
+    def save(self):
+        save_json(self.path, self.files, indent=2)
+
+
+class PredictWatcher(object):
+    """Poll directory and predict on new or changed data files.
+
+    File is predicted once it hasn't changed between two polls,
+    so files which are still being written are not picked up."""
+
+    def __init__(self, ctx, directory, interval, is_data_file):
+        super(PredictWatcher, self).__init__()
+        self.ctx = ctx
+        self.directory = os.path.abspath(directory)
+        self.interval = interval
+        self.is_data_file = is_data_file
+        self.ledger = PredictLedger(self.directory)
+        self.last_seen = {}
+
+    def run(self, predict_files):
+        """predict_files gets list of files and returns dicts
+        of predicted file names and errors by data file."""
+        self.ctx.log('Watching %s for new data files...' % self.directory)
+        try:
+            while True:
+                self.poll(predict_files)
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            self.ctx.log('Stopped watching %s' % self.directory)
+
+    def poll(self, predict_files):
+        new_files = self._get_new_files()
+        if len(new_files) == 0:
+            return
+
+        files = [os.path.join(self.directory, name) for name in new_files]
+        results, errors = predict_files(files)
+        for name, filename in zip(new_files, files):
+            stat, sha256 = new_files[name]
+            entry = self.ledger.record(name, stat, sha256,
+                results.get(filename), errors.get(filename))
+            if entry.get('attempts', 0) >= MAX_ATTEMPTS:
+                self.ctx.log('%s failed %s times, it is predicted again '
+                    'when changed' % (name, entry['attempts']))
+        self.ledger.save()
+
+    def _get_new_files(self):
+        new_files, seen = {}, {}
+        for name in sorted(os.listdir(self.directory)):
+            filename = os.path.join(self.directory, name)
+            if not os.path.isfile(filename) or \
+                not self.is_data_file(filename):
+                continue
+
+            stat = self._stat(filename)
+            seen[name] = stat
+            if self.ledger.is_unchanged(name, stat) or \
+                self.ledger.is_failing(name, stat, self.interval) or \
+                self.last_seen.get(name) != stat:
+                continue
+
+            sha256 = self._hash(filename)
+            if self.ledger.has_hash(name, sha256):
+                # touched but not changed
+                self.ledger.record(name, stat, sha256,
+                    self.ledger.files[name].get('predicted'))
+                continue
+            new_files[name] = (stat, sha256)
+
+        self.last_seen = seen
+        return new_files
+
+    @staticmethod
+    def _stat(filename):
+        stat = os.stat(filename)
+        return (stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def _hash(filename):
+        sha256 = hashlib.sha256()
+        with open(filename, 'rb') as f:
+            for data in iter(lambda: f.read(READ_SIZE), b''):
+                sha256.update(data)
+        return sha256.hexdigest()
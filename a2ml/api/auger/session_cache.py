@@ -0,0 +1,69 @@
+import os
+import time
+
+from a2ml.api.utils.file_lock import FileLock
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+SESSION_FILE = 'session.json'
+SESSION_TTL = 300
+
+
+class AugerSessionCache(object):
+    """Short living cache of resolved organization and project.
+
+    Stored next to credentials and keyed by Auger url, organization
+    and project, so back to back commands skip name lookups. Entry is
+    valid for session_cache/ttl seconds (auger.yaml) and is removed
+    when command fails."""
+
+    def __init__(self, ctx, credentials):
+        super(AugerSessionCache, self).__init__()
+        self.ctx = ctx
+        self.cache_file = os.path.join(credentials.creds_path, SESSION_FILE)
+        self.lock_file = '%s.lock' % self.cache_file
+        self.ttl = ctx.get_config('auger').get(
+            'session_cache/ttl', SESSION_TTL)
+        self.key = '%s|%s|%s' % (credentials.api_url,
+            credentials.organisation, ctx.get_config('auger').get('project'))
+
+    def get(self):
+        if not self.ttl:
+            return None
+        entry = self._load().get(self.key)
+        if entry is None or time.time() - entry['updated'] > self.ttl:
+            return None
+        return entry
+
+    def update(self, **values):
+        if not self.ttl:
+            return
+        with FileLock(self.lock_file):
+            sessions = self._load()
+            entry = sessions.get(self.key) or {}
+            entry.update(values)
+            entry['updated'] = time.time()
+            sessions[self.key] = entry
+            # drop expired entries of other projects
+            sessions = dict((k, v) for k, v in sessions.items()
+                if time.time() - v['updated'] <= self.ttl)
+            self._save(sessions)
+
+    def invalidate(self):
+        if not os.path.isfile(self.cache_file):
+            return
+        with FileLock(self.lock_file):
+            sessions = self._load()
+            if sessions.pop(self.key, None) is not None:
+                self._save(sessions)
+
+    @staticmethod
+    def clear(credentials):
+        cache_file = os.path.join(credentials.creds_path, SESSION_FILE)
+        if os.path.isfile(cache_file):
+            os.remove(cache_file)
+
+    def _load(self):
+        return load_json(self.cache_file, {})
+
+    def _save(self, sessions):
+        save_json(self.cache_file, sessions)
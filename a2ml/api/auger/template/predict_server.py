@@ -0,0 +1,131 @@
+import os
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Prediction server, started inside deeplearninc/auger-ml-worker
+# container with exported model mounted to ./exported_model.
+#
+# In server mode model stays loaded between requests and server shuts down
+# after idle_timeout seconds without requests. With --path_to_predict
+# it predicts single Arrow file and exits.
+#
+# Data is passed either as json records or as Arrow IPC files in the
+# mounted exchange folder, which are memory mapped instead of parsed.
+
+from auger_ml.model_exporter import ModelExporter
+
+MODEL_PATH = './exported_model'
+EXCHANGE_PATH = './exchange'
+
+
+def predict(exporter, records, features, threshold=None):
+    result = exporter.predict_by_model(
+        model_path=MODEL_PATH, records=records,
+        features=features, threshold=threshold)
+    if hasattr(result, 'to_dict'):
+        result = result.to_dict('list')
+    return result
+
+
+def predict_file(exporter, path_to_predict, threshold=None):
+    import pandas
+    import pyarrow
+    import pyarrow.ipc
+
+    with pyarrow.memory_map(path_to_predict, 'r') as source:
+        df = pyarrow.ipc.open_file(source).read_all().to_pandas()
+    result = predict(
+        exporter, df.values.tolist(), df.columns.tolist(), threshold)
+
+    table = pyarrow.Table.from_pandas(
+        pandas.DataFrame.from_dict(result), preserve_index=False)
+    predicted = os.path.splitext(path_to_predict)[0] + '_predicted.arrow'
+    with pyarrow.OSFile(predicted, 'wb') as sink:
+        with pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return predicted
+
+
+class PredictServer(HTTPServer):
+
+    def __init__(self, port, idle_timeout):
+        HTTPServer.__init__(self, ('0.0.0.0', port), PredictHandler)
+        self.idle_timeout = idle_timeout
+        self.last_request = time.time()
+        self.exporter = ModelExporter({})
+        self.lock = threading.Lock()
+
+    def predict(self, request):
+        with self.lock:
+            if request.get('path_to_predict'):
+                path_to_predict = os.path.join(
+                    EXCHANGE_PATH,
+                    os.path.basename(request['path_to_predict']))
+                predicted = predict_file(self.exporter,
+                    path_to_predict, request.get('threshold'))
+                return os.path.basename(predicted)
+            else:
+                return predict(self.exporter,
+                    request.get('records'), request.get('features'),
+                    request.get('threshold'))
+
+    def watch_idle(self):
+        while True:
+            time.sleep(min(self.idle_timeout, 10))
+            if time.time() - self.last_request > self.idle_timeout:
+                self.shutdown()
+                return
+
+
+class PredictHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.server.last_request = time.time()
+        if self.path == '/health':
+            self._reply(200, {'status': 'ready'})
+        else:
+            self._reply(404, {'error': 'Unknown path %s' % self.path})
+
+    def do_POST(self):
+        self.server.last_request = time.time()
+        if self.path != '/predict':
+            self._reply(404, {'error': 'Unknown path %s' % self.path})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+            self._reply(200, {'result': self.server.predict(request)})
+        except Exception as e:
+            self._reply(500, {'error': str(e)})
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, code, content):
+        body = json.dumps(content, default=str).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--idle_timeout', type=int, default=1800)
+    parser.add_argument('--path_to_predict', default=None)
+    parser.add_argument('--threshold', type=float, default=None)
+    args = parser.parse_args()
+
+    if args.path_to_predict:
+        predict_file(ModelExporter({}), args.path_to_predict, args.threshold)
+    else:
+        server = PredictServer(args.port, args.idle_timeout)
+        watcher = threading.Thread(target=server.watch_idle)
+        watcher.daemon = True
+        watcher.start()
+        server.serve_forever()
@@ -14,18 +14,21 @@ class AugerTrain(AugerBase):
         # verify avalability of auger credentials
         self.credentials.verify()
 
-        self.start_project()
-
         data_set_name = self.ctx.config['auger'].get('dataset')
         if data_set_name is None:
             raise AugerException(
                 'Plese specify DataSet name in auger.yaml/dataset')
 
+        # experiment is created while cluster is starting
+        self.start_project(wait=False)
+
         experiment_api = AugerExperimentApi(self.ctx, self.project_api)
         experiment_api.create(data_set_name)
         self.ctx.log(
             'Created Experiment %s ' % experiment_api.object_name)
 
+        self.wait_for_project()
+
         experiment_session_id = experiment_api.run()
         self.ctx.log(
             'Started Experiment %s training.' % experiment_api.object_name)
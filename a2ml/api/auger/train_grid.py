@@ -0,0 +1,145 @@
+import os
+import time
+import pandas
+import threading
+import ruamel.yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from a2ml.api.auger.base import AugerBase
+from a2ml.api.auger.evaluate import ACTIVE_STATUSES, LEADERBOARD_SIZE
+from a2ml.api.auger.cloud.cluster import AugerClusterApi
+from a2ml.api.auger.cloud.experiment import AugerExperimentApi
+from a2ml.api.auger.cloud.experiment_session import AugerExperimentSessionApi
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+POLL_INTERVAL = 30
+
+
+class AugerTrainGrid(AugerBase):
+    """Train experiments listed in grid spec file.
+
+    Spec file is yaml with list of experiments, each has dataset
+    and optional target, model_type, exclude and auger.yaml/experiment
+    options overrides. Values in defaults apply to all experiments:
+
+        defaults:
+          max_n_trials: 100
+        experiments:
+          - dataset: sales
+            target: revenue
+            model_type: regression
+          - dataset: churn
+            target: churned
+            model_type: classification
+            metric: accuracy
+
+    Sessions run concurrently up to cluster worker capacity."""
+
+    def __init__(self, ctx):
+        super(AugerTrainGrid, self).__init__(ctx)
+        self.lock = threading.Lock()
+
+    @AugerBase._error_handler
+    def train_grid(self, spec_file, output=None):
+        # verify avalability of auger credentials
+        self.credentials.verify()
+
+        specs = self._load_spec(spec_file)
+        if output is None:
+            output = '%s_leaderboard.csv' % os.path.splitext(spec_file)[0]
+
+        self.start_project()
+
+        concurrency = self._get_concurrency()
+        self.ctx.log('Training %s experiments, %s at a time' % \
+            (len(specs), concurrency))
+
+        leaderboards, failed = [], 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = dict((executor.submit(self._train, spec), spec)
+                for spec in specs)
+            for future in as_completed(futures):
+                spec = futures[future]
+                try:
+                    leaderboards.append(future.result())
+                except Exception as e:
+                    failed += 1
+                    self.ctx.log('Experiment on %s failed: %s' % \
+                        (spec['dataset'], str(e)))
+                self.ctx.log('Finished %s of %s experiments' % \
+                    (len(leaderboards) + failed, len(specs)))
+
+        if leaderboards:
+            pandas.concat(leaderboards, ignore_index=True, sort=False).\
+                to_csv(output, index=False, encoding='utf-8')
+            self.ctx.log('Leaderboards stored in %s' % output)
+        return output
+
+    def _train(self, spec):
+        overrides = dict((k, v) for k, v in spec.items() if k != 'dataset')
+        experiment_api = AugerExperimentApi(self.ctx, self.project_api)
+        # experiment names are selected one at a time to keep them unique
+        with self.lock:
+            experiment_api.create(spec['dataset'])
+        experiment_name = experiment_api.object_name
+
+        experiment_session_id = experiment_api.run(overrides)
+        self.ctx.log('Started Experiment %s training' % experiment_name)
+
+        experiment_session_api = AugerExperimentSessionApi(
+            self.ctx, experiment_api, None, experiment_session_id)
+        status = experiment_session_api.status()
+        while status in ACTIVE_STATUSES:
+            time.sleep(self.ctx.config['auger'].get(
+                'grid/poll_interval', POLL_INTERVAL))
+            status = experiment_session_api.status()
+        self.ctx.log('Experiment %s is %s' % (experiment_name, status))
+
+        leaderboard = pandas.DataFrame(experiment_session_api.get_leaderboard(
+            self.ctx.config['auger'].get(
+                'experiment/leaderboard_size', LEADERBOARD_SIZE)))
+        for column, value in reversed([
+            ('experiment', experiment_name),
+            ('experiment session id', experiment_session_id),
+            ('dataset', spec['dataset']),
+            ('target', spec.get('target')),
+            ('status', status)]):
+            leaderboard.insert(0, column, value)
+        return leaderboard
+
+    def _get_concurrency(self):
+        config = self.ctx.config['auger']
+        concurrency = config.get('grid/max_concurrent', None)
+        if concurrency:
+            return concurrency
+
+        # workers capacity of the project cluster
+        settings = AugerClusterApi.get_cluster_settings(self.ctx)
+        if 'workers_count' in settings:
+            capacity = settings['workers_count']
+        else:
+            capacity = settings['worker_nodes_count'] * \
+                settings.get('workers_per_node_count', 1)
+        return max(1, capacity // config.get('grid/workers_per_session', 1))
+
+    @staticmethod
+    def _load_spec(spec_file):
+        if not os.path.isfile(spec_file):
+            raise AugerException('Can\'t find grid spec file %s' % spec_file)
+        with open(spec_file, 'r') as f:
+            spec = ruamel.yaml.safe_load(f) or {}
+
+        defaults = spec.get('defaults') or {}
+        specs = []
+        for experiment in spec.get('experiments') or []:
+            item = dict(defaults)
+            item.update(experiment)
+            if not item.get('dataset'):
+                raise AugerException(
+                    'Please specify dataset for each grid experiment...')
+            specs.append(item)
+
+        if len(specs) == 0:
+            raise AugerException(
+                'There are no experiments in %s' % spec_file)
+        return specs
@@ -158,7 +158,7 @@ class GoogleA2ML(object):
         else:
             self.ctx.log("Model still training...")
 
-    def deploy(self, model_id, locally=False):
+    def deploy(self, model_id, locally=False, wait=True):
         self.ctx.log('Google Deploy'.format(model_id))
         if (model_id is None):
             model_name = self.model_name
@@ -198,6 +198,8 @@ class GoogleA2ML(object):
                 self.ctx.log("Prediction: {}".format(prediction))
                 csvlist += (',' + str(prediction) + '\n')
                 predictions.write(csvlist) 
+        predictions.close()
+        return predictions_file
 
     def review(self):
         self.ctx.log('Google Review')
@@ -54,6 +54,9 @@ class ConfigYaml(Namespace):
     @staticmethod
     def _get(options, path, default):
         if len(path) == 0:
+            # explicit false or 0 is a value, not a missing option
+            if options is False or options == 0:
+                return options
             return options if options else default
         if hasattr(options, path[0]):
             return ConfigYaml._get(
@@ -0,0 +1,33 @@
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class FileLock(object):
+    """Exclusive inter-process lock on a file.
+
+    Used as context manager. Lock is advisory and is a no-op
+    on platforms without fcntl."""
+
+    def __init__(self, lock_file):
+        super(FileLock, self).__init__()
+        self.lock_file = lock_file
+        self.fd = None
+
+    def __enter__(self):
+        lock_dir = os.path.dirname(self.lock_file)
+        if lock_dir and not os.path.exists(lock_dir):
+            os.makedirs(lock_dir, exist_ok=True)
+        self.fd = open(self.lock_file, 'a')
+        if fcntl:
+            fcntl.flock(self.fd.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *args):
+        if fcntl:
+            fcntl.flock(self.fd.fileno(), fcntl.LOCK_UN)
+        self.fd.close()
+        self.fd = None
@@ -1,38 +1,153 @@
+import os
+import time
+import queue
 import importlib
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed, thread
 
+from a2ml.api.utils.stats import RaceStats
+from a2ml.api.utils.formatter import print_table
+from a2ml.api.auger.credentials import Credentials
+
+RACE_STATS_FILE = 'race_stats.json'
+
+
 class ProviderRunner(object):
     """Runner executes provider jobs on threads."""
 
     def __init__(self, ctx):
         super(ProviderRunner, self).__init__()
         self.ctx = ctx
+        self.provider_names = ctx.get_providers()
         self.providers = self._load_providers()
+        self.race_stats = RaceStats(self._get_race_stats_file())
 
     def execute(self, operation_name, *args, **kwargs):
+        """Run operation on all providers supporting it.
+
+        Returns dict of operation results by provider name."""
+        providers = self._get_operation_providers(operation_name)
+
         # if there is single operation requested
         # no need to run it on the thread
-        if len(self.providers) == 1:
-            getattr(self.providers[0], operation_name)(*args, **kwargs)
-            return
+        if len(providers) == 1:
+            name, provider = providers[0]
+            return {name: getattr(provider, operation_name)(*args, **kwargs)}
 
-        with ThreadPoolExecutor(max_workers=len(self.providers)) as executor:
-            futures = [
-                executor.submit(getattr(p, operation_name), *args, **kwargs)
-                for p in self.providers]
+        results = {}
+        if len(providers) == 0:
+            return results
+
+        with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+            futures = dict(
+                (executor.submit(
+                    getattr(p, operation_name), *args, **kwargs), name)
+                for name, p in providers)
 
             try:
                 for future in as_completed(futures):
-                    future.result()
+                    results[futures[future]] = future.result()
             except KeyboardInterrupt:
                 # not a graceful termination
                 executor._threads.clear()
                 thread._threads_queues.clear()
                 raise
 
+        return results
+
+    def race(self, operation_name, *args, **kwargs):
+        """Run operation on providers and return first successful result.
+
+        With hedge_delay (seconds) next provider is started only if there
+        is no result from already started ones after that delay. Losers
+        still running when race is won are not waited for, time they ran
+        until then is recorded as their unfinished latency.
+        Returns dict with result of the winning provider."""
+        hedge_delay = kwargs.pop('hedge_delay', None)
+        providers = self._get_operation_providers(operation_name)
+        if len(providers) == 0:
+            return {}
+
+        finished = queue.Queue()
+        lock = threading.Lock()
+        started, done, abandoned = {}, set(), set()
+
+        def run(name, provider):
+            result, error = None, None
+            try:
+                result = getattr(provider, operation_name)(*args, **kwargs)
+                # provider operations report errors by returning None
+                if result is None:
+                    raise Exception('%s failed' % name)
+            except Exception as e:
+                error = e
+            with lock:
+                if name in abandoned:
+                    return
+                done.add(name)
+            self.race_stats.record_latency(name, time.time() - started[name])
+            finished.put((name, result, error))
+
+        def wait_winner(running, timeout=None):
+            deadline = None if timeout is None else time.time() + timeout
+            while running > 0:
+                wait = None
+                if deadline is not None:
+                    wait = max(deadline - time.time(), 0)
+                try:
+                    name, result, error = finished.get(timeout=wait)
+                except queue.Empty:
+                    break
+                running -= 1
+                if error is None:
+                    return name, result, running
+            return None, None, running
+
+        winner, result, running = None, None, 0
+        for name, provider in providers:
+            # losers are not waited for, even on exit
+            started[name] = time.time()
+            threading.Thread(
+                target=run, args=(name, provider), daemon=True).start()
+            running += 1
+            if hedge_delay:
+                winner, result, running = wait_winner(running, hedge_delay)
+                if winner:
+                    break
+        if winner is None:
+            winner, result, running = wait_winner(running)
+
+        with lock:
+            unfinished = [name for name in started if name not in done]
+            abandoned.update(unfinished)
+        for name in unfinished:
+            self.race_stats.record_unfinished(
+                name, time.time() - started[name])
+        self.race_stats.record_race(winner)
+        if winner:
+            self.ctx.log('%s won %s race' % (winner, operation_name))
+        print_table(self.ctx.log, self.race_stats.report())
+
+        return {winner: result} if winner else {}
+
+    def _get_race_stats_file(self):
+        # win rates are collected between runs next to other a2ml state
+        return os.path.join(
+            Credentials(self.ctx).creds_path, RACE_STATS_FILE)
+
+    def _get_operation_providers(self, operation_name):
+        providers = []
+        for name, provider in zip(self.provider_names, self.providers):
+            if hasattr(provider, operation_name):
+                providers.append((name, provider))
+            else:
+                self.ctx.log(
+                    '%s is not supported by %s' % (operation_name, name))
+        return providers
+
     def _load_providers(self):
         def get_instance(p):
             module = importlib.import_module('a2ml.api.%s.a2ml' % p)
             provider_class = getattr(module, '%sA2ML' % p.capitalize())
             return provider_class(self.ctx.copy(p))
-        return [get_instance(p) for p in self.ctx.get_providers()]
+        return [get_instance(p) for p in self.provider_names]
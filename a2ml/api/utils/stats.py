@@ -0,0 +1,124 @@
+import math
+import threading
+
+from a2ml.api.utils.file_lock import FileLock
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+# latencies of each provider kept in race stats file
+MAX_LATENCIES = 1000
+
+
+class LatencyStats(object):
+    """Collect latencies and report percentiles."""
+
+    def __init__(self):
+        super(LatencyStats, self).__init__()
+        self.latencies = []
+        self.lock = threading.Lock()
+
+    def record(self, latency):
+        with self.lock:
+            self.latencies.append(latency)
+
+    @property
+    def count(self):
+        return len(self.latencies)
+
+    def percentile(self, percent):
+        with self.lock:
+            latencies = sorted(self.latencies)
+        if len(latencies) == 0:
+            return None
+        # nearest rank percentile
+        rank = int(math.ceil(percent / 100.0 * len(latencies)))
+        return latencies[max(rank, 1) - 1]
+
+    def summary(self):
+        return {
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99)}
+
+    def report(self):
+        """Summary formatted for print_table."""
+        return dict((name, '%.3f' % value if value is not None else '')
+            for name, value in self.summary().items())
+
+
+class RaceStats(object):
+    """Win rates and latencies of providers racing for the same request.
+
+    With filename stats are accumulated in the file between runs,
+    keeping last MAX_LATENCIES latencies of each provider. Runs which
+    lost the race before finishing are counted as unfinished, time they
+    ran is recorded as their latency."""
+
+    def __init__(self, filename=None):
+        super(RaceStats, self).__init__()
+        self.filename = filename
+        self.races = 0
+        self.wins = {}
+        self.unfinished = {}
+        self.latencies = {}
+        self.lock = threading.Lock()
+
+    def record_latency(self, name, latency):
+        def update():
+            if name not in self.latencies:
+                self.latencies[name] = LatencyStats()
+            self.latencies[name].record(latency)
+        self._update(update)
+
+    def record_unfinished(self, name, latency):
+        def update():
+            self.unfinished[name] = self.unfinished.get(name, 0) + 1
+            if name not in self.latencies:
+                self.latencies[name] = LatencyStats()
+            self.latencies[name].record(latency)
+        self._update(update)
+
+    def record_race(self, winner):
+        def update():
+            self.races += 1
+            if winner is not None:
+                self.wins[winner] = self.wins.get(winner, 0) + 1
+        self._update(update)
+
+    def _update(self, update):
+        with self.lock:
+            if self.filename is None:
+                return update()
+            # stats could be updated by other runs
+            with FileLock('%s.lock' % self.filename):
+                self._load()
+                update()
+                self._save()
+
+    def _load(self):
+        stats = load_json(self.filename, {})
+        self.races = stats.get('races', 0)
+        self.wins = stats.get('wins', {})
+        self.unfinished = stats.get('unfinished', {})
+        self.latencies = {}
+        for name, latencies in stats.get('latencies', {}).items():
+            self.latencies[name] = LatencyStats()
+            self.latencies[name].latencies = latencies
+
+    def _save(self):
+        save_json(self.filename, {'races': self.races, 'wins': self.wins,
+            'unfinished': self.unfinished,
+            'latencies': dict((name, stats.latencies[-MAX_LATENCIES:])
+                for name, stats in self.latencies.items())})
+
+    def report(self):
+        table = []
+        for name in sorted(self.latencies):
+            row = {
+                'provider': name,
+                'win rate': '%.2f' % (
+                    float(self.wins.get(name, 0)) / self.races) \
+                    if self.races else '',
+                'unfinished': self.unfinished.get(name, 0)}
+            row.update(self.latencies[name].report())
+            table.append(row)
+        return table
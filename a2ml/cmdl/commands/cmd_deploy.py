@@ -20,8 +20,19 @@ class DeployCmd(object):
 @click.argument('model-id', required=False, type=click.STRING)
 @click.option('--locally', is_flag=True, default=False,
     help='Download and deploy trained model locally.')
+@click.option('--no-wait', is_flag=True, default=False,
+    help='Don\'t wait for model to be deployed.')
+@click.option('--status', is_flag=True, default=False,
+    help='Show status of deployed models.')
+@click.option('--await', 'await_ready', is_flag=True, default=False,
+    help='Wait for deployed models to be ready (with --status).')
+@click.option('--prune', is_flag=True, default=False,
+    help='Forget failed deployed models (with --status).')
 @pass_context
-def cmdl(ctx, model_id, locally):
+def cmdl(ctx, model_id, locally, no_wait, status, await_ready, prune):
     """Deploy trained model."""
     ctx.setup_logger(format='')
-    A2ML(ctx).deploy(model_id, locally)
+    if status:
+        A2ML(ctx).deploy_status(await_ready, prune)
+    else:
+        A2ML(ctx).deploy(model_id, locally, not no_wait)
@@ -4,8 +4,10 @@ from a2ml.api.utils.context import pass_context
 
 
 @click.command('evaluate', short_help='Evaluate models after training.')
+@click.option('--watch', '-w', is_flag=True, default=False,
+    help='Refresh leaderboard until search is completed.')
 @pass_context
-def cmdl(ctx):
+def cmdl(ctx, watch):
     """Evaluate models after training."""
     ctx.setup_logger(format='')
-    A2ML(ctx).evaluate()
+    A2ML(ctx).evaluate(watch)
@@ -0,0 +1,16 @@
+import click
+from a2ml.api.a2ml import A2ML
+from a2ml.api.utils.context import pass_context
+
+
+@click.command('export', short_help='Export trials to Parquet file.')
+@click.argument('session_ids', nargs=-1, type=click.STRING)
+@click.option('--output', '-o', type=click.STRING, required=False,
+    help='Parquet file to store trials, trials.parquet by default.')
+@pass_context
+def cmdl(ctx, session_ids, output):
+    """Export trials of experiment sessions to Parquet file.
+
+    Exports last trained session if no session ids are specified."""
+    ctx.setup_logger(format='')
+    A2ML(ctx).export(list(session_ids), output)
@@ -0,0 +1,18 @@
+import click
+from a2ml.api.a2ml import A2ML
+from a2ml.api.utils.context import pass_context
+
+
+@click.command('lease', short_help='Keep project cluster running.')
+@click.option('--hours', default=1, type=float,
+    help='Number of hours to keep project running.')
+@click.option('--release', is_flag=True, default=False,
+    help='Release lease and let project autoterminate.')
+@pass_context
+def cmdl(ctx, hours, release):
+    """Keep project cluster running for the next hours.
+
+    First lease command keeps running and restarts stopped project until
+    lease ends. Next commands extend the lease of the running one."""
+    ctx.setup_logger(format='')
+    A2ML(ctx).lease(hours, release)
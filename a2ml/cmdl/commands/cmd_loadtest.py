@@ -0,0 +1,24 @@
+import click
+from a2ml.api.a2ml import A2ML
+from a2ml.api.utils.context import pass_context
+
+
+@click.command('loadtest', short_help='Load test deployed model.')
+@click.option('--model-id', '-m', type=click.STRING, required=False,
+    help='Deployed model id.')
+@click.option('--rps', default=None, type=float,
+    help='Target requests per second.')
+@click.option('--concurrency', '-c', default=4, type=int,
+    help='Number of parallel requests.')
+@click.option('--duration', '-d', default=60, type=int,
+    help='Test duration in seconds.')
+@click.option('--batch-size', '-b', default=10, type=int,
+    help='Number of rows in one prediction request.')
+@click.option('--stand-in', is_flag=True, default=False,
+    help='Run against local stand-in model to test the load test itself.')
+@pass_context
+def cmdl(ctx, model_id, rps, concurrency, duration, batch_size, stand_in):
+    """Load test deployed model."""
+    ctx.setup_logger(format='')
+    A2ML(ctx).loadtest(
+        model_id, rps, concurrency, duration, batch_size, stand_in)
@@ -4,15 +4,36 @@ from a2ml.api.utils.context import pass_context
 
 
 @click.command('predict', short_help='Predict with deployed model.')
-@click.argument('filename', required=True, type=click.STRING)
+@click.argument('filename', nargs=-1, required=False, type=click.STRING)
 @click.option('--threshold', '-t', default=None, type=float,
     help='Threshold.')
 @click.option('--model-id', '-m', type=click.STRING, required=False,
-    help='Deployed model id.')
+    help='Deployed model id or comma separated list of model ids.')
 @click.option('--locally', is_flag=True, default=False,
     help='Predict locally using Docker image to run model.')
+@click.option('--race', is_flag=True, default=False,
+    help='Predict with all providers and take the first result.')
+@click.option('--hedge-delay', default=None, type=float,
+    help='With --race, start next provider only after this many seconds.')
+@click.option('--watch', '-w', 'watch_dir', default=None, type=click.STRING,
+    help='Keep model warm and predict on new files in the directory.')
+@click.option('--interval', default=None, type=float,
+    help='With --watch, seconds between checks for new files.')
 @pass_context
-def cmdl(ctx, filename, model_id, threshold, locally):
-    """Predict with deployed model."""
+def cmdl(ctx, filename, model_id, threshold, locally, race, hedge_delay,
+    watch_dir, interval):
+    """Predict with deployed model.
+
+    FILENAME could be a data file, a directory or glob pattern.
+    Several files are predicted in parallel using the same model."""
     ctx.setup_logger(format='')
-    A2ML(ctx).predict(filename, model_id, threshold, locally)
+    if watch_dir:
+        A2ML(ctx).predict_watch(watch_dir, model_id, threshold, locally,
+            interval)
+        return
+
+    if len(filename) == 0:
+        raise click.UsageError('Missing argument "FILENAME".')
+    filename = filename[0] if len(filename) == 1 else list(filename)
+    A2ML(ctx).predict(filename, model_id, threshold, locally,
+        race, hedge_delay)
@@ -4,8 +4,15 @@ from a2ml.api.utils.context import pass_context
 
 
 @click.command('train', short_help='Train the model.')
+@click.option('--grid', '-g', 'spec_file', default=None, type=click.STRING,
+    help='Train experiments listed in grid spec yaml file.')
+@click.option('--output', '-o', default=None, type=click.STRING,
+    help='With --grid, file to store leaderboards in.')
 @pass_context
-def cmdl(ctx):
+def cmdl(ctx, spec_file, output):
     """Train the model."""
     ctx.setup_logger(format='')
-    A2ML(ctx).train()
+    if spec_file:
+        A2ML(ctx).train_grid(spec_file, output)
+    else:
+        A2ML(ctx).train()
@@ -12,7 +12,8 @@ extras = {
     'azure': ['lightgbm<=2.2.1,>=2.0.11','scipy<=1.1.0,>=1.0.0',
         'numpy<=1.16.2,>=1.11.0','azureml','azureml.core','azureml.train',
         'azureml.train.automl'],
-    'google': ['google-cloud-automl']
+    'google': ['google-cloud-automl'],
+    'arrow': ['pyarrow']
 }
 
 # Meta dependency groups.
@@ -37,5 +38,9 @@ setup(
             'a2ml=a2ml.cmdl.cmdl:cmdl'
         ]
     },
-    packages=find_packages()
+    packages=find_packages(),
+    # model server is mounted to auger-ml-worker container
+    package_data={
+        'a2ml.api.auger': ['template/*.py']
+    }
 )
@@ -55,3 +55,8 @@ class TestConfigYaml(object):
         self.yaml.attr1 = Namespace()
         self.yaml.attr1.attr2 = None
         assert self.yaml.get('attr1/attr2', default) == default
+
+    def test_get_false_value_with_path(self):
+        self.yaml.attr1 = Namespace()
+        self.yaml.attr1.attr2 = False
+        assert self.yaml.get('attr1/attr2', True) is False
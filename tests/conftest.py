@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def project_dir(tmpdir, monkeypatch):
+    """Temporary a2ml project folder with Auger credentials.
+
+    auger.yaml has only project name, tests append their own options."""
+    monkeypatch.chdir(str(tmpdir))
+    monkeypatch.setenv('AUGER_CREDENTIALS_PATH', str(tmpdir))
+    monkeypatch.setenv('AUGER_CREDENTIALS', '{"token": "token"}')
+    tmpdir.join('auger.yaml').write('project: test\n')
+    return tmpdir
@@ -0,0 +1,89 @@
+import threading
+import pytest
+
+from a2ml.api.auger.base import AugerBase
+from a2ml.api.utils.context import Context
+
+
+class SessionCache(object):
+
+    def __init__(self):
+        self.session = {}
+
+    def get(self):
+        return self.session
+
+    def update(self, **kwargs):
+        self.session.update(kwargs)
+
+    def invalidate(self):
+        self.session = {}
+
+
+class ProjectApi(object):
+
+    def __init__(self, running=False, error=None):
+        self.running = running
+        self.error = error
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def is_running(self):
+        return self.running
+
+    def start(self, stats=None):
+        self.stats = stats
+        self.started.set()
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        self.running = True
+
+
+class TestAugerBase(object):
+
+    @pytest.fixture
+    def base(self, project_dir, monkeypatch):
+        monkeypatch.setattr(
+            AugerBase, '_ensure_org_and_project', lambda self: None)
+        base = AugerBase(Context())
+        base.session_cache = SessionCache()
+        return base
+
+    def test_start_project_in_background(self, base):
+        base.project_api = ProjectApi()
+        base.start_project(wait=False)
+        # start_project returns while cluster is provisioning
+        assert base.project_api.started.wait(5)
+        assert base.session_cache.session == {}
+
+        base.project_api.release.set()
+        base.wait_for_project()
+        assert base.project_api.running
+        assert base.session_cache.session == {'project_status': 'running'}
+        assert base.project_starting is None
+
+    def test_wait_for_project_raises_start_error(self, base):
+        base.project_api = ProjectApi(error=Exception('No free workers'))
+        base.project_api.release.set()
+        base.start_project(wait=False)
+        with pytest.raises(Exception, match='No free workers'):
+            base.wait_for_project()
+
+    def test_running_project_is_not_started(self, base):
+        base.project_api = ProjectApi(running=True)
+        base.start_project(wait=False)
+        assert base.project_starting is None
+        assert not base.project_api.started.is_set()
+        # nothing to wait for
+        base.wait_for_project()
+        assert base.session_cache.session == {'project_status': 'running'}
+
+    def test_start_project_without_auto_size(self, base, monkeypatch):
+        monkeypatch.setattr(base, '_get_data_set_stats',
+            lambda: {'count': 1000})
+        base.project_api = ProjectApi()
+        base.project_api.release.set()
+        base.start_project(wait=False, auto_size=False)
+        base.wait_for_project()
+        assert base.project_api.stats is None
@@ -0,0 +1,25 @@
+import pytest
+
+from a2ml.api.auger.config import AugerConfig
+from a2ml.api.utils.context import Context
+
+
+class TestAugerConfig(object):
+
+    @pytest.fixture
+    def ctx(self, project_dir):
+        project_dir.join('auger.yaml').write(
+            'deploy:\n  max_pipelines: 3\n', mode='a')
+        return Context()
+
+    def test_add_pipeline_keeps_latest(self, ctx):
+        for pipeline_id in ['p1', 'p2', 'p3', 'p2', 'p4']:
+            AugerConfig(ctx).add_pipeline(pipeline_id)
+        assert Context().get_config('auger').get('pipelines') == \
+            ['p3', 'p2', 'p4']
+
+    def test_remove_pipelines(self, ctx):
+        for pipeline_id in ['p1', 'p2', 'p3']:
+            AugerConfig(ctx).add_pipeline(pipeline_id)
+        AugerConfig(ctx).remove_pipelines(['p1', 'p3'])
+        assert Context().get_config('auger').get('pipelines') == ['p2']
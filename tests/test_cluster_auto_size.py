@@ -0,0 +1,45 @@
+from a2ml.api.auger.cloud.cluster import AugerClusterApi
+from a2ml.api.auger.cloud.rest_api import RestApi
+from a2ml.api.utils.context import Context
+
+
+class TestClusterAutoSize(object):
+
+    def test_small_data(self):
+        workers, worker_type, reasons = \
+            AugerClusterApi.auto_size(1000, 10, 100, 60, 10)
+        assert workers == 2
+        assert worker_type == 'standard'
+
+    def test_trial_budget(self):
+        workers, worker_type, reasons = \
+            AugerClusterApi.auto_size(1000 * 1000, 20, 100, 60, 10)
+        assert workers == 7
+        assert worker_type == 'standard'
+
+    def test_large_data(self):
+        workers, worker_type, reasons = \
+            AugerClusterApi.auto_size(10 * 1000 * 1000, 20, 100, 60, 8)
+        assert workers == 8
+        assert worker_type == 'high_memory'
+        assert 'limited to 2..8 workers' in reasons
+
+    def settings(self, tmpdir, monkeypatch, data_set_stats):
+        monkeypatch.chdir(str(tmpdir))
+        with open('auger.yaml', 'w') as f:
+            f.write('cluster:\n  auto_size: true\n  worker_nodes_count: 3\n'
+                'experiment:\n  max_n_trials: 100\n  max_total_time: 60\n')
+        ctx = Context()
+        ctx.rest_api = RestApi('https://app.auger.ai', 'token')
+        return AugerClusterApi.get_cluster_settings(ctx, data_set_stats)
+
+    def test_auto_size_settings(self, tmpdir, monkeypatch):
+        settings = self.settings(tmpdir, monkeypatch,
+            {'count': 1000 * 1000, 'columns_count': 20})
+        assert settings['worker_nodes_count'] == 7
+
+    def test_unknown_rows_count(self, tmpdir, monkeypatch):
+        # static settings are kept instead of minimum workers
+        settings = self.settings(tmpdir, monkeypatch,
+            {'stat_data': [{'column_name': 'age'}]})
+        assert settings['worker_nodes_count'] == 3
@@ -0,0 +1,24 @@
+from a2ml.api.auger.cloud.utils.convergence import ConvergenceMonitor
+
+
+class TestConvergenceMonitor(object):
+
+    def test_patience_trials(self):
+        monitor = ConvergenceMonitor(0.01, patience_trials=10)
+        assert not monitor.update(0.5, 1, now=0)
+        assert not monitor.update(0.6, 5, now=0)
+        # improvement below epsilon doesn't reset the window
+        assert not monitor.update(0.605, 14, now=0)
+        assert monitor.update(0.605, 15, now=0)
+
+    def test_patience_trials_and_minutes(self):
+        monitor = ConvergenceMonitor(0.01, 10, 5)
+        assert not monitor.update(0.5, 1, now=0)
+        assert not monitor.update(0.5, 20, now=60)
+        assert monitor.update(0.5, 20, now=300)
+
+    def test_no_scores(self):
+        monitor = ConvergenceMonitor(0.01, patience_trials=1)
+        assert not monitor.update(None, 10)
+        assert not monitor.update(0.1, 10)
+        assert not ConvergenceMonitor(0.01).update(0.1, 100)
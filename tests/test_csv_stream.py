@@ -0,0 +1,56 @@
+import gzip
+import pandas
+import pytest
+import tempfile
+from requests_toolbelt import MultipartEncoder
+
+from a2ml.api.auger.cloud.data_set import SizedReader
+from a2ml.api.auger.cloud.utils.csv_stream import CsvStream
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+
+class TestCsvStream(object):
+
+    def setup_method(self):
+        self.df = pandas.DataFrame(
+            {'name': ['a', 'b,c', 'd'], 'value': [1, 2, 3]})
+        self.csv = 'name,value\na,1\n"b,c",2\nd,3\n'
+
+    def read(self, stream):
+        return gzip.decompress(b''.join(stream)).decode('utf-8')
+
+    def test_data_frame(self):
+        stream = CsvStream(self.df, chunk_rows=2)
+        assert self.read(stream) == self.csv
+        assert stream.rows == 3
+        assert stream.extension == '.csv.gz'
+
+    def test_uncompressed(self):
+        stream = CsvStream(self.df, compress=False)
+        assert b''.join(stream).decode('utf-8') == self.csv
+        assert stream.extension == '.csv'
+
+    def test_dict_rows(self):
+        rows = (row for row in self.df.to_dict('records'))
+        assert self.read(CsvStream(rows, chunk_rows=2)) == self.csv
+
+    def test_list_rows(self):
+        rows = iter(self.df.values.tolist())
+        assert self.read(CsvStream(rows, ['name', 'value'])) == self.csv
+
+    def test_list_rows_without_columns(self):
+        with pytest.raises(AugerException):
+            b''.join(CsvStream(iter([[1, 2]])))
+
+    def test_multipart_keeps_spooled_file_in_memory(self):
+        stream = CsvStream(self.df)
+        with tempfile.SpooledTemporaryFile(1024 * 1024) as f:
+            stream.write_to(f)
+            encoder = MultipartEncoder(
+                fields={'file': ('data.csv.gz', SizedReader(f, stream.size))})
+            body = encoder.read()
+            assert not f._rolled
+        assert len(body) == encoder.len
+        start = body.index(b'\x1f\x8b')
+        assert gzip.decompress(body[start:start + stream.size]).\
+            decode('utf-8') == self.csv
@@ -0,0 +1,23 @@
+import os
+import pandas
+import pytest
+
+from a2ml.api.auger.cloud.utils.dataframe import DataFrame
+
+pytest.importorskip('pyarrow')
+
+
+class TestDataFrame(object):
+
+    def test_is_columnar(self):
+        assert DataFrame.is_columnar('data.arrow')
+        assert DataFrame.is_columnar('data.parquet')
+        assert not DataFrame.is_columnar('data.csv')
+
+    @pytest.mark.parametrize('extension', ['.arrow', '.parquet'])
+    def test_arrow_round_trip(self, tmpdir, extension):
+        filename = os.path.join(str(tmpdir), 'data%s' % extension)
+        df = pandas.DataFrame({'age': [25, 40], 'city': ['Paris', None]})
+        DataFrame.save_arrow(filename, df)
+        assert DataFrame.load_arrow(filename).equals(df)
+        assert DataFrame.load_arrow(filename, ['city']).equals(df[['city']])
@@ -0,0 +1,49 @@
+import pandas
+import pytest
+
+from a2ml.api.auger import deploy
+from a2ml.api.auger.deploy import AugerDeploy
+from a2ml.api.utils.context import Context
+
+
+class LocalPredictor(object):
+    calls = []
+
+    def __init__(self, ctx, model_id, model_path):
+        self.model_id = model_id
+
+    @staticmethod
+    def is_enabled(ctx):
+        return True
+
+    def start(self):
+        self.calls.append('start')
+
+    def predict_frame(self, df, threshold=None):
+        self.calls.append(('predict', len(df)))
+
+
+class TestDeploy(object):
+
+    def setup_method(self, method):
+        LocalPredictor.calls = []
+
+    @pytest.fixture
+    def auger_deploy(self, project_dir, monkeypatch):
+        monkeypatch.setattr(deploy, 'AugerLocalPredictor', LocalPredictor)
+        monkeypatch.setattr(deploy.AugerModelStore, 'extract',
+            lambda store, model_id: '/models/%s' % model_id)
+        monkeypatch.setattr(AugerDeploy, '_get_warmup_data',
+            lambda self, rows: pandas.DataFrame({'x': [1] * rows}))
+        return AugerDeploy(Context())
+
+    def test_warmup_local_model_predicts(self, auger_deploy):
+        auger_deploy._warmup_local_model('m1')
+        assert LocalPredictor.calls == ['start', ('predict', 1)]
+
+    def test_warmup_local_model_without_prediction(
+        self, auger_deploy, project_dir):
+        project_dir.join('auger.yaml').write(
+            'local_predictor:\n  warmup_predict: false\n', mode='a')
+        AugerDeploy(Context())._warmup_local_model('m1')
+        assert LocalPredictor.calls == ['start']
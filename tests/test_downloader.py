@@ -0,0 +1,113 @@
+import os
+import hashlib
+import pytest
+import requests
+
+from a2ml.api.auger.cloud.utils.downloader import Downloader
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+
+class Context(object):
+
+    def log(self, msg):
+        pass
+
+
+class Response(object):
+
+    def __init__(self, status_code, content, headers):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    def iter_content(self, size):
+        for i in range(0, len(self.content), size):
+            yield self.content[i:i + size]
+
+    def close(self):
+        pass
+
+
+class Server(object):
+    """Serves content with range requests like S3."""
+
+    def __init__(self, content, etag=None, ranges=True, length=True):
+        self.content = content
+        self.etag = etag
+        self.ranges = ranges
+        self.length = length
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False):
+        self.requests.append((headers or {}).get('Range'))
+        headers_out = {}
+        if self.etag:
+            headers_out['ETag'] = '"%s"' % self.etag
+        content_range = (headers or {}).get('Range')
+        if content_range and self.ranges:
+            start, end = [int(v) for v in
+                content_range.split('=')[1].split('-')]
+            headers_out['Content-Range'] = 'bytes %s-%s/%s' % \
+                (start, end, len(self.content))
+            return Response(206, self.content[start:end + 1], headers_out)
+        if self.length:
+            headers_out['Content-Length'] = str(len(self.content))
+        return Response(200, self.content, headers_out)
+
+
+class TestDownloader(object):
+
+    def setup_method(self, method):
+        self.content = bytes(range(256)) * 40
+        self.md5 = hashlib.md5(self.content).hexdigest()
+
+    def download(self, tmpdir, monkeypatch, server):
+        monkeypatch.setattr(requests, 'get', server.get)
+        file_name = os.path.join(str(tmpdir), 'model.zip')
+        return Downloader(Context(), workers=2, chunk_size=4096).\
+            download('http://s3/model.zip', file_name)
+
+    def read(self, file_name):
+        with open(file_name, 'rb') as f:
+            return f.read()
+
+    def test_download_chunks(self, tmpdir, monkeypatch):
+        server = Server(self.content, self.md5)
+        file_name = self.download(tmpdir, monkeypatch, server)
+        assert self.read(file_name) == self.content
+        # probe and three chunks
+        assert len(server.requests) == 4
+
+        # same ETag and size, file is not downloaded again
+        server.requests = []
+        self.download(tmpdir, monkeypatch, server)
+        assert server.requests == ['bytes=0-0']
+
+    def test_resume(self, tmpdir, monkeypatch):
+        file_name = os.path.join(str(tmpdir), 'model.zip')
+        # first chunk is downloaded by previous run
+        with open(file_name + '.part', 'wb') as f:
+            f.write(self.content[:4096])
+            f.truncate(len(self.content))
+        Downloader._save_meta(file_name + '.download.json', {
+            'etag': self.md5, 'size': len(self.content), 'chunks': [0]})
+
+        server = Server(self.content, self.md5)
+        self.download(tmpdir, monkeypatch, server)
+        assert self.read(file_name) == self.content
+        assert sorted(server.requests[1:]) == \
+            ['bytes=4096-8191', 'bytes=8192-10239']
+
+    def test_checksum_mismatch(self, tmpdir, monkeypatch):
+        server = Server(self.content, hashlib.md5(b'other').hexdigest())
+        with pytest.raises(AugerException, match='checksum'):
+            self.download(tmpdir, monkeypatch, server)
+        assert os.listdir(str(tmpdir)) == ['model.zip.download.json']
+
+    def test_unknown_remote_file_is_downloaded(self, tmpdir, monkeypatch):
+        server = Server(self.content, ranges=False, length=False)
+        self.download(tmpdir, monkeypatch, server)
+        server.requests = []
+        file_name = self.download(tmpdir, monkeypatch, server)
+        assert server.requests == ['bytes=0-0', None]
+        assert self.read(file_name) == self.content
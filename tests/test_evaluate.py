@@ -0,0 +1,81 @@
+import pytest
+
+from a2ml.api.auger import evaluate
+from a2ml.api.auger.evaluate import AugerEvaluate
+from a2ml.api.auger.cloud.utils.leaderboard import Leaderboard
+from a2ml.api.utils.context import Context
+
+
+def trial(trial_id, score):
+    return {'id': trial_id, 'score_name': 'accuracy', 'score_value': score,
+        'status': 'completed',
+        'hyperparameter': {'algorithm_name': 'sklearn.Algo%s' % trial_id}}
+
+
+class ExperimentSessionApi(object):
+    """Returns next status and new trials on each poll."""
+
+    def __init__(self, polls):
+        self.polls = list(polls)
+        self.interrupted = False
+
+    def status(self):
+        self.trials = self.polls[0][1]
+        return self.polls.pop(0)[0]
+
+    def update_leaderboard(self, leaderboard):
+        leaderboard.add(self.trials)
+
+    def interrupt(self):
+        self.interrupted = True
+
+
+class TestEvaluate(object):
+
+    @pytest.fixture
+    def auger_evaluate(self, project_dir, monkeypatch):
+        project_dir.join('auger.yaml').write('evaluate:\n'
+            '  min_interval: 5\n  max_interval: 20\n', mode='a')
+        self.intervals = []
+        monkeypatch.setattr(evaluate.time, 'sleep', self.intervals.append)
+        return AugerEvaluate(Context())
+
+    def test_adaptive_refresh(self, auger_evaluate, project_dir):
+        cache_file = str(project_dir.join('leaderboards', 's1.json'))
+        session = ExperimentSessionApi([
+            ('started', [trial(1, 0.5)]),
+            ('started', []),
+            ('started', []),
+            ('started', []),
+            ('started', [trial(2, 0.7)]),
+            ('completed', [])])
+        auger_evaluate._watch(session, 10, cache_file)
+        # interval backs off while there are no new trials
+        assert self.intervals == [5, 10, 20, 20, 5]
+        leaderboard = Leaderboard.load(cache_file)
+        assert leaderboard.count == 2
+        assert [t['model id'] for t in leaderboard.top()] == [2, 1]
+
+    def test_early_stopping(self, auger_evaluate, project_dir):
+        project_dir.join('auger.yaml').write('experiment:\n'
+            '  early_stopping:\n    enabled: true\n'
+            '    patience_trials: 2\n', mode='a')
+        auger_evaluate = AugerEvaluate(Context())
+        session = ExperimentSessionApi([
+            ('started', [trial(1, 0.5)]),
+            ('started', [trial(2, 0.5)]),
+            ('started', [trial(3, 0.5)]),
+            ('completed', [])])
+        auger_evaluate._watch(session, 10, str(project_dir.join('s1.json')))
+        assert session.interrupted
+
+    def test_keyboard_interrupt(
+        self, auger_evaluate, project_dir, monkeypatch):
+        def sleep(interval):
+            raise KeyboardInterrupt()
+
+        monkeypatch.setattr(evaluate.time, 'sleep', sleep)
+        session = ExperimentSessionApi([('started', [trial(1, 0.5)])])
+        # watch stops quietly on Ctrl+C
+        auger_evaluate._watch(session, 10, str(project_dir.join('s1.json')))
+        assert not session.interrupted
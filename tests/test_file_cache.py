@@ -0,0 +1,47 @@
+import os
+import time
+
+from a2ml.api.auger.cloud.utils.file_cache import FileCache
+
+
+class TestFileCache(object):
+
+    def test_set_and_get(self, tmpdir):
+        cache = FileCache(os.path.join(str(tmpdir), 'cache'))
+        assert cache.get('settings-1') is None
+        value = {'targetFeature': 'income', 'featureColumns': ['age']}
+        assert cache.set('settings-1', value) == value
+        assert cache.get('settings-1') == value
+
+    def test_broken_file(self, tmpdir):
+        cache = FileCache(str(tmpdir))
+        with open(os.path.join(str(tmpdir), 'settings-1.json'), 'w') as f:
+            f.write('{"targetFeature"')
+        assert cache.get('settings-1') is None
+
+    def test_hash(self):
+        assert FileCache.hash({'a': 1, 'b': [2]}) == \
+            FileCache.hash({'b': [2], 'a': 1})
+        assert FileCache.hash(['income', None]) != \
+            FileCache.hash(['income', 5])
+
+    def test_max_age(self, tmpdir):
+        cache = FileCache(str(tmpdir), max_age=60)
+        cache.set('settings-1', [1])
+        filename = os.path.join(str(tmpdir), 'settings-1.json')
+        os.utime(filename, (time.time() - 120, time.time() - 120))
+        assert cache.get('settings-1') is None
+        cache.set('settings-2', [2])
+        assert not os.path.exists(filename)
+
+    def test_max_files(self, tmpdir):
+        cache = FileCache(str(tmpdir), max_files=2)
+        for index in range(2):
+            cache.set('settings-%s' % index, [index])
+            filename = os.path.join(str(tmpdir), 'settings-%s.json' % index)
+            os.utime(filename, (time.time() - 10 + index,) * 2)
+        # least recently used value is removed
+        assert cache.get('settings-0') == [0]
+        cache.set('settings-2', [2])
+        assert sorted(os.listdir(str(tmpdir))) == \
+            ['settings-0.json', 'settings-2.json']
@@ -0,0 +1,20 @@
+import os
+
+from a2ml.api.auger.cloud.utils.json_file import load_json, save_json
+
+
+class TestJsonFile(object):
+
+    def test_save_and_load(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'cache', 'value.json')
+        assert load_json(filename, {}) == {}
+        assert save_json(filename, {'a': [1, 2]}) == {'a': [1, 2]}
+        assert load_json(filename) == {'a': [1, 2]}
+        # no temporary files are left
+        assert os.listdir(os.path.dirname(filename)) == ['value.json']
+
+    def test_broken_file(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'value.json')
+        with open(filename, 'w') as f:
+            f.write('{"a"')
+        assert load_json(filename, {}) == {}
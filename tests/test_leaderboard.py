@@ -0,0 +1,48 @@
+from a2ml.api.auger.cloud.utils.leaderboard import Leaderboard
+
+
+def trial(trial_id, score, score_name='accuracy', status='completed'):
+    return {'id': trial_id, 'score_name': score_name, 'score_value': score,
+        'status': status,
+        'hyperparameter': {
+            'algorithm_name': 'sklearn.ensemble.Algo%s' % trial_id}}
+
+
+class TestLeaderboard(object):
+
+    def test_top_k(self):
+        leaderboard = Leaderboard(3)
+        leaderboard.add([trial(i, score) for i, score in
+            enumerate([0.5, 0.9, 0.1, 0.7, 0.8])])
+        assert leaderboard.count == 5
+        top = leaderboard.top(2)
+        assert [t['model id'] for t in top] == [1, 4]
+        assert top[0] == {'model id': 1, 'accuracy': '0.9000',
+            'algorithm': 'Algo1'}
+
+    def test_lower_is_better(self):
+        leaderboard = Leaderboard(2)
+        leaderboard.add([trial(i, score, 'rmse') for i, score in
+            enumerate([3.0, 1.0, 2.0])])
+        assert [t['model id'] for t in leaderboard.top()] == [1, 2]
+
+    def test_incremental_update(self, tmpdir):
+        cache_file = str(tmpdir.join('leaderboards', 'session.json'))
+        leaderboard = Leaderboard(2)
+        # running trial without score is fetched again on next update
+        leaderboard.add([trial(1, 0.5), trial(2, None, status='running'),
+            trial(3, 0.6)])
+        assert leaderboard.count == 1
+        leaderboard.save(cache_file)
+
+        leaderboard = Leaderboard.load(cache_file)
+        leaderboard.add([trial(2, 0.9), trial(3, 0.6), trial(4, 0.1)])
+        assert leaderboard.count == 4
+        assert [t['model id'] for t in leaderboard.top()] == [2, 3]
+
+    def test_skip_failed_trials(self):
+        leaderboard = Leaderboard(2)
+        leaderboard.add([trial(1, 0.5), trial(2, None, status='error'),
+            trial(3, None, status=None), trial(4, 0.6)])
+        assert leaderboard.count == 4
+        assert [t['model id'] for t in leaderboard.top()] == [4, 1]
@@ -0,0 +1,70 @@
+import os
+import time
+import pytest
+
+from a2ml.api.auger.lease import AugerLease
+from a2ml.api.utils.context import Context
+
+
+class TestLease(object):
+
+    @pytest.fixture
+    def lease(self, project_dir):
+        return AugerLease(Context())
+
+    def test_acquire_and_extend(self, lease):
+        until = time.time() + 3600
+        assert lease._update_lease(until) == \
+            {'until': until, 'pid': os.getpid()}
+        # running owner keeps the lease, it is only extended
+        assert lease._update_lease(until + 60)['until'] == until + 60
+        assert lease._update_lease(until)['until'] == until + 60
+
+    def test_steal_from_dead_process(self, lease, monkeypatch):
+        lease._save({lease.key: {'until': time.time() + 3600, 'pid': 1}})
+        monkeypatch.setattr(AugerLease, '_is_alive',
+            staticmethod(lambda pid: False))
+        until = time.time() + 60
+        assert lease._update_lease(until) == \
+            {'until': until, 'pid': os.getpid()}
+
+    def test_release(self, lease):
+        lease._update_lease(time.time() + 3600)
+        lease._update_lease(None)
+        assert lease._get_lease() is None
+
+    def test_release_command_restores_autoterminate(
+        self, lease, monkeypatch):
+        autoterminate = []
+
+        class ProjectApi(object):
+            def set_autoterminate(self, minutes):
+                autoterminate.append(minutes)
+
+        def ensure_org_and_project():
+            lease.project_api = ProjectApi()
+
+        monkeypatch.setattr(
+            lease, '_ensure_org_and_project', ensure_org_and_project)
+        monkeypatch.setattr(
+            lease, '_get_autoterminate_minutes', lambda: 30)
+        # lease is held by scheduler in other process
+        lease._save({lease.key: {'until': time.time() + 3600, 'pid': 1}})
+        lease.lease(release=True)
+        assert lease._get_lease() is None
+        assert autoterminate == [30]
+
+    def test_scheduler_stops_when_lease_expires(self, lease, monkeypatch):
+        refreshed, released = [], []
+        monkeypatch.setattr(lease, '_refresh', refreshed.append)
+        monkeypatch.setattr(lease, '_release', lambda: released.append(True))
+        lease._update_lease(time.time() + 0.2)
+        lease._run_scheduler()
+        assert len(refreshed) == 1
+        assert released == [True]
+
+    def test_scheduler_stops_when_lease_is_taken(self, lease, monkeypatch):
+        monkeypatch.setattr(lease, '_refresh', lambda until: None)
+        monkeypatch.setattr(lease, '_release', lambda: None)
+        lease._save({lease.key: {'until': time.time() + 3600, 'pid': 1}})
+        lease._run_scheduler()
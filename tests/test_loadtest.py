@@ -0,0 +1,62 @@
+import time
+import threading
+
+from a2ml.api.auger.loadtest import AugerLoadTest, STAND_IN_SCHEMA
+from a2ml.api.auger.cloud.utils.synthetic_data import SyntheticData
+
+
+class Context(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def log(self, message):
+        self.messages.append(message)
+
+
+class TestLoadTest(object):
+
+    def run(self, predict, rps=None, concurrency=2, duration=0.5):
+        # run doesn't use Auger connection
+        loadtest = AugerLoadTest.__new__(AugerLoadTest)
+        loadtest.ctx = self.ctx = Context()
+        return loadtest.run(predict, SyntheticData(STAND_IN_SCHEMA, seed=1),
+            rps, concurrency, duration, batch_size=5)
+
+    def test_closed_loop(self):
+        calls = []
+        lock = threading.Lock()
+
+        def predict(df):
+            with lock:
+                calls.append(len(df))
+                failed = len(calls) % 4 == 0
+            time.sleep(0.01)
+            if failed:
+                raise Exception('Model error')
+
+        report = self.run(predict)
+        assert report['requests'] == len(calls)
+        assert set(calls) == set([5])
+        assert float(report['error rate']) == \
+            round(float(len(calls) // 4) / len(calls), 3)
+        assert float(report['p50']) < 0.1
+
+    def test_latency_from_schedule(self):
+        # one worker can serve 10 requests/s, 40 are scheduled
+        report = self.run(lambda df: time.sleep(0.1),
+            rps=40, concurrency=1, duration=1)
+        # requests wait for the busy worker, which counts in latency
+        assert float(report['p50']) > 0.2
+        assert float(report['p99']) > 0.5
+
+    def test_errors_logged(self):
+        def predict(df):
+            time.sleep(0.01)
+            raise Exception('Model is not ready')
+
+        report = self.run(predict, duration=0.2)
+        assert report['error rate'] == '1.000'
+        assert report['p50'] == ''
+        assert self.ctx.messages == ['%s failed requests: Model is not ready'
+            % report['requests']]
@@ -0,0 +1,185 @@
+import os
+import pandas
+import subprocess
+import pytest
+import requests
+
+from a2ml.api.auger import local_predictor
+from a2ml.api.auger.local_predictor import AugerLocalPredictor
+from a2ml.api.auger.cloud.utils.exception import AugerException
+from a2ml.api.utils.context import Context
+
+
+class Docker(object):
+    """Stand-in for docker cli: container gets a port once it is run."""
+
+    def __init__(self, running=False):
+        self.running = running
+        self.conflict = False
+        self.commands = []
+
+    def check_output(self, command, **kwargs):
+        self.commands.append(command)
+        if not self.running:
+            raise subprocess.CalledProcessError(1, command)
+        return b'127.0.0.1:32768\n'
+
+    def check_call(self, command, **kwargs):
+        self.commands.append(command)
+        self.running = True
+        if self.conflict:
+            # same container was started by other process
+            raise subprocess.CalledProcessError(125, command)
+
+    def call(self, command, **kwargs):
+        self.commands.append(command)
+        self.running = False
+
+
+class Response(object):
+
+    def __init__(self, status_code, content=None):
+        self.status_code = status_code
+        self.content = content
+
+    def json(self):
+        return self.content
+
+
+class TestLocalPredictor(object):
+
+    def setup_method(self, method):
+        self.cwd = os.getcwd()
+
+    def teardown_method(self, method):
+        os.chdir(self.cwd)
+
+    @pytest.fixture
+    def docker(self, monkeypatch):
+        docker = Docker()
+        for name in ['check_output', 'check_call', 'call']:
+            monkeypatch.setattr(
+                local_predictor.subprocess, name, getattr(docker, name))
+        monkeypatch.setattr(local_predictor.AugerClusterApi,
+            'get_cluster_settings', lambda ctx: {'kubernetes_stack': 'stable'})
+        monkeypatch.setattr(local_predictor, 'START_POLL_INTERVAL', 0)
+        return docker
+
+    @pytest.fixture
+    def predictor(self, tmpdir, monkeypatch):
+        os.chdir(str(tmpdir))
+        monkeypatch.setattr(AugerLocalPredictor, 'get_exchange_path',
+            staticmethod(lambda ctx: os.path.join(str(tmpdir), 'exchange')))
+        return AugerLocalPredictor(
+            Context(), 'm1', os.path.join(str(tmpdir), 'm1-abc'))
+
+    def test_start_runs_container_once(self, docker, predictor, monkeypatch):
+        health = iter([requests.exceptions.ConnectionError(),
+            Response(503), Response(200)])
+
+        def get(url):
+            assert url == 'http://127.0.0.1:32768/health'
+            response = next(health)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(local_predictor.requests, 'get', get)
+        assert predictor.start() == 'http://127.0.0.1:32768'
+        run = [c for c in docker.commands if c.startswith('docker run')]
+        assert len(run) == 1
+        assert '--name a2ml-model-m1-abc' in run[0]
+        assert 'auger-ml-worker:stable' in run[0]
+        assert '--idle_timeout=1800' in run[0]
+
+        # container is already running
+        monkeypatch.setattr(local_predictor.requests, 'get',
+            lambda url: Response(200))
+        predictor.start()
+        assert len([c for c in docker.commands
+            if c.startswith('docker run')]) == 1
+
+    def test_start_uses_container_of_other_process(
+        self, docker, predictor, monkeypatch):
+        monkeypatch.setattr(local_predictor.requests, 'get',
+            lambda url: Response(200))
+        docker.conflict = True
+        assert predictor.start() == 'http://127.0.0.1:32768'
+
+    def test_start_error(self, docker, predictor, monkeypatch):
+        monkeypatch.setattr(local_predictor, 'CONFLICT_TIMEOUT', 0)
+
+        def check_call(command, **kwargs):
+            raise subprocess.CalledProcessError(125, command)
+
+        monkeypatch.setattr(local_predictor.subprocess, 'check_call',
+            check_call)
+        with pytest.raises(AugerException, match='Error running Docker'):
+            predictor.start()
+
+    def test_stop(self, docker, predictor):
+        predictor.stop()
+        assert 'docker stop a2ml-model-m1-abc' not in docker.commands
+        docker.running = True
+        predictor.stop()
+        assert 'docker stop a2ml-model-m1-abc' in docker.commands
+
+    def test_wait_for_server_timeout(self, docker, predictor, monkeypatch):
+        monkeypatch.setattr(local_predictor, 'START_TIMEOUT', 0.05)
+        monkeypatch.setattr(local_predictor.requests, 'get',
+            lambda url: Response(503))
+        docker.running = True
+        with pytest.raises(AugerException):
+            predictor.start()
+
+    def test_request_restarts_idle_server(
+        self, docker, predictor, monkeypatch):
+        monkeypatch.setattr(local_predictor.requests, 'get',
+            lambda url: Response(200))
+        docker.running = True
+        predictor.start()
+
+        responses = [requests.exceptions.ConnectionError(),
+            Response(200, {'result': [1]})]
+
+        def post(url, json):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                # server stopped on idle timeout
+                docker.running = False
+                raise response
+            return response
+
+        monkeypatch.setattr(local_predictor.requests, 'post', post)
+        assert predictor.predict([[1]], ['x']) == [1]
+        assert len([c for c in docker.commands
+            if c.startswith('docker run')]) == 1
+
+    def test_request_error(self, docker, predictor, monkeypatch):
+        predictor.url = 'http://127.0.0.1:32768'
+        monkeypatch.setattr(local_predictor.requests, 'post',
+            lambda url, json: Response(500, {'error': 'bad features'}))
+        with pytest.raises(AugerException, match='bad features'):
+            predictor.predict([[1]], ['x'])
+
+    def test_predict_frame_arrow(self, predictor, monkeypatch):
+        pytest.importorskip('pyarrow')
+        from a2ml.api.auger.cloud.utils.dataframe import DataFrame
+        monkeypatch.setattr(AugerLocalPredictor, 'use_arrow',
+            staticmethod(lambda ctx: True))
+
+        def request(request):
+            # server reads request file and writes predictions next to it
+            path = os.path.join(
+                predictor.exchange_path, request['path_to_predict'])
+            df = DataFrame.load_arrow(path)
+            df['income'] = df['age'] > 30
+            DataFrame.save_arrow(path + '.predicted.arrow', df)
+            return request['path_to_predict'] + '.predicted.arrow'
+
+        monkeypatch.setattr(predictor, '_request', request)
+        predicted = predictor.predict_frame(
+            pandas.DataFrame({'age': [25, 40]}))
+        assert predicted['income'].tolist() == [False, True]
+        # exchange files are removed
+        assert os.listdir(predictor.exchange_path) == []
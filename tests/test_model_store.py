@@ -0,0 +1,77 @@
+import os
+import time
+import pytest
+from zipfile import ZipFile
+
+from a2ml.api.auger.model_store import AugerModelStore
+from a2ml.api.utils.context import Context
+
+
+class TestModelStore(object):
+
+    def setup_method(self, method):
+        self.cwd = os.getcwd()
+
+    def teardown_method(self, method):
+        os.chdir(self.cwd)
+
+    @pytest.fixture
+    def store(self, tmpdir):
+        os.chdir(str(tmpdir))
+        with open('auger.yaml', 'w') as f:
+            f.write('local_models:\n  path: models\n  max_size: 1\n')
+        store = AugerModelStore(Context())
+        os.makedirs(store.path)
+        return store
+
+    def make_model(self, store, model_id, size=1024):
+        with ZipFile(store.get_model_file(model_id), 'w') as zip_file:
+            zip_file.writestr('model.pkl', os.urandom(size))
+
+    def test_extract_once(self, store):
+        self.make_model(store, 'A')
+        assert store.is_loaded('A')
+        path = store.extract('A')
+        assert os.path.isfile(os.path.join(path, 'model.pkl'))
+        mtime = os.path.getmtime(path)
+        assert store.extract('A') == path
+        assert os.path.getmtime(path) == mtime
+
+    def test_extract_new_checksum(self, store):
+        self.make_model(store, 'A')
+        path = store.extract('A')
+        time.sleep(0.01)
+        self.make_model(store, 'A')
+        new_path = store.extract('A')
+        assert new_path != path
+        assert not os.path.exists(path)
+
+    def test_evict_least_recently_used(self, store):
+        for model_id in ['A', 'B', 'C']:
+            self.make_model(store, model_id, 200 * 1024)
+            store.extract(model_id)
+        assert not store.is_loaded('A')
+        assert store.is_loaded('B')
+        assert store.is_loaded('C')
+
+    def test_evict_downloaded_models(self, store):
+        for model_id in ['A', 'B', 'C']:
+            self.make_model(store, model_id, 300 * 1024)
+            os.utime(store.get_model_file(model_id),
+                (time.time() - 10, time.time() - 10))
+        store.extract('C')
+        assert not store.is_loaded('A')
+        assert store.is_loaded('B')
+
+    def test_keep_models_in_use(self, store, monkeypatch):
+        in_use = []
+        monkeypatch.setattr(store, '_is_in_use',
+            lambda model_path: model_path in in_use)
+        self.make_model(store, 'A', 200 * 1024)
+        in_use.append(store.extract('A'))
+        for model_id in ['B', 'C']:
+            self.make_model(store, model_id, 200 * 1024)
+            store.extract(model_id)
+        assert store.is_loaded('A')
+        assert not store.is_loaded('B')
+        assert store.is_loaded('C')
@@ -0,0 +1,58 @@
+import pandas
+import pytest
+
+from a2ml.api.auger.pipeline_pool import AugerPipelinePool
+from a2ml.api.auger.cloud.pipeline import AugerPipelineApi
+from a2ml.api.utils.context import Context
+
+
+class TestPipelinePool(object):
+
+    def setup_method(self, method):
+        self.ctx = Context()
+        self.ctx.rest_api = None
+        self.calls = []
+        self.down = ['down']
+
+    @pytest.fixture
+    def pipelines(self, monkeypatch):
+        def properties(pipeline_api):
+            status = 'error' if pipeline_api.object_id in self.down \
+                else 'ready'
+            return {'id': pipeline_api.object_id, 'status': status}
+
+        def predict(pipeline_api, records, features,
+            threshold=None, check_status=True):
+            self.calls.append(pipeline_api.object_id)
+            if pipeline_api.object_id == 'broken':
+                # pipeline goes down while predicting
+                self.down.append('broken')
+                raise Exception('Prediction failed')
+            if records[0][0] < 0:
+                raise Exception('Invalid data')
+            return {'x': [r[0] for r in records],
+                'target': [r[0] * 2 for r in records]}
+
+        monkeypatch.setattr(AugerPipelineApi, 'properties', properties)
+        monkeypatch.setattr(AugerPipelineApi, 'predict', predict)
+
+    def test_predict_spreads_batches(self, pipelines):
+        df = pandas.DataFrame({'x': list(range(10))})
+        result = AugerPipelinePool(self.ctx, ['p1', 'p2']).predict(df)
+        assert result['target'].tolist() == [x * 2 for x in range(10)]
+        assert sorted(self.calls) == ['p1', 'p2']
+
+    def test_eject_not_ready_and_failed(self, pipelines):
+        df = pandas.DataFrame({'x': list(range(9))})
+        pool = AugerPipelinePool(self.ctx, ['down', 'broken', 'p1'])
+        result = pool.predict(df)
+        assert result['x'].tolist() == list(range(9))
+        assert [m.pipeline_id for m in pool.members] == ['p1']
+        assert 'down' not in self.calls
+
+    def test_raise_data_error(self, pipelines):
+        df = pandas.DataFrame({'x': [-1, 1, 2]})
+        pool = AugerPipelinePool(self.ctx, ['p1', 'p2', 'p3'])
+        with pytest.raises(Exception, match='Invalid data'):
+            pool.predict(df)
+        assert len(pool.members) == 3
@@ -0,0 +1,150 @@
+import os
+import pandas
+import pytest
+
+from a2ml.api.auger import predict
+from a2ml.api.auger.predict import AugerPredict
+from a2ml.api.auger.cloud.utils.dataframe import DataFrame
+from a2ml.api.auger.cloud.utils.exception import AugerException
+from a2ml.api.utils.context import Context
+
+
+class PipelineApi(object):
+    calls = []
+
+    def __init__(self, ctx, parent_api, pipeline_id):
+        self.pipeline_id = pipeline_id
+
+    def check_ready(self):
+        self.calls.append(('check_ready', self.pipeline_id))
+
+    def predict(self, records, features, threshold=None, check_status=True):
+        self.calls.append(('predict', len(records), check_status))
+        return {'income': [r[0] > 30 for r in records]}
+
+
+class TestPredict(object):
+
+    def setup_method(self, method):
+        PipelineApi.calls = []
+
+    @pytest.fixture
+    def auger_predict(self, project_dir, monkeypatch):
+        project_dir.join('config.yaml').write('target: income\n')
+        monkeypatch.setattr(predict, 'AugerPipelineApi', PipelineApi)
+        return AugerPredict(Context())
+
+    def test_predict_frame(self, auger_predict):
+        df = pandas.DataFrame({'age': [25, 40], 'income': [None, None]})
+        predicted = auger_predict.predict_frame(df, 'p1')
+        assert predicted['income'].tolist() == [False, True]
+        # status is checked once, not on every request
+        assert PipelineApi.calls == \
+            [('check_ready', 'p1'), ('predict', 2, False)]
+
+    def test_from_data(self):
+        df = pandas.DataFrame({'age': [25, 40], 'income': [0, 1]})
+        assert DataFrame.from_data(df, 'income').columns.tolist() == ['age']
+        assert DataFrame.from_data(df).columns.tolist() == ['age', 'income']
+        with pytest.raises(AugerException):
+            DataFrame.from_data([[25, 0]])
+
+    def test_from_arrow_table(self):
+        pyarrow = pytest.importorskip('pyarrow')
+        table = pyarrow.Table.from_pydict({'age': [25], 'income': [0]})
+        assert DataFrame.from_data(table, 'income').to_dict('list') == \
+            {'age': [25]}
+
+    def test_pipeline_ids(self):
+        assert AugerPredict._get_pipeline_ids('p1') == ['p1']
+        assert AugerPredict._get_pipeline_ids(' p1, p2,') == ['p1', 'p2']
+
+    def test_pipeline_ids_required(self):
+        with pytest.raises(AugerException):
+            AugerPredict._get_pipeline_ids(None)
+
+    def test_predicted_name(self):
+        assert AugerPredict._get_predicted_name('/data/a.csv') == \
+            '/data/a_predicted.csv'
+        assert AugerPredict._get_predicted_name('/data/a.arff') == \
+            '/data/a_predicted.csv'
+        assert AugerPredict._get_predicted_name('/data/a.parquet') == \
+            '/data/a_predicted.parquet'
+        assert AugerPredict._get_predicted_name('/data/a.arrow') == \
+            '/data/a_predicted.arrow'
+
+    def test_get_files(self, tmpdir):
+        for name in ['b.csv', 'a.parquet', 'a_predicted.csv', 'notes.txt']:
+            tmpdir.join(name).write('')
+        tmpdir.mkdir('sub')
+        path = str(tmpdir)
+        expected = [os.path.join(path, 'a.parquet'),
+            os.path.join(path, 'b.csv')]
+        assert AugerPredict._get_files(path) == expected
+        assert AugerPredict._get_files(os.path.join(path, '*.csv')) == \
+            expected[1:]
+        assert AugerPredict._get_files([expected[1], expected[0]]) == \
+            [expected[1], expected[0]]
+        with pytest.raises(AugerException):
+            AugerPredict._get_files(os.path.join(path, 'sub'))
+
+    def test_predict_files(self, auger_predict, monkeypatch):
+        frames = {'a.csv': pandas.DataFrame({'age': [25, 40]}),
+            'b.csv': pandas.DataFrame({'age': [50]})}
+        saved = {}
+        monkeypatch.setattr(predict.DataFrame, 'load',
+            staticmethod(lambda filename, target: frames[filename]))
+        monkeypatch.setattr(predict.DataFrame, 'save',
+            staticmethod(lambda filename, df: saved.update({filename: df})))
+
+        def predict_frame(df, threshold):
+            if len(df) == 1:
+                raise Exception('Model error')
+            return df
+
+        results, errors = auger_predict._run_predict_files(
+            ['a.csv', 'b.csv'], predict_frame, None)
+        assert results == {'a.csv': 'a_predicted.csv'}
+        assert list(errors) == ['b.csv']
+        assert list(saved) == ['a_predicted.csv']
+
+    def test_files_share_pipeline(self, auger_predict, monkeypatch):
+        monkeypatch.setattr(predict.DataFrame, 'load', staticmethod(
+            lambda filename, target: pandas.DataFrame({'age': [25]})))
+        monkeypatch.setattr(predict.DataFrame, 'save',
+            staticmethod(lambda filename, df: None))
+        assert auger_predict._predict_files(
+            ['a.csv', 'b.csv', 'c.csv'], 'p1', None, False) == \
+            ['a_predicted.csv', 'b_predicted.csv', 'c_predicted.csv']
+        assert PipelineApi.calls.count(('check_ready', 'p1')) == 1
+        assert PipelineApi.calls.count(('predict', 1, False)) == 3
+
+    @pytest.mark.parametrize('has_pyarrow', [True, False])
+    def test_docker_run_predict_frame(
+        self, auger_predict, monkeypatch, has_pyarrow):
+        if has_pyarrow:
+            pytest.importorskip('pyarrow')
+        monkeypatch.setattr(predict.DataFrame, 'has_pyarrow',
+            staticmethod(lambda: has_pyarrow))
+        exchange_path = os.path.join(os.getcwd(), 'exchange')
+        monkeypatch.setattr(predict.AugerLocalPredictor, 'get_exchange_path',
+            staticmethod(lambda ctx: exchange_path))
+        scripts = []
+
+        def docker_run(model_path, data_path, script, threshold):
+            # model writes predictions next to data file
+            scripts.append(script.split()[0])
+            data_file = os.path.join(data_path, script.split('/')[-1])
+            name, extension = os.path.splitext(data_file)
+            df = pandas.read_csv(data_file) if extension == '.csv' else \
+                DataFrame.load_arrow(data_file)
+            df['income'] = df['age'] > 30
+            DataFrame.save(name + '_predicted' + extension, df)
+
+        monkeypatch.setattr(auger_predict, '_docker_run', docker_run)
+        predicted = auger_predict._docker_run_predict_frame(
+            pandas.DataFrame({'age': [25, 40]}), None, '/models/m1')
+        assert predicted['income'].tolist() == [False, True]
+        assert scripts == (['./a2ml_server/predict_server.py']
+            if has_pyarrow else ['./exported_model/client.py'])
+        assert os.listdir(exchange_path) == []
@@ -0,0 +1,113 @@
+import os
+
+from a2ml.api.auger import predict_watch
+from a2ml.api.auger.predict_watch import PredictWatcher, MAX_ATTEMPTS
+
+
+class Context(object):
+
+    def log(self, msg):
+        pass
+
+
+class TestPredictWatcher(object):
+
+    def setup_method(self):
+        self.predicted = []
+        self.failures = 0
+
+    def predict_files(self, files):
+        self.predicted.extend(os.path.basename(f) for f in files)
+        if self.failures:
+            self.failures -= 1
+            return {}, dict((f, 'Timeout') for f in files)
+        return dict((f, f + '.out') for f in files), {}
+
+    def watcher(self, directory, interval=0):
+        return PredictWatcher(Context(), str(directory), interval,
+            lambda f: f.endswith('.csv'))
+
+    def write(self, directory, name, content):
+        with open(os.path.join(str(directory), name), 'w') as f:
+            f.write(content)
+
+    def test_predict_new_files_once(self, tmpdir):
+        self.write(tmpdir, 'a.csv', 'x\n1\n')
+        self.write(tmpdir, 'notes.txt', 'skip')
+        watcher = self.watcher(tmpdir)
+
+        # file has to stay unchanged between two polls
+        watcher.poll(self.predict_files)
+        assert self.predicted == []
+        watcher.poll(self.predict_files)
+        assert self.predicted == ['a.csv']
+        watcher.poll(self.predict_files)
+        assert self.predicted == ['a.csv']
+
+    def test_restart_and_change(self, tmpdir):
+        self.write(tmpdir, 'a.csv', 'x\n1\n')
+        watcher = self.watcher(tmpdir)
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+
+        # ledger survives restart
+        watcher = self.watcher(tmpdir)
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+        assert self.predicted == ['a.csv']
+
+        self.write(tmpdir, 'a.csv', 'x\n2\n')
+        os.utime(os.path.join(str(tmpdir), 'a.csv'), (1, 1))
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+        assert self.predicted == ['a.csv', 'a.csv']
+
+    def test_retry_failed(self, tmpdir):
+        self.write(tmpdir, 'a.csv', 'x\n1\n')
+        self.failures = 1
+        watcher = self.watcher(tmpdir)
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+        assert self.predicted == ['a.csv']
+        assert watcher.ledger.files['a.csv']['error'] == 'Timeout'
+
+        # failed file is predicted again, also after restart
+        watcher = self.watcher(tmpdir)
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+        assert self.predicted == ['a.csv', 'a.csv']
+        assert watcher.ledger.files['a.csv']['error'] is None
+
+    def test_failed_backoff(self, tmpdir, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(predict_watch.time, 'time', lambda: clock[0])
+        self.write(tmpdir, 'a.csv', 'x\n1\n')
+        self.failures = MAX_ATTEMPTS + 1
+        watcher = self.watcher(tmpdir, interval=10)
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+        assert self.predicted == ['a.csv']
+
+        # retried after 20, 40, 80... seconds
+        delay = 20
+        for attempt in range(2, MAX_ATTEMPTS + 1):
+            clock[0] += delay - 1
+            watcher.poll(self.predict_files)
+            assert len(self.predicted) == attempt - 1
+            clock[0] += 1
+            watcher.poll(self.predict_files)
+            assert len(self.predicted) == attempt
+            delay *= 2
+        assert watcher.ledger.files['a.csv']['attempts'] == MAX_ATTEMPTS
+
+        # no more retries until file is changed
+        clock[0] += 100000
+        watcher.poll(self.predict_files)
+        assert len(self.predicted) == MAX_ATTEMPTS
+        self.write(tmpdir, 'a.csv', 'x\n2\n')
+        os.utime(os.path.join(str(tmpdir), 'a.csv'), (1, 1))
+        watcher.poll(self.predict_files)
+        watcher.poll(self.predict_files)
+        assert len(self.predicted) == MAX_ATTEMPTS + 1
+        assert watcher.ledger.files['a.csv']['attempts'] == 1
@@ -0,0 +1,64 @@
+import time
+
+from a2ml.api.utils.stats import RaceStats
+from a2ml.api.utils.context import Context
+from a2ml.api.utils.provider_runner import ProviderRunner
+
+
+class Provider(object):
+
+    def __init__(self, delay, result):
+        self.delay = delay
+        self.result = result
+
+    def predict(self):
+        time.sleep(self.delay)
+        return self.result
+
+
+class TestProviderRunner(object):
+
+    def make_runner(self, providers):
+        runner = ProviderRunner.__new__(ProviderRunner)
+        runner.ctx = Context()
+        runner.provider_names = [name for name, p in providers]
+        runner.providers = [p for name, p in providers]
+        runner.race_stats = RaceStats()
+        return runner
+
+    def test_race_does_not_wait_for_losers(self):
+        runner = self.make_runner([
+            ('fast', Provider(0.2, 'fast')), ('slow', Provider(3, 'slow'))])
+        started = time.time()
+        assert runner.race('predict') == {'fast': 'fast'}
+        assert time.time() - started < 1
+
+    def test_race_returns_first_result_after_hedge_delay(self):
+        runner = self.make_runner([
+            ('slow', Provider(0.3, 'slow')), ('slower', Provider(3, 'x'))])
+        started = time.time()
+        assert runner.race('predict', hedge_delay=0.1) == {'slow': 'slow'}
+        assert time.time() - started < 1
+
+    def test_race_skips_failed(self):
+        runner = self.make_runner([
+            ('failed', Provider(0, None)), ('ok', Provider(0.1, 'ok'))])
+        assert runner.race('predict', hedge_delay=1) == {'ok': 'ok'}
+
+    def test_race_records_unfinished_losers(self):
+        runner = self.make_runner([
+            ('fast', Provider(0.1, 'fast')), ('slow', Provider(0.5, 'slow'))])
+        assert runner.race('predict') == {'fast': 'fast'}
+        # loser finishing later doesn't change stats
+        time.sleep(0.6)
+        report = dict((row['provider'], row)
+            for row in runner.race_stats.report())
+        assert report['fast']['unfinished'] == 0
+        assert report['slow']['unfinished'] == 1
+        assert runner.race_stats.latencies['slow'].count == 1
+        assert float(report['slow']['p50']) < 0.3
+
+    def test_race_stats_file(self, project_dir):
+        runner = self.make_runner([])
+        assert runner._get_race_stats_file() == \
+            str(project_dir.join('race_stats.json'))
@@ -0,0 +1,45 @@
+import pytest
+
+from a2ml.api.auger.session_cache import AugerSessionCache
+from a2ml.api.utils.context import Context
+
+
+class Credentials(object):
+
+    def __init__(self, creds_path, organisation='org'):
+        self.creds_path = creds_path
+        self.api_url = 'https://app.auger.ai'
+        self.organisation = organisation
+
+
+class TestSessionCache(object):
+
+    @pytest.fixture
+    def ctx(self, project_dir):
+        project_dir.join('auger.yaml').write(
+            'session_cache:\n  ttl: 60\n', mode='a')
+        return Context()
+
+    def test_update_and_invalidate(self, ctx, tmpdir):
+        cache = AugerSessionCache(ctx, Credentials(str(tmpdir)))
+        assert cache.get() is None
+        cache.update(org_id=1, project_id=2)
+        cache.update(project_status='running')
+
+        session = AugerSessionCache(ctx, Credentials(str(tmpdir))).get()
+        assert session['project_id'] == 2
+        assert session['project_status'] == 'running'
+
+        cache.invalidate()
+        assert cache.get() is None
+
+    def test_keyed_by_organization(self, ctx, tmpdir):
+        AugerSessionCache(ctx, Credentials(str(tmpdir))).update(org_id=1)
+        cache = AugerSessionCache(ctx, Credentials(str(tmpdir), 'other'))
+        assert cache.get() is None
+
+    def test_expired(self, ctx, tmpdir):
+        cache = AugerSessionCache(ctx, Credentials(str(tmpdir)))
+        cache.update(org_id=1)
+        cache.ttl = -1
+        assert cache.get() is None
@@ -0,0 +1,56 @@
+import os
+
+from a2ml.api.utils.stats import LatencyStats, RaceStats
+
+
+class TestLatencyStats(object):
+
+    def test_percentiles(self):
+        stats = LatencyStats()
+        for latency in range(1, 101):
+            stats.record(latency / 100.0)
+        assert stats.count == 100
+        assert stats.summary() == {'p50': 0.5, 'p95': 0.95, 'p99': 0.99}
+
+    def test_empty(self):
+        assert LatencyStats().percentile(50) is None
+
+
+class TestRaceStats(object):
+
+    def test_win_rate(self):
+        stats = RaceStats()
+        stats.record_latency('auger', 0.1)
+        stats.record_latency('google', 0.2)
+        stats.record_race('auger')
+        stats.record_latency('auger', 0.3)
+        stats.record_race('google')
+        stats.record_race('auger')
+        report = dict((row['provider'], row) for row in stats.report())
+        assert report['auger']['win rate'] == '0.67'
+        assert report['google']['win rate'] == '0.33'
+
+    def test_unfinished(self):
+        stats = RaceStats()
+        stats.record_latency('auger', 0.1)
+        stats.record_unfinished('google', 0.1)
+        stats.record_race('auger')
+        report = dict((row['provider'], row) for row in stats.report())
+        assert report['google']['unfinished'] == 1
+        assert report['google']['win rate'] == '0.00'
+        assert report['google']['p50'] == '0.100'
+
+    def test_persisted(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'race_stats.json')
+        stats = RaceStats(filename)
+        stats.record_latency('auger', 0.1)
+        stats.record_race('auger')
+        # next run continues with stored stats
+        stats = RaceStats(filename)
+        stats.record_latency('google', 0.2)
+        stats.record_race('google')
+        stats.record_race('auger')
+        report = dict((row['provider'], row) for row in stats.report())
+        assert report['auger']['win rate'] == '0.67'
+        assert report['auger']['p50'] == '0.100'
+        assert report['google']['win rate'] == '0.33'
@@ -0,0 +1,60 @@
+import pytest
+
+from a2ml.api.auger.cloud.utils.synthetic_data import SyntheticData
+from a2ml.api.auger.cloud.utils.exception import AugerException
+
+STAT_DATA = [
+    {'column_name': 'age', 'datatype': 'integer', 'min': 18, 'max': 90},
+    {'column_name': 'income', 'datatype': 'float', 'min': 0, 'max': 1000.0},
+    {'column_name': 'city', 'datatype': 'string',
+        'value_counts': {'Paris': 3, 'Rome': 2}},
+    {'column_name': 'code', 'datatype': 'categorical', 'unique_values': 3},
+    {'column_name': 'active', 'datatype': 'boolean'},
+    {'column_name': 'joined', 'datatype': 'date'},
+    {'column_name': 'churn', 'datatype': 'integer', 'min': 0, 'max': 1},
+    {'column_name': 'id', 'datatype': 'integer'}]
+
+
+class TestSyntheticData(object):
+
+    def test_schema(self):
+        df = SyntheticData(STAT_DATA, exclude=['churn']).generate(50)
+        assert len(df) == 50
+        assert df.columns.tolist() == \
+            ['age', 'income', 'city', 'code', 'active', 'joined', 'id']
+        assert df['age'].between(18, 90).all()
+        assert df['income'].between(0, 1000).all()
+        assert set(df['city']) <= set(['Paris', 'Rome'])
+        assert set(df['code']) <= set(['value_0', 'value_1', 'value_2'])
+        assert set(df['active']) <= set([True, False])
+        assert df['joined'].str.match(r'^\d{4}-\d{2}-\d{2}$').all()
+        assert df['id'].between(0, 1).all()
+
+    def test_dtypes(self):
+        df = SyntheticData(STAT_DATA).generate(10)
+        assert df['age'].dtype.kind == 'i'
+        assert df['income'].dtype.kind == 'f'
+        assert df['active'].dtype.kind == 'b'
+
+    def test_seed(self):
+        first = SyntheticData(STAT_DATA, seed=1).generate(20)
+        assert first.equals(SyntheticData(STAT_DATA, seed=1).generate(20))
+        assert not first.equals(SyntheticData(STAT_DATA, seed=2).generate(20))
+
+    def test_from_data_set(self):
+        synthetic = SyntheticData.from_data_set(
+            {'statistics': {'stat_data': STAT_DATA}}, 'churn', 'id, city')
+        assert synthetic.generate(0).columns.tolist() == \
+            ['age', 'income', 'code', 'active', 'joined']
+
+    def test_zero_max(self):
+        df = SyntheticData([
+            {'column_name': 'loss', 'datatype': 'float', 'min': -5, 'max': 0},
+            {'column_name': 'debt', 'datatype': 'integer', 'min': -3, 'max': 0}
+            ]).generate(50)
+        assert df['loss'].between(-5, 0).all()
+        assert df['debt'].between(-3, 0).all()
+
+    def test_data_set_without_statistics(self):
+        with pytest.raises(AugerException):
+            SyntheticData.from_data_set({'name': 'a.csv', 'statistics': None})
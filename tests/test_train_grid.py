@@ -0,0 +1,72 @@
+import time
+import pandas
+import pytest
+import threading
+
+from a2ml.api.auger.train_grid import AugerTrainGrid
+from a2ml.api.auger.cloud.utils.exception import AugerException
+from a2ml.api.utils.context import Context
+
+SPEC = """
+defaults:
+  max_n_trials: 10
+  target: y
+experiments:
+  - dataset: a
+  - dataset: b
+    max_n_trials: 20
+  - dataset: c
+  - dataset: broken
+"""
+
+
+class TestTrainGrid(object):
+
+    @pytest.fixture
+    def grid(self, project_dir, monkeypatch):
+        project_dir.join('auger.yaml').write(
+            'grid:\n  max_concurrent: 2\n', mode='a')
+        project_dir.join('grid.yaml').write(SPEC)
+        monkeypatch.setattr(AugerTrainGrid, 'start_project', lambda self: None)
+        return AugerTrainGrid(Context())
+
+    def test_load_spec(self, grid):
+        specs = AugerTrainGrid._load_spec('grid.yaml')
+        assert [s['dataset'] for s in specs] == ['a', 'b', 'c', 'broken']
+        assert specs[0] == {'dataset': 'a', 'target': 'y', 'max_n_trials': 10}
+        assert specs[1]['max_n_trials'] == 20
+
+    def test_load_spec_errors(self, grid):
+        with pytest.raises(AugerException):
+            AugerTrainGrid._load_spec('missing.yaml')
+        with open('empty.yaml', 'w') as f:
+            f.write('defaults:\n  target: y\n')
+        with pytest.raises(AugerException):
+            AugerTrainGrid._load_spec('empty.yaml')
+        with open('no_dataset.yaml', 'w') as f:
+            f.write('experiments:\n  - target: y\n')
+        with pytest.raises(AugerException):
+            AugerTrainGrid._load_spec('no_dataset.yaml')
+
+    def test_train_concurrently(self, grid, monkeypatch):
+        lock = threading.Lock()
+        running = {'now': 0, 'max': 0}
+
+        def train(self, spec):
+            with lock:
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+            time.sleep(0.1)
+            with lock:
+                running['now'] -= 1
+            if spec['dataset'] == 'broken':
+                raise Exception('DataSet is broken')
+            return pandas.DataFrame({'dataset': [spec['dataset']] * 2,
+                'accuracy': [0.9, 0.8]})
+
+        monkeypatch.setattr(AugerTrainGrid, '_train', train)
+        assert grid.train_grid('grid.yaml') == 'grid_leaderboard.csv'
+        assert running['max'] == 2
+        result = pandas.read_csv('grid_leaderboard.csv')
+        assert sorted(set(result['dataset'].tolist())) == ['a', 'b', 'c']
+        assert len(result) == 6
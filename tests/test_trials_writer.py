@@ -0,0 +1,77 @@
+import os
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from a2ml.api.auger.export import AugerExport
+from a2ml.api.auger.cloud.utils.trials_writer import TrialsWriter
+
+pyarrow = pytest.importorskip('pyarrow')
+import pyarrow.parquet
+
+
+def make_trial(trial_id):
+    algorithm = 'Algo%s' % (trial_id % 2)
+    params = {'max_depth': trial_id} if trial_id % 2 else \
+        {'penalty': 'l2', 'solver': {'name': 'lbfgs'}}
+    return {'id': trial_id, 'score_name': 'accuracy',
+        'score_value': trial_id / 100.0,
+        'hyperparameter': {'algorithm_name': 'sklearn.%s' % algorithm,
+            'algorithm_params': params}}
+
+
+class TrialApi(object):
+
+    def __init__(self, total, max_page_size=None):
+        self.total = total
+        self.max_page_size = max_page_size
+
+    def list_page(self, offset, limit):
+        limit = min(limit, self.max_page_size or limit)
+        return [make_trial(trial_id) for trial_id in
+            range(offset, min(offset + limit, self.total))], self.total
+
+
+class TestTrialsWriter(object):
+
+    def test_flatten(self):
+        assert TrialsWriter.flatten(
+            {'a': 1, 'b': {'c': 'x', 'd': {'e': None}}, 'f': {}}) == \
+            {'a': 1, 'b.c': 'x', 'b.d.e': None, 'f': {}}
+
+    def test_row_groups(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'trials.parquet')
+        writer = TrialsWriter(filename, row_group_size=4)
+        writer.write('s1', [make_trial(i) for i in range(6)])
+        writer.write('s2', [make_trial(i) for i in range(6, 10)])
+        writer.close()
+
+        parquet_file = pyarrow.parquet.ParquetFile(filename)
+        assert parquet_file.metadata.num_row_groups == 3
+        table = parquet_file.read().to_pylist()
+        assert [row['trial_id'] for row in table] == \
+            [str(i) for i in range(10)]
+        assert table[5]['experiment_session_id'] == 's1'
+        assert table[6]['experiment_session_id'] == 's2'
+        assert table[1]['algorithm'] == 'sklearn.Algo1'
+        assert table[1]['score_value'] == 0.01
+        assert dict(table[1]['hyperparameters']) == {'max_depth': '1'}
+        params = dict(table[2]['hyperparameters'])
+        assert json.loads(params['solver.name']) == 'lbfgs'
+
+
+class TestExportPages(object):
+
+    def read(self, trial_api, page_size):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return [trial['id'] for trials in AugerExport._read_pages(
+                executor, trial_api, page_size, 2) for trial in trials]
+
+    def test_pages_in_order(self):
+        assert self.read(TrialApi(25), 4) == list(range(25))
+
+    def test_smaller_pages(self):
+        assert self.read(TrialApi(25, max_page_size=3), 10) == list(range(25))
+
+    def test_empty(self):
+        assert self.read(TrialApi(0), 4) == []
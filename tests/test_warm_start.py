@@ -0,0 +1,83 @@
+import os
+import pytest
+from auger.hub_api_client import HubApiClient
+
+from a2ml.api.auger.cloud.org import AugerOrganizationApi
+from a2ml.api.auger.cloud.project import AugerProjectApi
+from a2ml.api.auger.cloud.experiment import AugerExperimentApi
+from a2ml.api.auger.cloud.experiment_session import AugerExperimentSessionApi
+from a2ml.api.utils.context import Context
+
+
+class RestApi(object):
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def call(self, method, params):
+        self.calls.append((method, params))
+        if method == 'create_warm_start_request':
+            if self.fail:
+                raise self.fail
+            return {'id': 'w1'}
+        if method == 'get_warm_start_request':
+            return {'id': 'w1', 'status': 'completed'}
+
+    def wait_for_object_status(self, get_status, progress, **kwargs):
+        return get_status()
+
+
+class TestWarmStart(object):
+
+    def setup_method(self, method):
+        self.cwd = os.getcwd()
+
+    def teardown_method(self, method):
+        os.chdir(self.cwd)
+
+    @pytest.fixture
+    def experiment_api(self, tmpdir, monkeypatch):
+        os.chdir(str(tmpdir))
+        with open('auger.yaml', 'w') as f:
+            f.write('experiment:\n  warm_start:\n    enabled: true\n')
+        self.run = []
+
+        def create(session_api, overrides=None):
+            session_api.object_id = 's1'
+            return {'id': 's1'}
+
+        monkeypatch.setattr(AugerExperimentSessionApi, 'create', create)
+        monkeypatch.setattr(AugerExperimentSessionApi, 'run',
+            lambda session_api: self.run.append(session_api.object_id))
+        ctx = Context()
+        ctx.rest_api = RestApi()
+        return AugerExperimentApi(ctx,
+            AugerProjectApi(ctx, AugerOrganizationApi(ctx, 'org', 'o1'),
+                'project', 'p1'), 'experiment', 'e1')
+
+    def test_warm_start_request_before_run(self, experiment_api):
+        assert experiment_api.run() == 's1'
+        assert experiment_api.rest_api.calls[0] == \
+            ('create_warm_start_request', {'experiment_session_id': 's1'})
+        assert self.run == ['s1']
+
+    def test_run_without_warm_start(self, experiment_api):
+        experiment_api.rest_api.fail = \
+            HubApiClient.InvalidParamsError('Not found')
+        assert experiment_api.run() == 's1'
+        assert self.run == ['s1']
+
+    def test_unexpected_error(self, experiment_api):
+        experiment_api.rest_api.fail = KeyError('id')
+        with pytest.raises(KeyError):
+            experiment_api.run()
+        assert self.run == []
+
+    def test_disabled(self, experiment_api):
+        with open('auger.yaml', 'w') as f:
+            f.write('experiment:\n  warm_start:\n    enabled: false\n')
+        experiment_api.ctx = Context()
+        experiment_api.ctx.rest_api = experiment_api.rest_api
+        experiment_api.run()
+        assert experiment_api.rest_api.calls == []